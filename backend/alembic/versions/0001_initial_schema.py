@@ -0,0 +1,102 @@
+"""initial schema
+
+Схема на момент перехода на миграции (как ее создавал create_all).
+Существующую БД без alembic_version переводят на миграции так:
+alembic stamp 0001 && alembic upgrade head
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 03:37:40.827521
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'jockeys',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=200), nullable=False),
+        sa.Column('address', sa.String(length=500), nullable=False),
+        sa.Column('age', sa.Integer(), nullable=False),
+        sa.Column('rating', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_jockeys_id', 'jockeys', ['id'])
+
+    op.create_table(
+        'owners',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=200), nullable=False),
+        sa.Column('address', sa.String(length=500), nullable=False),
+        sa.Column('phone', sa.String(length=20), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_owners_id', 'owners', ['id'])
+
+    op.create_table(
+        'races',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('time', sa.Time(), nullable=False),
+        sa.Column('hippodrome', sa.String(length=200), nullable=False),
+        sa.Column('name', sa.String(length=200), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_races_id', 'races', ['id'])
+    op.create_index('ix_races_date', 'races', ['date'])
+
+    op.create_table(
+        'horses',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('nickname', sa.String(length=100), nullable=False),
+        sa.Column(
+            'gender',
+            sa.Enum('STALLION', 'MARE', 'GELDING', name='genderenum'),
+            nullable=False,
+        ),
+        sa.Column('age', sa.Integer(), nullable=False),
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['owner_id'], ['owners.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_horses_id', 'horses', ['id'])
+
+    op.create_table(
+        'race_participants',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('race_id', sa.Integer(), nullable=False),
+        sa.Column('jockey_id', sa.Integer(), nullable=False),
+        sa.Column('horse_id', sa.Integer(), nullable=False),
+        sa.Column('place', sa.Integer(), nullable=False),
+        sa.Column('time_result', sa.Time(), nullable=True),
+        sa.ForeignKeyConstraint(['horse_id'], ['horses.id']),
+        sa.ForeignKeyConstraint(['jockey_id'], ['jockeys.id']),
+        sa.ForeignKeyConstraint(['race_id'], ['races.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_race_participants_id', 'race_participants', ['id'])
+    op.create_index('idx_race_place', 'race_participants', ['race_id', 'place'])
+    op.create_index('idx_jockey_races', 'race_participants', ['jockey_id'])
+    op.create_index('idx_horse_races', 'race_participants', ['horse_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('race_participants')
+    op.drop_table('horses')
+    op.drop_table('races')
+    op.drop_table('owners')
+    op.drop_table('jockeys')
+    sa.Enum(name='genderenum').drop(op.get_bind(), checkfirst=True)
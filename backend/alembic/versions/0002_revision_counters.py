@@ -0,0 +1,36 @@
+"""revision counters for ETag
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 04:05:12.417310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('races', 'jockeys', 'horses')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column('revision', sa.Integer(), nullable=False, server_default='1'),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('revision')
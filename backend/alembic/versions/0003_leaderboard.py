@@ -0,0 +1,58 @@
+"""leaderboard summary table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 04:31:48.902115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'leaderboard',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('entity_type', sa.String(length=10), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('starts', sa.Integer(), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False),
+        sa.Column('podiums', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_leaderboard_entity', 'leaderboard', ['entity_type', 'entity_id'], unique=True
+    )
+    op.create_index(
+        'idx_leaderboard_rank',
+        'leaderboard',
+        ['entity_type', sa.text('wins DESC'), sa.text('podiums DESC'), 'entity_id'],
+    )
+
+    # Заполнение по уже сохраненным результатам
+    for entity_type, column in (('jockey', 'jockey_id'), ('horse', 'horse_id')):
+        op.execute(
+            f"""
+            INSERT INTO leaderboard (entity_type, entity_id, starts, wins, podiums)
+            SELECT '{entity_type}', {column}, COUNT(id),
+                   SUM(CASE WHEN place = 1 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN place <= 3 THEN 1 ELSE 0 END)
+            FROM race_participants
+            GROUP BY {column}
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('leaderboard')
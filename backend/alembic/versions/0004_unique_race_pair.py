@@ -0,0 +1,43 @@
+"""unique jockey-horse pair per race
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 09:12:05.417331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Дубликаты могли появиться при параллельной записи до ограничения;
+    # оставляем самую раннюю запись пары
+    op.execute(
+        """
+        DELETE FROM race_participants
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM race_participants
+            GROUP BY race_id, jockey_id, horse_id
+        )
+        """
+    )
+    op.create_index(
+        'uq_race_pair',
+        'race_participants',
+        ['race_id', 'jockey_id', 'horse_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_race_pair', table_name='race_participants')
@@ -0,0 +1,79 @@
+"""search indexes for horses, jockeys and owners
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 13:40:27.118904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (таблица, колонка поиска)
+SOURCES = (
+    ('horses', 'nickname'),
+    ('jockeys', 'name'),
+    ('owners', 'name'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table, column in SOURCES:
+            op.execute(
+                f'CREATE INDEX search_trgm_{table}_{column} ON {table} '
+                f'USING gin ({column} gin_trgm_ops)'
+            )
+    elif dialect == 'sqlite':
+        for table, column in SOURCES:
+            fts = f'search_{table}'
+            delete = (
+                f"INSERT INTO {fts}({fts}, rowid, {column}) "
+                f"VALUES ('delete', old.id, old.{column});"
+            )
+            insert = (
+                f'INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column});'
+            )
+            op.execute(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5("
+                f"{column}, content='{table}', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+            op.execute(
+                f'CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} '
+                f'BEGIN {insert} END'
+            )
+            op.execute(
+                f'CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} '
+                f'BEGIN {delete} END'
+            )
+            op.execute(
+                f'CREATE TRIGGER {fts}_au AFTER UPDATE OF {column} ON {table} '
+                f'BEGIN {delete} {insert} END'
+            )
+            # Проиндексировать уже существующие записи
+            op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for table, column in SOURCES:
+            op.execute(f'DROP INDEX IF EXISTS search_trgm_{table}_{column}')
+    elif dialect == 'sqlite':
+        for table, _ in SOURCES:
+            # Триггеры висят на исходных таблицах и удаляются отдельно
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f'DROP TRIGGER IF EXISTS search_{table}_{suffix}')
+            op.execute(f'DROP TABLE IF EXISTS search_{table}')
@@ -0,0 +1,32 @@
+"""race calendar index by hippodrome and date
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 15:02:44.530217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_race_hippodrome_date',
+        'races',
+        ['hippodrome', 'date'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_race_hippodrome_date', table_name='races')
@@ -0,0 +1,5 @@
+"""
+Бенчмарки RaceTracker API
+
+Запуск из каталога backend, например: python -m benchmarks.bench_json
+"""
@@ -0,0 +1,106 @@
+"""
+Микробенчмарк сериализации ответов списков
+
+Сравнивает процессорное время на запрос GET /api/v1/races/ при
+limit=100 и limit=1000 в двух режимах:
+
+- validated: DTO повторно валидируются по response_model роутера;
+- trusted: DTO сериализуются напрямую (API_TRUSTED_RESPONSES=true).
+
+Дополнительно замеряется только шаг сериализации (без БД и HTTP), чтобы
+выигрыш не терялся на фоне времени запроса к базе.
+
+Запуск: python -m benchmarks.bench_json [--repeat N]
+"""
+
+import argparse
+import asyncio
+import datetime
+from typing import List
+
+import pydantic_core
+from pydantic import TypeAdapter
+
+from benchmarks.data import DatasetSize, generate_dataset
+from benchmarks.harness import (
+    bench_client,
+    bench_database,
+    format_table,
+    measure,
+    summarize,
+)
+from src.business.dto.race_dto import RaceDTO
+from src.config import settings
+from src.framework.schemas import RaceResponse
+
+LIMITS = (100, 1000)
+
+
+def make_races(count: int) -> List[RaceDTO]:
+    return [
+        RaceDTO(
+            id=i,
+            date=datetime.date(2030, 1, 1),
+            time=datetime.time(12),
+            hippodrome="Ипподром",
+            name=f"Состязание {i}",
+        )
+        for i in range(count)
+    ]
+
+
+async def run_serialization(repeat: int) -> str:
+    adapter = TypeAdapter(List[RaceResponse])
+    rows = []
+    for limit in LIMITS:
+        races = make_races(limit)
+
+        async def validated():
+            items = adapter.validate_python(races, from_attributes=True)
+            adapter.dump_json(items)
+
+        async def trusted():
+            pydantic_core.to_json(races)
+
+        for mode, call in (("validated", validated), ("trusted", trusted)):
+            samples = await measure(call, repeat)
+            rows.append((f"serialize {limit} {mode}", summarize(samples)))
+    return format_table("Только сериализация", rows)
+
+
+async def run(repeat: int) -> str:
+    rows = []
+    async with bench_database() as session_maker:
+        size = DatasetSize(owners=0, horses=0, jockeys=0, races=max(LIMITS))
+        await generate_dataset(session_maker, size)
+        async with bench_client(session_maker) as client:
+            for limit in LIMITS:
+                url = f"/api/v1/races/?limit={limit}"
+                for trusted in (False, True):
+                    settings.api_trusted_responses = trusted
+
+                    async def call():
+                        response = await client.get(url)
+                        response.raise_for_status()
+
+                    samples = await measure(call, repeat)
+                    mode = "trusted" if trusted else "validated"
+                    rows.append((f"races limit={limit} {mode}", summarize(samples)))
+    report = format_table("GET /api/v1/races/", rows)
+    return report + "\n\n" + await run_serialization(repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    original = settings.api_trusted_responses
+    try:
+        print(asyncio.run(run(args.repeat)))
+    finally:
+        settings.api_trusted_responses = original
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import random
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.data.models import GenderEnum
+from src.data.uow import UnitOfWork
+
+GENDERS = list(GenderEnum)
+
+
+@dataclass
+class DatasetSize:
+    """Объем синтетических данных"""
+
+    owners: int = 200
+    horses: int = 1000
+    jockeys: int = 300
+    races: int = 2000
+    participants_per_race: int = 8
+
+
+# Готовые профили для --size
+SIZES = {
+    "small": DatasetSize(
+        owners=20, horses=100, jockeys=30, races=200, participants_per_race=6
+    ),
+    "medium": DatasetSize(),
+    "large": DatasetSize(
+        owners=2000, horses=10000, jockeys=3000, races=20000, participants_per_race=10
+    ),
+}
+
+
+@dataclass
+class Dataset:
+    """ID созданных записей для выбора параметров в замерах"""
+
+    owner_ids: List[int] = field(default_factory=list)
+    horse_ids: List[int] = field(default_factory=list)
+    jockey_ids: List[int] = field(default_factory=list)
+    race_ids: List[int] = field(default_factory=list)
+
+
+async def generate_dataset(
+    session_maker: async_sessionmaker[AsyncSession],
+    size: DatasetSize,
+    seed: int = 42,
+) -> Dataset:
+    """
+    Заполнить БД синтетическими данными
+
+    Вставка идет пакетно через create_many репозиториев, рейтинг
+    пересчитывается в конце. Генератор детерминирован по seed.
+    """
+    rng = random.Random(seed)
+    dataset = Dataset()
+    start = date(2030, 1, 1)
+
+    async with session_maker() as session:
+        uow = UnitOfWork(session)
+
+        owners = await uow.owners.create_many(
+            [
+                {
+                    "name": f"Владелец {i}",
+                    "address": f"Город {i % 50}",
+                    "phone": f"+7-900-{i:07d}",
+                }
+                for i in range(size.owners)
+            ]
+        )
+        dataset.owner_ids = sorted(row.id for row in owners)
+
+        if dataset.owner_ids:
+            horses = await uow.horses.create_many(
+                [
+                    {
+                        "nickname": f"Лошадь {i}",
+                        "gender": rng.choice(GENDERS),
+                        "age": rng.randint(2, 15),
+                        "owner_id": rng.choice(dataset.owner_ids),
+                    }
+                    for i in range(size.horses)
+                ]
+            )
+            dataset.horse_ids = sorted(row.id for row in horses)
+
+        jockeys = await uow.jockeys.create_many(
+            [
+                {
+                    "name": f"Жокей {i}",
+                    "address": f"Город {i % 50}",
+                    "age": rng.randint(16, 50),
+                    "rating": rng.randint(0, 10),
+                }
+                for i in range(size.jockeys)
+            ]
+        )
+        dataset.jockey_ids = sorted(row.id for row in jockeys)
+
+        races = await uow.races.create_many(
+            [
+                {
+                    "date": start + timedelta(days=i % 730),
+                    "time": time(10 + i % 9),
+                    "hippodrome": f"Ипподром {i % 12}",
+                    "name": f"Состязание {i}",
+                }
+                for i in range(size.races)
+            ]
+        )
+        dataset.race_ids = sorted(row.id for row in races)
+
+        runners = min(
+            size.participants_per_race,
+            len(dataset.jockey_ids),
+            len(dataset.horse_ids),
+        )
+        participants = []
+        for race_id in dataset.race_ids:
+            jockeys_in_race = rng.sample(dataset.jockey_ids, runners)
+            horses_in_race = rng.sample(dataset.horse_ids, runners)
+            places = list(range(1, runners + 1))
+            rng.shuffle(places)
+            participants.extend(
+                {
+                    "race_id": race_id,
+                    "jockey_id": jockey_id,
+                    "horse_id": horse_id,
+                    "place": place,
+                    "time_result": time(0, 1 + place // 60, place % 60),
+                }
+                for jockey_id, horse_id, place in zip(
+                    jockeys_in_race, horses_in_race, places
+                )
+            )
+        await uow.participants.create_many(participants)
+        await uow.leaderboard.rebuild()
+        await uow.commit()
+
+    return dataset
@@ -0,0 +1,141 @@
+import statistics
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Sequence
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.data.models import Base
+from src.framework.dependencies import get_db, get_replica_pool
+from src.main import app
+
+SQLITE_MEMORY_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@dataclass
+class Sample:
+    """Замер одного вызова: процессорное и настенное время, секунды"""
+
+    cpu: float
+    wall: float
+
+
+@asynccontextmanager
+async def bench_database(
+    url: str = SQLITE_MEMORY_URL,
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """
+    Чистая БД со схемой из моделей; по умолчанию SQLite в памяти
+
+    Таблицы пересоздаются: для Postgres используйте отдельную базу.
+    """
+    engine: AsyncEngine = create_async_engine(url, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+@asynccontextmanager
+async def bench_client(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[AsyncClient]:
+    """HTTP-клиент к приложению в процессе (без сети), на указанной БД"""
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    # Реплики из окружения не используются: все запросы идут в эту БД
+    app.dependency_overrides[get_replica_pool] = lambda: None
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as ac:
+            yield ac
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_replica_pool, None)
+
+
+async def measure(
+    call: Callable[..., Awaitable[object]],
+    repeat: int,
+    warmup: int = 5,
+    setup: Optional[Callable[[], Awaitable[Any]]] = None,
+) -> List[Sample]:
+    """
+    Выполнить call repeat раз (после прогрева) и замерить каждый вызов
+
+    setup выполняется перед каждым вызовом вне замера, его результат
+    передается в call аргументом.
+    """
+
+    async def prepare() -> tuple:
+        return () if setup is None else (await setup(),)
+
+    for _ in range(warmup):
+        await call(*await prepare())
+
+    samples = []
+    for _ in range(repeat):
+        args = await prepare()
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        await call(*args)
+        samples.append(
+            Sample(
+                cpu=time.process_time() - cpu_start,
+                wall=time.perf_counter() - wall_start,
+            )
+        )
+    return samples
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Перцентиль q (0..100) с линейной интерполяцией"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples: Sequence[Sample]) -> dict:
+    """Среднее CPU и перцентили в миллисекундах, пропускная способность"""
+    cpu = [s.cpu * 1000 for s in samples]
+    wall = [s.wall * 1000 for s in samples]
+    total = sum(s.wall for s in samples)
+    return {
+        "n": len(samples),
+        "ops_per_sec": len(samples) / total if total else 0.0,
+        "cpu_mean_ms": statistics.fmean(cpu) if cpu else 0.0,
+        "wall_p50_ms": percentile(wall, 50),
+        "wall_p95_ms": percentile(wall, 95),
+        "wall_p99_ms": percentile(wall, 99),
+    }
+
+
+def format_table(title: str, rows: Sequence[tuple]) -> str:
+    """Текстовая таблица результатов: (метка, summarize(...))"""
+    header = ("n", "cpu ms", "p50 ms", "p95 ms", "p99 ms", "ops/s")
+    lines = [title, f"{'case':<40}" + "".join(f"{h:>10}" for h in header)]
+    for label, stats in rows:
+        lines.append(
+            f"{label:<40}{stats['n']:>10}{stats['cpu_mean_ms']:>10.3f}"
+            f"{stats['wall_p50_ms']:>10.3f}{stats['wall_p95_ms']:>10.3f}"
+            f"{stats['wall_p99_ms']:>10.3f}{stats['ops_per_sec']:>10.1f}"
+        )
+    return "\n".join(lines)
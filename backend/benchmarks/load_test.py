@@ -0,0 +1,442 @@
+"""
+Нагрузочный тест: смесь запросов дня скачек
+
+Воркеры выполняют действия по весам смеси:
+
+- poll: GET /races/{id} — табло состязания (основная нагрузка);
+- results: всплеск POST /participants/ — новое состязание и
+  одновременная запись результатов всех участников;
+- browse: списки /races/, /jockeys/, /horses/, /leaderboard/.
+
+Отчет: запросов в секунду, доля ошибок, гистограммы задержек по
+действиям и загрузка пула соединений БД. Цель — приложение в процессе
+(SQLite во временном файле) или запущенный uvicorn (--base-url);
+для внешнего сервера пул читается из /health/db-pool.
+
+Запуск:
+    python -m benchmarks.load_test --duration 20 --concurrency 50
+    python -m benchmarks.load_test --base-url http://localhost:8000 \
+        --mix poll=80,results=5,browse=15
+"""
+
+import argparse
+import asyncio
+import bisect
+import datetime
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from httpx import AsyncClient
+
+from benchmarks.harness import bench_client, bench_database, percentile
+from src.data.database import get_pool_status
+
+# Границы корзин гистограммы, мс
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+DEFAULT_MIX = "poll=70,results=5,browse=25"
+
+
+@dataclass
+class ActionStats:
+    """Счетчики одного действия"""
+
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def record(self, elapsed_ms: float, error: Optional[str]) -> None:
+        self.latencies_ms.append(elapsed_ms)
+        if error:
+            self.errors[error] += 1
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def histogram(self) -> List[int]:
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for value in self.latencies_ms:
+            counts[bisect.bisect_left(BUCKETS_MS, value)] += 1
+        return counts
+
+
+@dataclass
+class Fixtures:
+    """ID существующих записей, по которым ходит нагрузка"""
+
+    race_ids: List[int]
+    jockey_ids: List[int]
+    horse_ids: List[int]
+
+
+class LoadTest:
+    """Генератор нагрузки поверх httpx.AsyncClient"""
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        fixtures: Fixtures,
+        mix: Dict[str, int],
+        runners: int = 8,
+        seed: int = 42,
+    ):
+        self.client = client
+        self.fixtures = fixtures
+        self.mix = mix
+        self.runners = runners
+        self.rng = random.Random(seed)
+        self.stats: Dict[str, ActionStats] = defaultdict(ActionStats)
+        self.actions: Dict[str, Callable[[], Awaitable[None]]] = {
+            "poll": self.poll,
+            "results": self.results,
+            "browse": self.browse,
+        }
+
+    async def request(self, label: str, method: str, url: str, **kwargs):
+        """Выполнить запрос и учесть задержку и ошибку под меткой label"""
+        start = time.perf_counter()
+        error = None
+        response = None
+        try:
+            response = await self.client.request(method, url, **kwargs)
+            if response.status_code >= 400:
+                error = str(response.status_code)
+        except Exception as e:
+            error = type(e).__name__
+        self.stats[label].record((time.perf_counter() - start) * 1000, error)
+        return response
+
+    async def poll(self) -> None:
+        race_id = self.rng.choice(self.fixtures.race_ids)
+        await self.request("GET /races/{id}", "GET", f"/api/v1/races/{race_id}")
+
+    async def browse(self) -> None:
+        url = self.rng.choice(
+            [
+                "/api/v1/races/?limit=50",
+                "/api/v1/races/?cursor=&limit=50",
+                "/api/v1/jockeys/?limit=50",
+                "/api/v1/horses/?limit=50",
+                "/api/v1/leaderboard/?kind=jockey&limit=20",
+            ]
+        )
+        await self.request("browse lists", "GET", url)
+
+    async def results(self) -> None:
+        response = await self.request(
+            "POST /races/",
+            "POST",
+            "/api/v1/races/",
+            json={
+                "date": "2030-06-01",
+                "time": "12:00:00",
+                "hippodrome": "Нагрузочный ипподром",
+            },
+        )
+        if response is None or response.status_code != 201:
+            return
+
+        race_id = response.json()["id"]
+        jockeys = self.rng.sample(self.fixtures.jockey_ids, self.runners)
+        horses = self.rng.sample(self.fixtures.horse_ids, self.runners)
+        await asyncio.gather(
+            *(
+                self.request(
+                    "POST /participants/",
+                    "POST",
+                    "/api/v1/participants/",
+                    json={
+                        "race_id": race_id,
+                        "jockey_id": jockey_id,
+                        "horse_id": horse_id,
+                        "place": place,
+                    },
+                )
+                for place, (jockey_id, horse_id) in enumerate(
+                    zip(jockeys, horses), start=1
+                )
+            )
+        )
+
+    async def worker(self, deadline: float) -> None:
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        while time.perf_counter() < deadline:
+            action = self.rng.choices(names, weights)[0]
+            await self.actions[action]()
+
+    async def run(self, concurrency: int, duration: float) -> float:
+        """Запустить воркеров на duration секунд; вернуть фактическое время"""
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(self.worker(deadline) for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+
+class PoolSampler:
+    """Периодический снимок пула соединений (в процессе или /health/db-pool)"""
+
+    def __init__(
+        self,
+        read: Callable[[], Awaitable[Dict]],
+        interval: float = 0.25,
+    ):
+        self.read = read
+        self.interval = interval
+        self.samples: List[Dict] = []
+
+    async def run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                self.samples.append(await self.read())
+            except Exception:
+                pass
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def summary(self) -> str:
+        counted = [s for s in self.samples if "checked_out" in s]
+        if not counted:
+            kind = self.samples[0]["pool_class"] if self.samples else "нет данных"
+            return f"Пул БД: {kind} (без счетчиков)"
+
+        checked_out = [s["checked_out"] for s in counted]
+        saturated = sum(
+            1 for s in counted if s["checked_in"] == 0 and s["overflow"] > 0
+        )
+        return (
+            f"Пул БД: {counted[0]['pool_class']}, size={counted[0]['size']}, "
+            f"checked_out сред.={sum(checked_out) / len(checked_out):.1f} "
+            f"макс.={max(checked_out)}, overflow макс.="
+            f"{max(s['overflow'] for s in counted)}, "
+            f"насыщен в {saturated / len(counted):.0%} замеров"
+        )
+
+
+async def seed_via_api(client: AsyncClient, races: int, runners: int) -> Fixtures:
+    """
+    Подготовить данные через API, если их недостаточно
+
+    Используются пакетные эндпоинты, поэтому работает одинаково для
+    приложения в процессе и для внешнего сервера.
+    """
+
+    async def ids(url: str) -> List[int]:
+        response = await client.get(url, params={"limit": 1000})
+        response.raise_for_status()
+        return [item["id"] for item in response.json()]
+
+    fixtures = Fixtures(
+        race_ids=await ids("/api/v1/races/"),
+        jockey_ids=await ids("/api/v1/jockeys/"),
+        horse_ids=await ids("/api/v1/horses/"),
+    )
+    pool_size = runners * 4
+
+    if len(fixtures.jockey_ids) < runners:
+        response = await client.post(
+            "/api/v1/jockeys:bulk",
+            json={
+                "items": [
+                    {"name": f"Жокей {i}", "address": "Город", "age": 25, "rating": 5}
+                    for i in range(pool_size)
+                ]
+            },
+        )
+        response.raise_for_status()
+        fixtures.jockey_ids += [j["id"] for j in response.json()]
+
+    if len(fixtures.horse_ids) < runners:
+        owners = await client.post(
+            "/api/v1/owners:bulk",
+            json={
+                "items": [
+                    {"name": f"Владелец {i}", "address": "Город", "phone": "+7"}
+                    for i in range(pool_size // 2)
+                ]
+            },
+        )
+        owners.raise_for_status()
+        owner_ids = [o["id"] for o in owners.json()]
+        response = await client.post(
+            "/api/v1/horses:bulk",
+            json={
+                "items": [
+                    {
+                        "nickname": f"Лошадь {i}",
+                        "gender": "мерин",
+                        "age": 5,
+                        "owner_id": owner_ids[i % len(owner_ids)],
+                    }
+                    for i in range(pool_size)
+                ]
+            },
+        )
+        response.raise_for_status()
+        fixtures.horse_ids += [h["id"] for h in response.json()]
+
+    rng = random.Random(0)
+    start = datetime.date(2030, 1, 1)
+    for i in range(len(fixtures.race_ids), races):
+        response = await client.post(
+            "/api/v1/races/",
+            json={
+                "date": (start + datetime.timedelta(days=i)).isoformat(),
+                "time": "12:00:00",
+                "hippodrome": f"Ипподром {i % 5}",
+            },
+        )
+        response.raise_for_status()
+        race_id = response.json()["id"]
+        pairs = zip(
+            rng.sample(fixtures.jockey_ids, runners),
+            rng.sample(fixtures.horse_ids, runners),
+        )
+        results = await client.post(
+            f"/api/v1/races/{race_id}/results:bulk",
+            json={
+                "results": [
+                    {"jockey_id": j, "horse_id": h, "place": place}
+                    for place, (j, h) in enumerate(pairs, start=1)
+                ]
+            },
+        )
+        results.raise_for_status()
+        fixtures.race_ids.append(race_id)
+
+    return fixtures
+
+
+@asynccontextmanager
+async def open_target(base_url: Optional[str]) -> AsyncIterator[tuple]:
+    """Клиент и функция чтения пула для выбранной цели"""
+    if base_url:
+        async with AsyncClient(base_url=base_url, timeout=30.0) as client:
+
+            async def read_remote_pool() -> Dict:
+                response = await client.get("/health/db-pool")
+                return response.json()
+
+            yield client, read_remote_pool
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = "sqlite+aiosqlite:///" + os.path.join(tmp, "load_test.db")
+        async with bench_database(url) as session_maker:
+            engine = session_maker.kw["bind"]
+
+            async def read_local_pool() -> Dict:
+                return get_pool_status(engine)
+
+            async with bench_client(session_maker) as client:
+                yield client, read_local_pool
+
+
+def parse_mix(raw: str) -> Dict[str, int]:
+    """Разобрать смесь вида poll=70,results=5,browse=25"""
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = int(weight)
+    unknown = set(mix) - {"poll", "results", "browse"}
+    if unknown or not any(mix.values()):
+        raise ValueError(f"Некорректная смесь: {raw}")
+    return mix
+
+
+def format_report(test: LoadTest, elapsed: float, pool: PoolSampler) -> str:
+    total = sum(len(s.latencies_ms) for s in test.stats.values())
+    errors = sum(s.error_count for s in test.stats.values())
+    lines = [
+        f"Запросов: {total} за {elapsed:.1f} с, {total / elapsed:.1f} req/s, "
+        f"ошибок: {errors} ({errors / total if total else 0:.2%})",
+        pool.summary(),
+    ]
+    labels = [f"<={b}" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+    for label, stats in sorted(test.stats.items()):
+        values = stats.latencies_ms
+        lines.append("")
+        lines.append(
+            f"{label}: n={len(values)}, ошибок={stats.error_count} "
+            f"{dict(stats.errors) if stats.errors else ''}".rstrip()
+        )
+        lines.append(
+            "  "
+            + "  ".join(
+                f"p{q}={percentile(values, q):.1f} мс" for q in (50, 95, 99)
+            )
+            + f"  max={max(values):.1f} мс"
+        )
+        histogram = stats.histogram()
+        peak = max(histogram)
+        for bucket, count in zip(labels, histogram):
+            if count:
+                bar = "#" * max(1, round(40 * count / peak))
+                lines.append(f"  {bucket:>8} мс {count:>7} {bar}")
+    return "\n".join(lines)
+
+
+async def run(
+    base_url: Optional[str],
+    mix: Dict[str, int],
+    concurrency: int,
+    duration: float,
+    races: int,
+    runners: int,
+    seed: int,
+) -> str:
+    async with open_target(base_url) as (client, read_pool):
+        fixtures = await seed_via_api(client, races, runners)
+        test = LoadTest(client, fixtures, mix, runners=runners, seed=seed)
+        sampler = PoolSampler(read_pool)
+        stop = asyncio.Event()
+        sampler_task = asyncio.create_task(sampler.run(stop))
+        try:
+            elapsed = await test.run(concurrency, duration)
+        finally:
+            stop.set()
+            await sampler_task
+    return format_report(test, elapsed, sampler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--base-url", help="Адрес запущенного сервера (по умолчанию — в процессе)"
+    )
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--races", type=int, default=50, help="Состязаний для опроса")
+    parser.add_argument("--runners", type=int, default=8, help="Участников в забеге")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = asyncio.run(
+        run(
+            args.base_url,
+            mix,
+            args.concurrency,
+            args.duration,
+            args.races,
+            args.runners,
+            args.seed,
+        )
+    )
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from src.config import Settings
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class CacheBackend(ABC):
+    """Интерфейс хранилища кэша"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Получить значение или None"""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """Сохранить значение"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Удалить значение"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Очистить кэш"""
+
+    def size(self) -> Optional[int]:
+        """Количество записей, если известно"""
+        return None
+
+
+class MemoryCacheBackend(CacheBackend):
+    """LRU-кэш в памяти процесса с TTL"""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+
+        self._items.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        self._items[key] = (time.monotonic() + self.ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._items.pop(key, None)
+
+    async def clear(self) -> None:
+        self._items.clear()
+
+    def size(self) -> Optional[int]:
+        return len(self._items)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Общий кэш в Redis для нескольких воркеров
+
+    Значения хранятся в JSON pydantic-модели. Требует пакет redis.
+    """
+
+    def __init__(
+        self, url: str, model: Type[BaseModel], ttl: float = 60.0, prefix: str = ""
+    ):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise ImportError("Для CACHE_BACKEND=redis установите пакет redis") from e
+
+        self.client = redis_asyncio.from_url(url)
+        self.model = model
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        return self.model.model_validate_json(raw)
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.client.set(
+            self.prefix + key, value.model_dump_json(), px=int(self.ttl * 1000)
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=self.prefix + "*"):
+            await self.client.delete(key)
+
+
+class ResponseCache(Generic[ModelT]):
+    """Кэш ответов по ключу со счетчиками попаданий и промахов"""
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: Any) -> Optional[ModelT]:
+        if not self.enabled:
+            return None
+
+        value = await self.backend.get(str(key))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: Any, value: ModelT) -> None:
+        if self.enabled:
+            await self.backend.set(str(key), value)
+
+    async def invalidate(self, key: Any) -> None:
+        if self.enabled:
+            await self.backend.delete(str(key))
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Счетчики для мониторинга"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "size": self.backend.size(),
+        }
+
+
+def build_cache(
+    config: Settings, model: Type[ModelT], prefix: str
+) -> ResponseCache[ModelT]:
+    """Собрать кэш по настройкам (CACHE_BACKEND=memory|redis)"""
+    if config.cache_backend == "redis":
+        if not config.cache_redis_url:
+            raise ValueError("Для CACHE_BACKEND=redis задайте CACHE_REDIS_URL")
+        backend: CacheBackend = RedisCacheBackend(
+            config.cache_redis_url, model, ttl=config.cache_ttl, prefix=prefix
+        )
+    else:
+        backend = MemoryCacheBackend(
+            max_size=config.cache_max_size, ttl=config.cache_ttl
+        )
+    return ResponseCache(backend, enabled=config.cache_enabled)
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class LeaderboardEntryDTO(BaseModel):
+    """DTO строки рейтинга"""
+
+    entity_id: int
+    name: str
+    starts: int
+    wins: int
+    podiums: int
+
+    model_config = ConfigDict(from_attributes=True)
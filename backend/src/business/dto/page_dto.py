@@ -0,0 +1,33 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+ItemT = TypeVar("ItemT")
+
+
+class PageDTO(BaseModel, Generic[ItemT]):
+    """DTO страницы keyset-пагинации"""
+
+    items: list[ItemT]
+    next_cursor: Optional[str] = None
+
+
+class BatchDTO(BaseModel, Generic[ItemT]):
+    """DTO выборки по списку ID: найденные записи в порядке запроса"""
+
+    items: list[ItemT]
+    missing: list[int] = []
+
+
+class BulkRowErrorDTO(BaseModel):
+    """DTO ошибки в строке пакетной загрузки"""
+
+    index: int
+    error: str
+
+
+class BulkCreateDTO(BaseModel, Generic[ItemT]):
+    """DTO результата пакетного создания: записи либо ошибки по строкам"""
+
+    created: list[ItemT] = []
+    errors: list[BulkRowErrorDTO] = []
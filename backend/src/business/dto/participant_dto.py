@@ -3,6 +3,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.business.dto.page_dto import BulkRowErrorDTO
+
 
 class ParticipantCreateDTO(BaseModel):
     """DTO для создания участника"""
@@ -25,3 +27,19 @@ class ParticipantDTO(BaseModel):
     time_result: Optional[time]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class RaceResultRowDTO(BaseModel):
+    """DTO строки итогового протокола состязания"""
+
+    jockey_id: int = Field(..., gt=0)
+    horse_id: int = Field(..., gt=0)
+    place: int = Field(..., gt=0)
+    time_result: Optional[time] = None
+
+
+class BulkResultsDTO(BaseModel):
+    """DTO результата пакетной загрузки результатов"""
+
+    created: list[ParticipantDTO] = []
+    errors: list[BulkRowErrorDTO] = []
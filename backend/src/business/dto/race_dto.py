@@ -13,6 +13,15 @@ class RaceCreateDTO(BaseModel):
     name: Optional[str] = None
 
 
+class RaceFilterDTO(BaseModel):
+    """DTO фильтров списка состязаний (границы дат включаются)"""
+
+    date_from: Optional[datetime.date] = None
+    date_to: Optional[datetime.date] = None
+    hippodrome: Optional[str] = None
+    name_prefix: Optional[str] = None
+
+
 class RaceDTO(BaseModel):
     """DTO состязания"""
 
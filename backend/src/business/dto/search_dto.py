@@ -0,0 +1,14 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SearchResultDTO(BaseModel):
+    """DTO результата поиска"""
+
+    kind: Literal["horse", "jockey", "owner"]
+    id: int
+    title: str
+    score: float
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,18 @@
+import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class PerformanceStatsDTO(BaseModel):
+    """DTO статистики выступлений жокея или лошади"""
+
+    starts: int = 0
+    wins: int = 0
+    podiums: int = 0
+    win_rate: float = 0.0
+    podium_rate: float = 0.0
+    mean_place: Optional[float] = None
+    best_time: Optional[datetime.time] = None
+    date_from: Optional[datetime.date] = None
+    date_to: Optional[datetime.date] = None
@@ -0,0 +1,40 @@
+import enum
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+from sqlalchemy import Row
+
+# Запись с выбранными полями (sparse fieldset)
+SparseItem = Dict[str, Any]
+
+
+def select_fields(
+    dto_type: Type[BaseModel], fields: Optional[Sequence[str]]
+) -> List[str]:
+    """
+    Колонки проекции для списка: запрошенные поля или все поля DTO
+
+    id добавляется всегда, чтобы клиент мог сослаться на запись.
+
+    Raises:
+        ValueError: Если поле не входит в DTO
+    """
+    if fields is None:
+        return list(dto_type.model_fields)
+    unknown = [name for name in fields if name not in dto_type.model_fields]
+    if unknown:
+        raise ValueError(f"Неизвестные поля: {', '.join(unknown)}")
+    return list(dict.fromkeys(["id", *fields]))
+
+
+def to_sparse(rows: Sequence[Row], fields: Sequence[str]) -> List[SparseItem]:
+    """Строки проекции в словари только с запрошенными полями"""
+    items = []
+    for row in rows:
+        mapping = row._mapping
+        items.append({name: _plain(mapping[name]) for name in fields})
+    return items
+
+
+def _plain(value: Any) -> Any:
+    return value.value if isinstance(value, enum.Enum) else value
@@ -1,6 +1,13 @@
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 from src.business.dto.horse_dto import HorseCreateDTO, HorseDTO
+from src.business.dto.page_dto import (
+    BatchDTO,
+    BulkCreateDTO,
+    BulkRowErrorDTO,
+    PageDTO,
+)
+from src.business.fields import SparseItem, select_fields, to_sparse
 from src.data.models import GenderEnum
 from src.data.uow import UnitOfWork
 
@@ -39,6 +46,52 @@ async def create_horse(uow: UnitOfWork, data: HorseCreateDTO) -> HorseDTO:
         return HorseDTO.model_validate(horse)
 
 
+async def create_horses_bulk(
+    uow: UnitOfWork, rows: Sequence[HorseCreateDTO]
+) -> BulkCreateDTO[HorseDTO]:
+    """
+    Создать лошадей пакетом в одной транзакции
+
+    Владельцы всех строк проверяются одним запросом WHERE id IN,
+    вставка — многострочными INSERT. Если хотя бы одна строка
+    ошибочна, ничего не сохраняется и возвращаются ошибки по строкам.
+
+    Args:
+        uow: Unit of Work
+        rows: Данные лошадей
+
+    Returns:
+        BulkCreateDTO: созданные лошади (по возрастанию ID) либо ошибки
+    """
+    async with uow:
+        owner_ids = await uow.owners.get_existing_ids(r.owner_id for r in rows)
+        errors = [
+            BulkRowErrorDTO(
+                index=index, error=f"Владелец с ID {row.owner_id} не найден"
+            )
+            for index, row in enumerate(rows)
+            if row.owner_id not in owner_ids
+        ]
+        if errors:
+            return BulkCreateDTO[HorseDTO](errors=errors)
+
+        created = await uow.horses.create_many(
+            [
+                {
+                    "nickname": row.nickname,
+                    "gender": GenderEnum(row.gender),
+                    "age": row.age,
+                    "owner_id": row.owner_id,
+                }
+                for row in rows
+            ]
+        )
+        await uow.commit()
+
+    horses = sorted((HorseDTO.model_validate(h) for h in created), key=lambda h: h.id)
+    return BulkCreateDTO[HorseDTO](created=horses)
+
+
 async def get_horse_by_id(uow: UnitOfWork, horse_id: int) -> Optional[HorseDTO]:
     """
     Получить лошадь по ID
@@ -57,9 +110,49 @@ async def get_horse_by_id(uow: UnitOfWork, horse_id: int) -> Optional[HorseDTO]:
         return HorseDTO.model_validate(horse)
 
 
+async def get_horses_by_ids(
+    uow: UnitOfWork, horse_ids: Sequence[int]
+) -> BatchDTO[HorseDTO]:
+    """
+    Получить лошадей по списку ID одним запросом
+
+    Args:
+        uow: Unit of Work
+        horse_ids: ID лошадей
+
+    Returns:
+        BatchDTO с HorseDTO в порядке запроса и списком ненайденных ID
+    """
+    async with uow:
+        horses = await uow.horses.get_many(horse_ids)
+        found = {item.id for item in horses}
+        return BatchDTO[HorseDTO](
+            items=[HorseDTO.model_validate(item) for item in horses],
+            missing=[id for id in dict.fromkeys(horse_ids) if id not in found],
+        )
+
+
+async def get_horse_revision(uow: UnitOfWork, horse_id: int) -> Optional[int]:
+    """
+    Получить версию лошади для ETag
+
+    Args:
+        uow: Unit of Work
+        horse_id: ID лошади
+
+    Returns:
+        Версия или None, если не найдено
+    """
+    async with uow:
+        return await uow.horses.get_revision(horse_id)
+
+
 async def list_horses(
-    uow: UnitOfWork, skip: int = 0, limit: int = 100
-) -> list[HorseDTO]:
+    uow: UnitOfWork,
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[list[HorseDTO], list[SparseItem]]:
     """
     Получить список лошадей
 
@@ -67,10 +160,53 @@ async def list_horses(
         uow: Unit of Work
         skip: Пропустить записей
         limit: Максимум записей
+        fields: Только эти поля (и id) — словари вместо HorseDTO
 
     Returns:
-        Список HorseDTO
+        Список HorseDTO или словарей с полями fields
+
+    Raises:
+        ValueError: Если поле неизвестно
     """
+    columns = select_fields(HorseDTO, fields)
     async with uow:
-        horses = await uow.horses.list(skip=skip, limit=limit)
-        return [HorseDTO.model_validate(h) for h in horses]
+        rows = await uow.horses.list_rows(columns, skip=skip, limit=limit)
+        if fields is not None:
+            return to_sparse(rows, columns)
+        return [HorseDTO.model_validate(row) for row in rows]
+
+
+async def list_horses_page(
+    uow: UnitOfWork,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[PageDTO[HorseDTO], PageDTO[SparseItem]]:
+    """
+    Получить страницу лошадей по курсору
+
+    Args:
+        uow: Unit of Work
+        cursor: Курсор из предыдущей страницы (None — первая страница)
+        limit: Максимум записей
+        fields: Только эти поля (и id) — словари вместо HorseDTO
+
+    Returns:
+        PageDTO с HorseDTO (или словарями) и курсором следующей страницы
+
+    Raises:
+        ValueError: Если курсор, limit или поле некорректны
+    """
+    columns = select_fields(HorseDTO, fields)
+    async with uow:
+        rows, next_cursor = await uow.horses.list_rows_page(
+            columns, cursor=cursor, limit=limit
+        )
+        if fields is not None:
+            return PageDTO[SparseItem](
+                items=to_sparse(rows, columns), next_cursor=next_cursor
+            )
+        return PageDTO[HorseDTO](
+            items=[HorseDTO.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+        )
@@ -1,6 +1,13 @@
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 from src.business.dto.jockey_dto import JockeyCreateDTO, JockeyDTO
+from src.business.dto.page_dto import (
+    BatchDTO,
+    BulkCreateDTO,
+    BulkRowErrorDTO,
+    PageDTO,
+)
+from src.business.fields import SparseItem, select_fields, to_sparse
 from src.data.uow import UnitOfWork
 
 
@@ -21,11 +28,9 @@ async def create_jockey(uow: UnitOfWork, data: JockeyCreateDTO) -> JockeyDTO:
         ValueError: Если бизнес-правила нарушены
     """
     # Валидация бизнес-правил
-    if data.age < 16:
-        raise ValueError("Возраст жокея должен быть не менее 16 лет")
-
-    if data.rating < 0:
-        raise ValueError("Рейтинг не может быть отрицательным")
+    error = _check_jockey_rules(data)
+    if error:
+        raise ValueError(error)
 
     async with uow:
         jockey = await uow.jockeys.create(
@@ -40,6 +45,47 @@ async def create_jockey(uow: UnitOfWork, data: JockeyCreateDTO) -> JockeyDTO:
         return JockeyDTO.model_validate(jockey)
 
 
+async def create_jockeys_bulk(
+    uow: UnitOfWork, rows: Sequence[JockeyCreateDTO]
+) -> BulkCreateDTO[JockeyDTO]:
+    """
+    Создать жокеев пакетом в одной транзакции
+
+    Правила те же, что у create_jockey. Если хотя бы одна строка
+    ошибочна, ничего не сохраняется и возвращаются ошибки по строкам.
+
+    Args:
+        uow: Unit of Work
+        rows: Данные жокеев
+
+    Returns:
+        BulkCreateDTO: созданные жокеи (по возрастанию ID) либо ошибки
+    """
+    errors = [
+        BulkRowErrorDTO(index=index, error=error)
+        for index, row in enumerate(rows)
+        if (error := _check_jockey_rules(row))
+    ]
+    if errors:
+        return BulkCreateDTO[JockeyDTO](errors=errors)
+
+    async with uow:
+        created = await uow.jockeys.create_many([row.model_dump() for row in rows])
+        await uow.commit()
+
+    jockeys = sorted((JockeyDTO.model_validate(j) for j in created), key=lambda j: j.id)
+    return BulkCreateDTO[JockeyDTO](created=jockeys)
+
+
+def _check_jockey_rules(data: JockeyCreateDTO) -> Optional[str]:
+    """Проверить бизнес-правила жокея; вернуть текст ошибки или None"""
+    if data.age < 16:
+        return "Возраст жокея должен быть не менее 16 лет"
+    if data.rating < 0:
+        return "Рейтинг не может быть отрицательным"
+    return None
+
+
 async def get_jockey_by_id(uow: UnitOfWork, jockey_id: int) -> Optional[JockeyDTO]:
     """
     Получить жокея по ID
@@ -58,9 +104,49 @@ async def get_jockey_by_id(uow: UnitOfWork, jockey_id: int) -> Optional[JockeyDT
         return JockeyDTO.model_validate(jockey)
 
 
+async def get_jockeys_by_ids(
+    uow: UnitOfWork, jockey_ids: Sequence[int]
+) -> BatchDTO[JockeyDTO]:
+    """
+    Получить жокеев по списку ID одним запросом
+
+    Args:
+        uow: Unit of Work
+        jockey_ids: ID жокеев
+
+    Returns:
+        BatchDTO с JockeyDTO в порядке запроса и списком ненайденных ID
+    """
+    async with uow:
+        jockeys = await uow.jockeys.get_many(jockey_ids)
+        found = {item.id for item in jockeys}
+        return BatchDTO[JockeyDTO](
+            items=[JockeyDTO.model_validate(item) for item in jockeys],
+            missing=[id for id in dict.fromkeys(jockey_ids) if id not in found],
+        )
+
+
+async def get_jockey_revision(uow: UnitOfWork, jockey_id: int) -> Optional[int]:
+    """
+    Получить версию жокея для ETag
+
+    Args:
+        uow: Unit of Work
+        jockey_id: ID жокея
+
+    Returns:
+        Версия или None, если не найдено
+    """
+    async with uow:
+        return await uow.jockeys.get_revision(jockey_id)
+
+
 async def list_jockeys(
-    uow: UnitOfWork, skip: int = 0, limit: int = 100
-) -> list[JockeyDTO]:
+    uow: UnitOfWork,
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[list[JockeyDTO], list[SparseItem]]:
     """
     Получить список жокеев
 
@@ -68,10 +154,53 @@ async def list_jockeys(
         uow: Unit of Work
         skip: Пропустить записей
         limit: Максимум записей
+        fields: Только эти поля (и id) — словари вместо JockeyDTO
 
     Returns:
-        Список JockeyDTO
+        Список JockeyDTO или словарей с полями fields
+
+    Raises:
+        ValueError: Если поле неизвестно
+    """
+    columns = select_fields(JockeyDTO, fields)
+    async with uow:
+        rows = await uow.jockeys.list_rows(columns, skip=skip, limit=limit)
+        if fields is not None:
+            return to_sparse(rows, columns)
+        return [JockeyDTO.model_validate(row) for row in rows]
+
+
+async def list_jockeys_page(
+    uow: UnitOfWork,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[PageDTO[JockeyDTO], PageDTO[SparseItem]]:
+    """
+    Получить страницу жокеев по курсору
+
+    Args:
+        uow: Unit of Work
+        cursor: Курсор из предыдущей страницы (None — первая страница)
+        limit: Максимум записей
+        fields: Только эти поля (и id) — словари вместо JockeyDTO
+
+    Returns:
+        PageDTO с JockeyDTO (или словарями) и курсором следующей страницы
+
+    Raises:
+        ValueError: Если курсор, limit или поле некорректны
     """
+    columns = select_fields(JockeyDTO, fields)
     async with uow:
-        jockeys = await uow.jockeys.list(skip=skip, limit=limit)
-        return [JockeyDTO.model_validate(j) for j in jockeys]
+        rows, next_cursor = await uow.jockeys.list_rows_page(
+            columns, cursor=cursor, limit=limit
+        )
+        if fields is not None:
+            return PageDTO[SparseItem](
+                items=to_sparse(rows, columns), next_cursor=next_cursor
+            )
+        return PageDTO[JockeyDTO](
+            items=[JockeyDTO.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+        )
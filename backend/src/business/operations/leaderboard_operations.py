@@ -0,0 +1,44 @@
+from typing import Optional
+
+from src.business.dto.leaderboard_dto import LeaderboardEntryDTO
+from src.business.dto.page_dto import PageDTO
+from src.data.uow import UnitOfWork
+
+ENTITY_TYPES = ("jockey", "horse")
+
+
+async def get_leaderboard(
+    uow: UnitOfWork,
+    entity_type: str = "jockey",
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> PageDTO[LeaderboardEntryDTO]:
+    """
+    Получить рейтинг жокеев или лошадей по победам и призовым местам
+
+    Читается из сводной таблицы, которая обновляется вместе с
+    добавлением результатов, без пересчета по race_participants.
+
+    Args:
+        uow: Unit of Work
+        entity_type: "jockey" или "horse"
+        cursor: Курсор из предыдущей страницы (None — первая страница)
+        limit: Максимум записей
+
+    Returns:
+        PageDTO с LeaderboardEntryDTO и курсором следующей страницы
+
+    Raises:
+        ValueError: Если тип сущности, курсор или limit некорректны
+    """
+    if entity_type not in ENTITY_TYPES:
+        raise ValueError(f"Неизвестный тип рейтинга: {entity_type}")
+
+    async with uow:
+        rows, next_cursor = await uow.leaderboard.list_ranking(
+            entity_type, cursor=cursor, limit=limit
+        )
+        return PageDTO[LeaderboardEntryDTO](
+            items=[LeaderboardEntryDTO.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+        )
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 from src.business.dto.owner_dto import OwnerCreateDTO, OwnerDTO
+from src.business.dto.page_dto import BatchDTO, BulkCreateDTO, PageDTO
+from src.business.fields import SparseItem, select_fields, to_sparse
 from src.data.uow import UnitOfWork
 
 
@@ -23,6 +25,27 @@ async def create_owner(uow: UnitOfWork, data: OwnerCreateDTO) -> OwnerDTO:
         return OwnerDTO.model_validate(owner)
 
 
+async def create_owners_bulk(
+    uow: UnitOfWork, rows: Sequence[OwnerCreateDTO]
+) -> BulkCreateDTO[OwnerDTO]:
+    """
+    Создать владельцев пакетом в одной транзакции
+
+    Args:
+        uow: Unit of Work
+        rows: Данные владельцев
+
+    Returns:
+        BulkCreateDTO: созданные владельцы по возрастанию ID
+    """
+    async with uow:
+        created = await uow.owners.create_many([row.model_dump() for row in rows])
+        await uow.commit()
+
+    owners = sorted((OwnerDTO.model_validate(o) for o in created), key=lambda o: o.id)
+    return BulkCreateDTO[OwnerDTO](created=owners)
+
+
 async def get_owner_by_id(uow: UnitOfWork, owner_id: int) -> Optional[OwnerDTO]:
     """
     Получить владельца по ID
@@ -41,9 +64,34 @@ async def get_owner_by_id(uow: UnitOfWork, owner_id: int) -> Optional[OwnerDTO]:
         return OwnerDTO.model_validate(owner)
 
 
+async def get_owners_by_ids(
+    uow: UnitOfWork, owner_ids: Sequence[int]
+) -> BatchDTO[OwnerDTO]:
+    """
+    Получить владельцев по списку ID одним запросом
+
+    Args:
+        uow: Unit of Work
+        owner_ids: ID владельцев
+
+    Returns:
+        BatchDTO с OwnerDTO в порядке запроса и списком ненайденных ID
+    """
+    async with uow:
+        owners = await uow.owners.get_many(owner_ids)
+        found = {item.id for item in owners}
+        return BatchDTO[OwnerDTO](
+            items=[OwnerDTO.model_validate(item) for item in owners],
+            missing=[id for id in dict.fromkeys(owner_ids) if id not in found],
+        )
+
+
 async def list_owners(
-    uow: UnitOfWork, skip: int = 0, limit: int = 100
-) -> list[OwnerDTO]:
+    uow: UnitOfWork,
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[list[OwnerDTO], list[SparseItem]]:
     """
     Получить список владельцев
 
@@ -51,10 +99,53 @@ async def list_owners(
         uow: Unit of Work
         skip: Пропустить записей
         limit: Максимум записей
+        fields: Только эти поля (и id) — словари вместо OwnerDTO
 
     Returns:
-        Список OwnerDTO
+        Список OwnerDTO или словарей с полями fields
+
+    Raises:
+        ValueError: Если поле неизвестно
     """
+    columns = select_fields(OwnerDTO, fields)
     async with uow:
-        owners = await uow.owners.list(skip=skip, limit=limit)
-        return [OwnerDTO.model_validate(o) for o in owners]
+        rows = await uow.owners.list_rows(columns, skip=skip, limit=limit)
+        if fields is not None:
+            return to_sparse(rows, columns)
+        return [OwnerDTO.model_validate(row) for row in rows]
+
+
+async def list_owners_page(
+    uow: UnitOfWork,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[PageDTO[OwnerDTO], PageDTO[SparseItem]]:
+    """
+    Получить страницу владельцев по курсору
+
+    Args:
+        uow: Unit of Work
+        cursor: Курсор из предыдущей страницы (None — первая страница)
+        limit: Максимум записей
+        fields: Только эти поля (и id) — словари вместо OwnerDTO
+
+    Returns:
+        PageDTO с OwnerDTO (или словарями) и курсором следующей страницы
+
+    Raises:
+        ValueError: Если курсор, limit или поле некорректны
+    """
+    columns = select_fields(OwnerDTO, fields)
+    async with uow:
+        rows, next_cursor = await uow.owners.list_rows_page(
+            columns, cursor=cursor, limit=limit
+        )
+        if fields is not None:
+            return PageDTO[SparseItem](
+                items=to_sparse(rows, columns), next_cursor=next_cursor
+            )
+        return PageDTO[OwnerDTO](
+            items=[OwnerDTO.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+        )
@@ -1,7 +1,22 @@
-from src.business.dto.participant_dto import ParticipantCreateDTO, ParticipantDTO
+from src.business.dto.participant_dto import (
+    BulkResultsDTO,
+    BulkRowErrorDTO,
+    ParticipantCreateDTO,
+    ParticipantDTO,
+    RaceResultRowDTO,
+)
 from src.data.uow import UnitOfWork
 
 
+async def _bump_revisions(
+    uow: UnitOfWork, race_id: int, jockey_ids: list[int], horse_ids: list[int]
+) -> None:
+    """Увеличить версии (ETag) состязания, жокеев и лошадей после записи"""
+    await uow.races.bump_revision([race_id])
+    await uow.jockeys.bump_revision(jockey_ids)
+    await uow.horses.bump_revision(horse_ids)
+
+
 async def add_participant_with_result(
     uow: UnitOfWork, data: ParticipantCreateDTO
 ) -> ParticipantDTO:
@@ -28,30 +43,19 @@ async def add_participant_with_result(
         ValueError: Если бизнес-правила нарушены
     """
     async with uow:
-        # Проверяем существование сущностей
-        race = await uow.races.get_by_id(data.race_id)
-        if not race:
+        # Проверяем существование сущностей одним запросом
+        refs = await uow.participants.check_references(
+            data.race_id, data.jockey_id, data.horse_id
+        )
+        if not refs["race_exists"]:
             raise ValueError(f"Состязание с ID {data.race_id} не найдено")
-
-        jockey = await uow.jockeys.get_by_id(data.jockey_id)
-        if not jockey:
+        if not refs["jockey_exists"]:
             raise ValueError(f"Жокей с ID {data.jockey_id} не найден")
-
-        horse = await uow.horses.get_by_id(data.horse_id)
-        if not horse:
+        if not refs["horse_exists"]:
             raise ValueError(f"Лошадь с ID {data.horse_id} не найдена")
 
-        # Проверяем, что пара еще не участвует в этом состязании
-        existing = await uow.participants.get_by_race_and_pair(
-            data.race_id, data.jockey_id, data.horse_id
-        )
-        if existing:
-            raise ValueError(
-                f"Пара жокей-лошадь уже зарегистрирована в этом состязании"
-            )
-
-        # Создаем запись
-        participant = await uow.participants.create(
+        # Дубликат пары отсекает уникальный индекс (ON CONFLICT DO NOTHING)
+        participant = await uow.participants.create_unique(
             {
                 "race_id": data.race_id,
                 "jockey_id": data.jockey_id,
@@ -60,5 +64,95 @@ async def add_participant_with_result(
                 "time_result": data.time_result,
             }
         )
+        if participant is None:
+            raise ValueError(
+                "Пара жокей-лошадь уже зарегистрирована в этом состязании"
+            )
+        await _bump_revisions(uow, data.race_id, [data.jockey_id], [data.horse_id])
+        await uow.leaderboard.record_results(
+            [(data.jockey_id, data.horse_id, data.place)]
+        )
         await uow.commit()
         return ParticipantDTO.model_validate(participant)
+
+
+async def add_race_results_bulk(
+    uow: UnitOfWork, race_id: int, rows: list[RaceResultRowDTO]
+) -> BulkResultsDTO:
+    """
+    Загрузить итоговый протокол состязания одним пакетом
+
+    Проверки выполняются множественными запросами (по одному на
+    жокеев, лошадей и уже зарегистрированные пары), вставка — одним
+    многострочным INSERT ... ON CONFLICT DO NOTHING, все в одной
+    транзакции. Если хотя бы одна строка ошибочна (в том числе пару
+    успел зарегистрировать параллельный запрос), ничего не сохраняется
+    и возвращаются ошибки по каждой строке.
+
+    Args:
+        uow: Unit of Work
+        race_id: ID состязания
+        rows: Строки протокола
+
+    Returns:
+        BulkResultsDTO: созданные участники либо ошибки по строкам
+
+    Raises:
+        ValueError: Если состязание не найдено
+    """
+    async with uow:
+        if not await uow.races.get_existing_ids([race_id]):
+            raise ValueError(f"Состязание с ID {race_id} не найдено")
+
+        jockey_ids = await uow.jockeys.get_existing_ids(r.jockey_id for r in rows)
+        horse_ids = await uow.horses.get_existing_ids(r.horse_id for r in rows)
+        registered = await uow.participants.get_pairs_by_race(race_id)
+
+        errors = []
+        seen = set()
+        for index, row in enumerate(rows):
+            pair = (row.jockey_id, row.horse_id)
+            if row.jockey_id not in jockey_ids:
+                error = f"Жокей с ID {row.jockey_id} не найден"
+            elif row.horse_id not in horse_ids:
+                error = f"Лошадь с ID {row.horse_id} не найдена"
+            elif pair in registered:
+                error = "Пара жокей-лошадь уже зарегистрирована в этом состязании"
+            elif pair in seen:
+                error = "Пара жокей-лошадь повторяется в протоколе"
+            else:
+                seen.add(pair)
+                continue
+            errors.append(BulkRowErrorDTO(index=index, error=error))
+
+        if errors:
+            return BulkResultsDTO(errors=errors)
+
+        created = await uow.participants.create_many_unique(
+            [{"race_id": race_id, **row.model_dump()} for row in rows]
+        )
+        if len(created) < len(rows):
+            # Пары, вставленные параллельно после проверки: откат при выходе
+            inserted = {(p.jockey_id, p.horse_id) for p in created}
+            return BulkResultsDTO(
+                errors=[
+                    BulkRowErrorDTO(
+                        index=index,
+                        error="Пара жокей-лошадь уже зарегистрирована "
+                        "в этом состязании",
+                    )
+                    for index, row in enumerate(rows)
+                    if (row.jockey_id, row.horse_id) not in inserted
+                ]
+            )
+        await _bump_revisions(
+            uow, race_id, [r.jockey_id for r in rows], [r.horse_id for r in rows]
+        )
+        await uow.leaderboard.record_results(
+            (r.jockey_id, r.horse_id, r.place) for r in rows
+        )
+        await uow.commit()
+
+    participants = [ParticipantDTO.model_validate(p) for p in created]
+    participants.sort(key=lambda p: (p.place, p.id))
+    return BulkResultsDTO(created=participants)
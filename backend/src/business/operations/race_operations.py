@@ -1,14 +1,31 @@
+from contextlib import aclosing
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Sequence, Union
 
+from sqlalchemy import RowMapping
+
+from src.business.cache import build_cache
+from src.business.dto.page_dto import PageDTO
 from src.business.dto.race_dto import (
     ParticipantResultDTO,
     RaceCreateDTO,
     RaceDTO,
+    RaceFilterDTO,
     RaceWithParticipantsDTO,
 )
+from src.business.fields import SparseItem, select_fields, to_sparse
+from src.config import settings
 from src.data.uow import UnitOfWork
 
+# Кэш ответа "состязание с участниками" по ключу "ID:версия". Версия
+# растет при каждой записи, поэтому запись не требует сброса кэша, а
+# ответ, прочитанный с отстающей реплики, не подменяет свежий
+race_cache = build_cache(settings, RaceWithParticipantsDTO, prefix="race:")
+
+
+def _cache_key(race_id: int, revision: int) -> str:
+    return f"{race_id}:{revision}"
+
 
 async def create_race(uow: UnitOfWork, data: RaceCreateDTO) -> RaceDTO:
     """
@@ -49,7 +66,7 @@ async def create_race(uow: UnitOfWork, data: RaceCreateDTO) -> RaceDTO:
 
 
 async def get_race_with_participants(
-    uow: UnitOfWork, race_id: int
+    uow: UnitOfWork, race_id: int, revision: Optional[int] = None
 ) -> Optional[RaceWithParticipantsDTO]:
     """
     Получить состязание с участниками и результатами
@@ -60,49 +77,193 @@ async def get_race_with_participants(
     Args:
         uow: Unit of Work
         race_id: ID состязания
+        revision: Версия состязания, прочитанная из того же источника
+            (для ETag); если не задана, читается отдельным запросом
 
     Returns:
         RaceWithParticipantsDTO или None если не найдено
     """
+    if revision is None:
+        revision = await get_race_revision(uow, race_id)
+        if revision is None:
+            return None
+
+    cached = await race_cache.get(_cache_key(race_id, revision))
+    if cached is not None:
+        return cached
+
     async with uow:
-        race = await uow.races.get_with_participants(race_id)
-        if not race:
+        rows = await uow.races.get_standings(race_id)
+        if not rows:
             return None
 
-        # Сортируем участников по занятому месту
-        sorted_participants = sorted(race.participants, key=lambda p: p.place)
+        result = _standings_to_dto(rows)
 
-        # Формируем DTO
-        participants_dto = [
-            ParticipantResultDTO(
-                jockey_name=p.jockey.name,
-                horse_name=p.horse.nickname,
-                place=p.place,
-                time_result=p.time_result,
-            )
-            for p in sorted_participants
-        ]
+    # Ключ — версия прочитанных строк: запись могла пройти между запросами
+    await race_cache.set(_cache_key(race_id, rows[0]["revision"]), result)
+    return result
+
+
+async def export_races(
+    uow: UnitOfWork, batch_size: int = 1000
+) -> AsyncIterator[RaceWithParticipantsDTO]:
+    """
+    Выгрузить все состязания с результатами участников
+
+    Одним запросом по всем состязаниям (порядок date, id); строки
+    читаются потоково и собираются по состязанию, так что в памяти
+    держится только одно состязание.
 
-        return RaceWithParticipantsDTO(
-            race=RaceDTO.model_validate(race), participants=participants_dto
+    Args:
+        uow: Unit of Work
+        batch_size: Размер пачки строк серверного курсора
+
+    Yields:
+        RaceWithParticipantsDTO по одному на состязание
+    """
+    async with uow:
+        rows: List[RowMapping] = []
+        # Поток держит блокировку сессии: закрыть его до выхода из uow
+        stream = uow.races.stream_standings(batch_size=batch_size)
+        async with aclosing(stream):
+            async for row in stream:
+                if rows and rows[0]["id"] != row["id"]:
+                    yield _standings_to_dto(rows)
+                    rows = []
+                rows.append(row)
+        if rows:
+            yield _standings_to_dto(rows)
+
+
+def _standings_to_dto(rows: Sequence[RowMapping]) -> RaceWithParticipantsDTO:
+    """Собрать DTO из строк итоговой таблицы одного состязания"""
+    # Строки уже отсортированы по занятому месту
+    first = rows[0]
+    race_dto = RaceDTO(
+        id=first["id"],
+        date=first["date"],
+        time=first["time"],
+        hippodrome=first["hippodrome"],
+        name=first["name"],
+    )
+    participants_dto = [
+        ParticipantResultDTO(
+            jockey_name=row["jockey_name"],
+            horse_name=row["horse_name"],
+            place=row["place"],
+            time_result=row["time_result"],
         )
+        for row in rows
+        if row["place"] is not None
+    ]
+    return RaceWithParticipantsDTO(race=race_dto, participants=participants_dto)
+
+
+async def get_race_revision(uow: UnitOfWork, race_id: int) -> Optional[int]:
+    """
+    Получить версию состязания для ETag
+
+    Args:
+        uow: Unit of Work
+        race_id: ID состязания
+
+    Returns:
+        Версия или None, если не найдено
+    """
+    async with uow:
+        return await uow.races.get_revision(race_id)
 
 
-async def list_races(uow: UnitOfWork, skip: int = 0, limit: int = 100) -> list[RaceDTO]:
+async def list_races(
+    uow: UnitOfWork,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[RaceFilterDTO] = None,
+    sort: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[list[RaceDTO], list[SparseItem]]:
     """
     Получить список всех состязаний
 
+    Один запрос проекцией колонок: участники не загружаются.
+
     Args:
         uow: Unit of Work
         skip: Количество записей для пропуска
         limit: Максимальное количество записей
+        filters: Фильтры по датам, ипподрому и началу названия
+        sort: "date", "-date" или "hippodrome" (None — без сортировки)
+        fields: Только эти поля (и id) — словари вместо RaceDTO
 
     Returns:
-        Список RaceDTO
+        Список RaceDTO или словарей с полями fields
+
+    Raises:
+        ValueError: Если фильтры, сортировка или поля некорректны
     """
+    filters = _check_filters(filters)
+    columns = select_fields(RaceDTO, fields)
     async with uow:
-        races = await uow.races.list(skip=skip, limit=limit)
-        return [RaceDTO.model_validate(race) for race in races]
+        rows = await uow.races.list_rows(
+            columns, skip=skip, limit=limit, sort=sort, **filters.model_dump()
+        )
+        if fields is not None:
+            return to_sparse(rows, columns)
+        return [RaceDTO.model_validate(row) for row in rows]
+
+
+async def list_races_page(
+    uow: UnitOfWork,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: Optional[RaceFilterDTO] = None,
+    sort: str = "date",
+    fields: Optional[Sequence[str]] = None,
+) -> Union[PageDTO[RaceDTO], PageDTO[SparseItem]]:
+    """
+    Получить страницу состязаний по курсору
+
+    Состязания упорядочены по ключу сортировки с id в конце, поэтому
+    глубокие страницы стоят столько же, сколько первая. Один запрос
+    проекцией колонок: участники не загружаются.
+
+    Args:
+        uow: Unit of Work
+        cursor: Курсор из предыдущей страницы (None — первая страница)
+        limit: Максимальное количество записей
+        filters: Фильтры по датам, ипподрому и началу названия
+        sort: "date", "-date" или "hippodrome"
+        fields: Только эти поля (и id) — словари вместо RaceDTO
+
+    Returns:
+        PageDTO с RaceDTO (или словарями) и курсором следующей страницы
+
+    Raises:
+        ValueError: Если курсор, limit, фильтры, сортировка или поля
+            некорректны
+    """
+    filters = _check_filters(filters)
+    columns = select_fields(RaceDTO, fields)
+    async with uow:
+        rows, next_cursor = await uow.races.list_rows_page(
+            columns, cursor=cursor, limit=limit, sort=sort, **filters.model_dump()
+        )
+        if fields is not None:
+            return PageDTO[SparseItem](
+                items=to_sparse(rows, columns), next_cursor=next_cursor
+            )
+        return PageDTO[RaceDTO](
+            items=[RaceDTO.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+
+def _check_filters(filters: Optional[RaceFilterDTO]) -> RaceFilterDTO:
+    """Фильтры по умолчанию (без ограничений) и проверка диапазона дат"""
+    filters = filters or RaceFilterDTO()
+    if filters.date_from and filters.date_to and filters.date_from > filters.date_to:
+        raise ValueError("date_from не может быть позже date_to")
+    return filters
 
 
 async def get_jockey_races(uow: UnitOfWork, jockey_id: int) -> list[RaceDTO]:
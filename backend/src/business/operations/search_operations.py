@@ -0,0 +1,51 @@
+from typing import List, Optional, Sequence
+
+from src.business.dto.search_dto import SearchResultDTO
+from src.data.search import SEARCH_SOURCES
+from src.data.uow import UnitOfWork
+
+MAX_QUERY_LENGTH = 100
+MAX_SEARCH_LIMIT = 100
+
+
+async def search(
+    uow: UnitOfWork,
+    query: str,
+    kinds: Optional[Sequence[str]] = None,
+    limit: int = 20,
+) -> List[SearchResultDTO]:
+    """
+    Найти лошадей по кличке, жокеев и владельцев по имени
+
+    Слова запроса ищутся как префиксы слов имени ("орл ры" найдет
+    "Орлов Рысак"), лучшие совпадения первыми.
+
+    Args:
+        uow: Unit of Work
+        query: Строка поиска
+        kinds: Типы сущностей ("horse", "jockey", "owner"), по умолчанию все
+        limit: Максимум результатов
+
+    Returns:
+        Список SearchResultDTO по убыванию релевантности
+
+    Raises:
+        ValueError: Если запрос пуст или слишком длинный, тип или limit
+            некорректны
+    """
+    query = query.strip()
+    if not query:
+        raise ValueError("Поисковый запрос не может быть пустым")
+    if len(query) > MAX_QUERY_LENGTH:
+        raise ValueError(f"Поисковый запрос длиннее {MAX_QUERY_LENGTH} символов")
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        raise ValueError(f"limit должен быть от 1 до {MAX_SEARCH_LIMIT}")
+
+    kinds = list(dict.fromkeys(kinds)) if kinds else list(SEARCH_SOURCES)
+    unknown = [kind for kind in kinds if kind not in SEARCH_SOURCES]
+    if unknown:
+        raise ValueError(f"Неизвестный тип поиска: {', '.join(unknown)}")
+
+    async with uow:
+        rows = await uow.search.search(query, kinds, limit)
+        return [SearchResultDTO.model_validate(row) for row in rows]
@@ -0,0 +1,105 @@
+import datetime
+from typing import Optional
+
+from sqlalchemy import RowMapping
+
+from src.business.dto.stats_dto import PerformanceStatsDTO
+from src.business.exceptions import HorseNotFoundError, JockeyNotFoundError
+from src.data.uow import UnitOfWork
+
+
+def _validate_period(
+    date_from: Optional[datetime.date], date_to: Optional[datetime.date]
+) -> None:
+    if date_from and date_to and date_from > date_to:
+        raise ValueError("Начало периода не может быть позже конца")
+
+
+def _to_stats_dto(
+    row: Optional[RowMapping],
+    date_from: Optional[datetime.date],
+    date_to: Optional[datetime.date],
+) -> PerformanceStatsDTO:
+    if row is None:
+        return PerformanceStatsDTO(date_from=date_from, date_to=date_to)
+
+    starts = row["starts"]
+    return PerformanceStatsDTO(
+        starts=starts,
+        wins=row["wins"],
+        podiums=row["podiums"],
+        win_rate=row["wins"] / starts,
+        podium_rate=row["podiums"] / starts,
+        mean_place=float(row["mean_place"]),
+        best_time=row["best_time"],
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+
+async def get_jockey_stats(
+    uow: UnitOfWork,
+    jockey_id: int,
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+) -> PerformanceStatsDTO:
+    """
+    Получить статистику выступлений жокея
+
+    Агрегация выполняется в SQL (GROUP BY по race_participants).
+
+    Args:
+        uow: Unit of Work
+        jockey_id: ID жокея
+        date_from: Начало периода (включительно)
+        date_to: Конец периода (включительно)
+
+    Returns:
+        PerformanceStatsDTO
+
+    Raises:
+        JockeyNotFoundError: Если жокей не найден
+        ValueError: Если период некорректен
+    """
+    _validate_period(date_from, date_to)
+
+    async with uow:
+        if not await uow.jockeys.get_existing_ids([jockey_id]):
+            raise JockeyNotFoundError(f"Жокей с ID {jockey_id} не найден")
+
+        row = await uow.participants.get_jockey_stats(jockey_id, date_from, date_to)
+        return _to_stats_dto(row, date_from, date_to)
+
+
+async def get_horse_stats(
+    uow: UnitOfWork,
+    horse_id: int,
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+) -> PerformanceStatsDTO:
+    """
+    Получить статистику выступлений лошади
+
+    Агрегация выполняется в SQL (GROUP BY по race_participants).
+
+    Args:
+        uow: Unit of Work
+        horse_id: ID лошади
+        date_from: Начало периода (включительно)
+        date_to: Конец периода (включительно)
+
+    Returns:
+        PerformanceStatsDTO
+
+    Raises:
+        HorseNotFoundError: Если лошадь не найдена
+        ValueError: Если период некорректен
+    """
+    _validate_period(date_from, date_to)
+
+    async with uow:
+        if not await uow.horses.get_existing_ids([horse_id]):
+            raise HorseNotFoundError(f"Лошадь с ID {horse_id} не найдена")
+
+        row = await uow.participants.get_horse_stats(horse_id, date_from, date_to)
+        return _to_stats_dto(row, date_from, date_to)
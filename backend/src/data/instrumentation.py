@@ -0,0 +1,173 @@
+import functools
+import inspect
+import logging
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+UNTAGGED = "-"
+
+
+@dataclass
+class QueryStats:
+    """Количество запросов и суммарное время в БД"""
+
+    count: int = 0
+    duration: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+
+
+@dataclass
+class RequestContext:
+    """Контекст HTTP-запроса: маршрут и статистика его запросов к БД"""
+
+    scope: Dict[str, Any]
+    queries: QueryStats = field(default_factory=QueryStats)
+
+    @property
+    def route(self) -> str:
+        """Шаблон маршрута (/api/v1/races/{race_id}) или путь до маршрутизации"""
+        return route_template(self.scope) or self.scope.get("path", UNTAGGED)
+
+
+def route_template(scope: Dict[str, Any]) -> Optional[str]:
+    """
+    Полный шаблон маршрута, выбранного роутером, или None
+
+    route.path у маршрутов из include_router не содержит префикс
+    подключения (/api/v1), поэтому префикс восстанавливается по пути:
+    это часть пути перед суффиксом, совпавшим с шаблоном маршрута.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    regex = getattr(route, "path_regex", None)
+    if template is None or regex is None:
+        return template
+    path = scope.get("path", "")
+    start = 0
+    while start != -1:
+        if regex.match(path[start:]):
+            return path[:start] + template
+        start = path.find("/", start + 1)
+    return template
+
+
+# Метод репозитория, выполняющий запрос (RaceRepository.get_standings)
+current_repository_method: ContextVar[Optional[str]] = ContextVar(
+    "current_repository_method", default=None
+)
+# Текущий HTTP-запрос (выставляет QueryTimingMiddleware)
+current_request: ContextVar[Optional[RequestContext]] = ContextVar(
+    "current_request", default=None
+)
+
+# Накопленная статистика по (шаблону маршрута, методу репозитория) за время
+# жизни процесса; запросы вне HTTP-запроса учитываются с маршрутом UNTAGGED
+query_totals: Dict[Tuple[str, str], QueryStats] = defaultdict(QueryStats)
+
+
+def tag_repository_methods(cls: type) -> None:
+    """
+    Обернуть публичные async-методы класса тегом current_repository_method
+
+    Тег вида "<класс экземпляра>.<метод>", поэтому методы BaseRepository
+    помечаются именем конкретного репозитория. Асинхронные генераторы
+    не оборачиваются: их тело выполняется в контексте потребителя.
+    """
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(value):
+            continue
+        setattr(cls, name, _tagged(value))
+
+
+def _tagged(method: Callable) -> Callable:
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        token = current_repository_method.set(
+            f"{type(self).__name__}.{method.__name__}"
+        )
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            current_repository_method.reset(token)
+
+    return wrapper
+
+
+def instrument_engine(
+    db_engine: AsyncEngine,
+    slow_query_ms: Optional[float] = None,
+    explain: bool = False,
+) -> None:
+    """
+    Подключить замер каждого запроса к движку
+
+    Время запроса учитывается в query_totals по маршруту и методу
+    репозитория и в статистике текущего HTTP-запроса. Запросы дольше slow_query_ms
+    пишутся в лог с методом и маршрутом, при explain=True — с планом.
+    """
+    sync_engine = db_engine.sync_engine
+    if sync_engine.dialect.name == "sqlite":
+        explain_prefix = "EXPLAIN QUERY PLAN "
+    else:
+        explain_prefix = "EXPLAIN "
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        duration = time.perf_counter() - conn.info["query_start"].pop()
+        method = current_repository_method.get() or UNTAGGED
+        request = current_request.get()
+        route = UNTAGGED
+        if request is not None:
+            request.queries.add(duration)
+            route = route_template(request.scope) or UNTAGGED
+        query_totals[(route, method)].add(duration)
+
+        if not slow_query_ms or duration * 1000 < slow_query_ms:
+            return
+
+        plan = None
+        if explain and not many and statement.lstrip().upper().startswith("SELECT"):
+            plan = _explain(conn, explain_prefix + statement, parameters)
+        logger.warning(
+            "Медленный запрос %.1f мс, метод=%s, маршрут=%s: %s%s",
+            duration * 1000,
+            method,
+            request.route if request is not None else UNTAGGED,
+            " ".join(statement.split()),
+            "\n" + "\n".join(plan) if plan else "",
+        )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+def _explain(conn, statement: str, parameters) -> Optional[List[str]]:
+    """План запроса через курсор DBAPI (без повторного срабатывания событий)"""
+    try:
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(statement, parameters)
+            return [" ".join(str(value) for value in row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception:
+        logger.debug("Не удалось получить план запроса", exc_info=True)
+        return None
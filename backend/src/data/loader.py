@@ -0,0 +1,118 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Ключ кэша загрузчика: (модель, ID)
+LoaderKey = Tuple[Type[Any], int]
+
+# Ключ блокировки в session.info
+SESSION_LOCK_KEY = "lock"
+
+
+def session_lock(session: AsyncSession) -> asyncio.Lock:
+    """
+    Общая блокировка сессии
+
+    AsyncSession нельзя использовать конкурентно (asyncpg падает с
+    "another operation is in progress"), поэтому загрузчик, репозитории
+    и Unit of Work выполняют запросы одной сессии под этой блокировкой.
+    """
+    lock = session.info.get(SESSION_LOCK_KEY)
+    if lock is None:
+        lock = session.info[SESSION_LOCK_KEY] = asyncio.Lock()
+    return lock
+
+
+class DataLoader:
+    """
+    Пакетный загрузчик сущностей по ID в рамках одного Unit of Work
+
+    Вызовы load(), сделанные в одном проходе цикла событий (например,
+    через asyncio.gather), собираются и выполняются одним запросом
+    WHERE id IN на каждую модель. Результаты, включая отсутствие
+    записи, кэшируются до commit/rollback/закрытия сессии.
+
+    Пакет выполняется отдельной задачей под блокировкой сессии
+    (session_lock), которую берут и запросы репозиториев, поэтому
+    сессия не используется конкурентно. ID, загрузка которых уже идет,
+    повторно не запрашиваются.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._cache: Dict[LoaderKey, Optional[Any]] = {}
+        self._pending: Dict[Type[Any], Dict[int, asyncio.Future]] = {}
+        self._in_flight: Dict[LoaderKey, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, model: Type[Any], id: int) -> Optional[Any]:
+        """Получить сущность по ID (None, если не найдена)"""
+        key = (model, id)
+        if key in self._cache:
+            return self._cache[key]
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            return await future
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.setdefault(model, {})
+        future = pending.get(id)
+        if future is None:
+            future = pending[id] = loop.create_future()
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._dispatch)
+        return await future
+
+    def prime(self, instance: Any) -> None:
+        """Положить в кэш уже загруженную или созданную сущность"""
+        self._cache[(type(instance), instance.id)] = instance
+
+    def forget(self, model: Type[Any], id: int) -> None:
+        """Убрать запись из кэша"""
+        self._cache.pop((model, id), None)
+
+    def clear(self) -> None:
+        """Сбросить кэш (после commit/rollback объекты могут устареть)"""
+        self._cache.clear()
+
+    def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        batches, self._pending = self._pending, {}
+        for model, futures in batches.items():
+            for id, future in futures.items():
+                self._in_flight[(model, id)] = future
+        task = asyncio.get_running_loop().create_task(self._load_batches(batches))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batches(
+        self, batches: Dict[Type[Any], Dict[int, asyncio.Future]]
+    ) -> None:
+        for model, futures in batches.items():
+            try:
+                instances = await self._fetch(model, list(futures))
+            except Exception as e:
+                for id, future in futures.items():
+                    self._in_flight.pop((model, id), None)
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            found = {instance.id: instance for instance in instances}
+            for id, future in futures.items():
+                instance = found.get(id)
+                self._cache[(model, id)] = instance
+                self._in_flight.pop((model, id), None)
+                if not future.done():
+                    future.set_result(instance)
+
+    async def _fetch(self, model: Type[Any], ids: List[int]) -> List[Any]:
+        query = select(model).where(model.id.in_(ids))
+        async with session_lock(self.session):
+            result = await self.session.execute(query)
+        return list(result.scalars().all())
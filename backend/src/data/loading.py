@@ -0,0 +1,50 @@
+"""
+Явная загрузка связей моделей
+
+Связи моделей объявлены с lazy="raise_on_sql": обращение к незагруженной
+связи, которое потребовало бы запроса, падает с InvalidRequestError.
+Связи загружаются только явно — профилями загрузки репозиториев
+(BaseRepository.loader_profiles), одним запросом на уровень связей.
+
+Строгий режим (DB_STRICT_LOADING, включен в тестах) проверяет каждый
+ORM-запрос сессий: ленивая загрузка связи, разрешенная в обход
+умолчания (опция lazyload() или lazy="select" у новой связи), тоже
+считается ошибкой.
+"""
+
+from typing import Type, Union
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+
+class UnplannedLoadError(RuntimeError):
+    """Ленивая загрузка связи, не запланированная профилем загрузки"""
+
+
+def _check_lazy_load(state: ORMExecuteState) -> None:
+    if not state.is_select:
+        return
+    source = state.lazy_loaded_from
+    if source is not None:
+        raise UnplannedLoadError(
+            f"Ленивая загрузка связи {source.class_.__name__}: "
+            "укажите профиль загрузки в запросе репозитория"
+        )
+
+
+def enable_strict_loading(target: Union[Session, Type[Session]] = Session) -> None:
+    """
+    Включить строгий режим для сессии или класса сессий
+
+    По умолчанию — для всех сессий процесса; у AsyncSession события
+    вешаются на sync_session (или sync_session_class).
+    """
+    if not event.contains(target, "do_orm_execute", _check_lazy_load):
+        event.listen(target, "do_orm_execute", _check_lazy_load)
+
+
+def disable_strict_loading(target: Union[Session, Type[Session]] = Session) -> None:
+    """Выключить строгий режим"""
+    if event.contains(target, "do_orm_execute", _check_lazy_load):
+        event.remove(target, "do_orm_execute", _check_lazy_load)
@@ -2,8 +2,13 @@ from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, Enum, In
 from sqlalchemy.orm import declarative_base, relationship
 import enum
 
+from src.data.search import attach_search_ddl
+
 Base = declarative_base()
 
+# Связи не загружаются неявно (lazy="raise_on_sql"): запросы указывают
+# профиль загрузки репозитория, см. src/data/loading.py
+
 class GenderEnum(enum.Enum):
     """Пол лошади"""
     STALLION = "жеребец"
@@ -19,9 +24,20 @@ class Race(Base):
     time = Column(Time, nullable=False)
     hippodrome = Column(String(200), nullable=False)
     name = Column(String(200), nullable=True)
+    # Версия для ETag: увеличивается при изменении списка участников
+    revision = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
-    participants = relationship("RaceParticipant", back_populates="race", lazy="selectin")
+    participants = relationship(
+        "RaceParticipant", back_populates="race", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        # Индекс для keyset-пагинации по (date, id)
+        Index('idx_race_date_id', 'date', 'id'),
+        # Календарь ипподрома: диапазон дат по одному ипподрому
+        Index('idx_race_hippodrome_date', 'hippodrome', 'date'),
+    )
 
 class Jockey(Base):
     """Таблица жокеев"""
@@ -32,9 +48,13 @@ class Jockey(Base):
     address = Column(String(500), nullable=False)
     age = Column(Integer, nullable=False)
     rating = Column(Integer, nullable=False)
+    # Версия для ETag: увеличивается при новом участии в состязании
+    revision = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
-    participations = relationship("RaceParticipant", back_populates="jockey")
+    participations = relationship(
+        "RaceParticipant", back_populates="jockey", lazy="raise_on_sql"
+    )
 
 class Owner(Base):
     """Таблица владельцев"""
@@ -46,7 +66,7 @@ class Owner(Base):
     phone = Column(String(20), nullable=False)
 
     # Relationships
-    horses = relationship("Horse", back_populates="owner")
+    horses = relationship("Horse", back_populates="owner", lazy="raise_on_sql")
 
 class Horse(Base):
     """Таблица лошадей"""
@@ -57,10 +77,14 @@ class Horse(Base):
     gender = Column(Enum(GenderEnum), nullable=False)
     age = Column(Integer, nullable=False)
     owner_id = Column(Integer, ForeignKey("owners.id"), nullable=False)
+    # Версия для ETag: увеличивается при новом участии в состязании
+    revision = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
-    owner = relationship("Owner", back_populates="horses")
-    participations = relationship("RaceParticipant", back_populates="horse")
+    owner = relationship("Owner", back_populates="horses", lazy="raise_on_sql")
+    participations = relationship(
+        "RaceParticipant", back_populates="horse", lazy="raise_on_sql"
+    )
 
 class RaceParticipant(Base):
     """
@@ -77,13 +101,50 @@ class RaceParticipant(Base):
     time_result = Column(Time, nullable=True)  # Время прохождения
 
     # Relationships
-    race = relationship("Race", back_populates="participants")
-    jockey = relationship("Jockey", back_populates="participations", lazy="selectin")
-    horse = relationship("Horse", back_populates="participations", lazy="selectin")
+    race = relationship("Race", back_populates="participants", lazy="raise_on_sql")
+    jockey = relationship(
+        "Jockey", back_populates="participations", lazy="raise_on_sql"
+    )
+    horse = relationship(
+        "Horse", back_populates="participations", lazy="raise_on_sql"
+    )
 
     # Индексы для быстрого поиска
     __table_args__ = (
         Index('idx_race_place', 'race_id', 'place'),
         Index('idx_jockey_races', 'jockey_id'),
         Index('idx_horse_races', 'horse_id'),
+        # Пара жокей-лошадь регистрируется в состязании один раз
+        Index('uq_race_pair', 'race_id', 'jockey_id', 'horse_id', unique=True),
     )
+
+class LeaderboardEntry(Base):
+    """
+    Сводная таблица рейтинга жокеев и лошадей
+    Обновляется в той же транзакции, что и добавление результатов
+    """
+    __tablename__ = "leaderboard"
+
+    id = Column(Integer, primary_key=True)
+    entity_type = Column(String(10), nullable=False)  # jockey | horse
+    entity_id = Column(Integer, nullable=False)
+    starts = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    podiums = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('uq_leaderboard_entity', 'entity_type', 'entity_id', unique=True),
+    )
+
+
+# Индекс для рейтинга: победы, затем призовые места по убыванию
+Index(
+    'idx_leaderboard_rank',
+    LeaderboardEntry.entity_type,
+    LeaderboardEntry.wins.desc(),
+    LeaderboardEntry.podiums.desc(),
+    LeaderboardEntry.entity_id,
+)
+
+# Поиск по лошадям, жокеям и владельцам: FTS5 (SQLite) или pg_trgm (Postgres)
+attach_search_ddl(Base.metadata)
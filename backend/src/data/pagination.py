@@ -0,0 +1,87 @@
+import base64
+import datetime
+import json
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# Ключ keyset-пагинации: (колонка, сортировка по убыванию)
+KeysetKey = Tuple[Any, bool]
+
+
+def encode_cursor(values: Sequence[Any], sort: Optional[str] = None) -> str:
+    """
+    Закодировать значения ключа последней записи в непрозрачный курсор
+
+    sort — имя сортировки, если у списка их несколько: курсор запоминает
+    ее, чтобы его нельзя было применить к другой сортировке того же вида.
+    """
+    key = [v.isoformat() if isinstance(v, datetime.date) else v for v in values]
+    payload: Any = key if sort is None else {"sort": sort, "key": key}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, keys: Sequence[KeysetKey], sort: Optional[str] = None
+) -> List[Any]:
+    """
+    Раскодировать курсор в значения ключа
+
+    Raises:
+        ValueError: Если курсор поврежден, не подходит к ключу или
+            получен с другой сортировкой
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Некорректный курсор пагинации")
+
+    if sort is not None:
+        if not isinstance(payload, dict) or "key" not in payload:
+            raise ValueError("Некорректный курсор пагинации")
+        if payload.get("sort") != sort:
+            raise ValueError("Курсор получен с другой сортировкой")
+        payload = payload["key"]
+
+    if not isinstance(payload, list) or len(payload) != len(keys):
+        raise ValueError("Некорректный курсор пагинации")
+
+    values = []
+    for (column, _), value in zip(keys, payload):
+        python_type = column.type.python_type
+        try:
+            if python_type is datetime.date:
+                value = datetime.date.fromisoformat(value)
+            elif python_type is datetime.time:
+                value = datetime.time.fromisoformat(value)
+            else:
+                value = python_type(value)
+        except (TypeError, ValueError):
+            raise ValueError("Некорректный курсор пагинации")
+        values.append(value)
+    return values
+
+
+def keyset_condition(
+    keys: Sequence[KeysetKey], values: Sequence[Any]
+) -> ColumnElement[bool]:
+    """
+    Условие "строго после" для составного ключа
+
+    Разворачивает (a, b) > (x, y) в a > x OR (a = x AND b > y), что
+    позволяет смешивать направления сортировки и использовать индекс.
+    """
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        prefix = [keys[j][0] == values[j] for j in range(i)]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*prefix, step))
+    return or_(*clauses)
+
+
+def keyset_order_by(keys: Sequence[KeysetKey]) -> list:
+    """ORDER BY для ключа keyset-пагинации"""
+    return [column.desc() if descending else column.asc() for column, descending in keys]
@@ -0,0 +1,91 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Literal, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+ReplicaStrategy = Literal["round_robin", "least_connections"]
+
+# Сколько клиентов хранить до очистки истекших окон read-your-writes
+STICKY_PRUNE_SIZE = 10_000
+
+
+class ReplicaPool:
+    """
+    Пул реплик БД только для чтения
+
+    Реплика выбирается по кругу (round_robin) или с наименьшим числом
+    открытых сессий (least_connections). Клиент, недавно выполнивший
+    запись, в течение sticky_seconds читает с основной БД, чтобы видеть
+    свои изменения несмотря на отставание репликации.
+
+    Окна read-your-writes хранятся в памяти процесса: при нескольких
+    воркерах липкость действует в пределах воркера, принявшего запись.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        strategy: ReplicaStrategy = "round_robin",
+        sticky_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not engines:
+            raise ValueError("Пул реплик не может быть пустым")
+        self.engines: List[AsyncEngine] = list(engines)
+        self.strategy = strategy
+        self.sticky_seconds = sticky_seconds
+        self._clock = clock
+        self._session_makers = [
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            for engine in self.engines
+        ]
+        self._in_use = [0] * len(self.engines)
+        self._next = 0
+        self._sticky_until: Dict[str, float] = {}
+
+    def _choose(self) -> int:
+        if self.strategy == "least_connections":
+            return min(range(len(self.engines)), key=self._in_use.__getitem__)
+        index = self._next
+        self._next = (index + 1) % len(self.engines)
+        return index
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Открыть сессию на выбранной реплике"""
+        index = self._choose()
+        self._in_use[index] += 1
+        try:
+            async with self._session_makers[index]() as session:
+                yield session
+        finally:
+            self._in_use[index] -= 1
+
+    def mark_write(self, client: str) -> None:
+        """Запомнить запись клиента: его чтения временно идут на основную БД"""
+        now = self._clock()
+        if len(self._sticky_until) >= STICKY_PRUNE_SIZE:
+            self._sticky_until = {
+                key: until for key, until in self._sticky_until.items() if until > now
+            }
+        self._sticky_until[client] = now + self.sticky_seconds
+
+    def is_sticky(self, client: str) -> bool:
+        """Должен ли клиент читать с основной БД"""
+        until = self._sticky_until.get(client)
+        if until is None:
+            return False
+        if until <= self._clock():
+            del self._sticky_until[client]
+            return False
+        return True
+
+    def in_use(self) -> List[int]:
+        """Число открытых сессий на каждой реплике"""
+        return list(self._in_use)
+
+    async def dispose(self) -> None:
+        """Закрыть пулы соединений реплик"""
+        for engine in self.engines:
+            await engine.dispose()
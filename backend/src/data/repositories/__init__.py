@@ -1,9 +1,11 @@
 from src.data.repositories.base import BaseRepository
 from src.data.repositories.horse_repository import HorseRepository
 from src.data.repositories.jockey_repository import JockeyRepository
+from src.data.repositories.leaderboard_repository import LeaderboardRepository
 from src.data.repositories.owner_repository import OwnerRepository
 from src.data.repositories.participant_repository import ParticipantRepository
 from src.data.repositories.race_repository import RaceRepository
+from src.data.repositories.search_repository import SearchRepository
 
 __all__ = [
     "BaseRepository",
@@ -12,4 +14,6 @@ __all__ = [
     "HorseRepository",
     "OwnerRepository",
     "ParticipantRepository",
+    "LeaderboardRepository",
+    "SearchRepository",
 ]
@@ -1,40 +1,323 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from sqlalchemy import select
+from sqlalchemy import Result, Row, Select, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
+
+from src.config import settings
+from src.data.instrumentation import tag_repository_methods
+from src.data.loader import DataLoader, session_lock
+from src.data.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    keyset_order_by,
+)
 
 ModelType = TypeVar("ModelType")
 
+# Конструкторы INSERT с ON CONFLICT по диалектам; другие СУБД отклоняются
+# при старте (database.check_dialect)
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 
 class BaseRepository(Generic[ModelType]):
     """Базовый репозиторий с CRUD операциями"""
 
+    # Колонки keyset-пагинации: (имя колонки, по убыванию)
+    keyset_order: Sequence[Tuple[str, bool]] = (("id", False),)
+
+    # Профили загрузки связей: имя -> опции запроса (selectinload, joinedload).
+    # Без профиля связи не загружаются (lazy="raise_on_sql")
+    loader_profiles: Dict[str, Sequence[ORMOption]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Запросы помечаются методом репозитория для журнала и метрик
+        tag_repository_methods(cls)
+
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
+        # Пакетный загрузчик Unit of Work; без него get_by_id идет напрямую
+        self.loader: Optional[DataLoader] = None
+
+    @property
+    def use_insert_returning(self) -> bool:
+        """Получать значения, сгенерированные сервером, через INSERT ... RETURNING"""
+        dialect = self.session.bind.dialect
+        return settings.db_use_returning and dialect.insert_returning
+
+    @property
+    def use_update_returning(self) -> bool:
+        """Обновлять запись одним UPDATE ... RETURNING"""
+        dialect = self.session.bind.dialect
+        return settings.db_use_returning and dialect.update_returning
 
     async def create(self, data: Dict[str, Any]) -> ModelType:
-        """Создать новую запись"""
+        """
+        Создать новую запись
+
+        ORM выполняет INSERT ... RETURNING и сразу получает ID и
+        серверные значения по умолчанию, поэтому refresh нужен только
+        для диалектов без RETURNING (или при DB_USE_RETURNING=false).
+        """
         instance = self.model(**data)
-        self.session.add(instance)
-        await self.session.flush()
-        await self.session.refresh(instance)
+        async with self._exclusive():
+            self.session.add(instance)
+            await self.session.flush()
+            if not self.use_insert_returning:
+                await self.session.refresh(instance)
+        if self.loader is not None:
+            self.loader.prime(instance)
         return instance
 
-    async def get_by_id(self, id: int) -> Optional[ModelType]:
-        """Получить запись по ID"""
-        query = select(self.model).where(self.model.id == id)
-        result = await self.session.execute(query)
+    async def create_many(
+        self, rows: Sequence[Dict[str, Any]], chunk_size: Optional[int] = None
+    ) -> List[Row]:
+        """
+        Создать записи многострочными INSERT ... RETURNING
+
+        Строки вставляются пачками по chunk_size (по умолчанию
+        DB_BULK_CHUNK_SIZE) в текущей транзакции. Возвращает строки
+        таблицы (а не ORM-объекты), чтобы не запускать загрузку связей;
+        порядок строк не гарантируется.
+        """
+        chunk_size = chunk_size or settings.db_bulk_chunk_size
+        query = insert(self.model).returning(*self.model.__table__.c)
+        created: List[Row] = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = list(rows[start : start + chunk_size])
+            result = await self._execute(query, chunk)
+            created.extend(result.all())
+        return created
+
+    async def get_by_id(
+        self, id: int, load: Optional[str] = None
+    ) -> Optional[ModelType]:
+        """
+        Получить запись по ID
+
+        Без профиля загрузки load — через загрузчик Unit of Work, если он
+        есть; с профилем — отдельным запросом вместе со связями.
+        """
+        if load is None and self.loader is not None:
+            return await self.loader.load(self.model, id)
+        query = self._load(select(self.model).where(self.model.id == id), load)
+        result = await self._execute(query)
         return result.scalar_one_or_none()
 
-    async def list(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        """Получить список записей"""
-        query = select(self.model).offset(skip).limit(limit)
-        result = await self.session.execute(query)
+    async def get_many(
+        self, ids: Sequence[int], load: Optional[str] = None
+    ) -> List[ModelType]:
+        """
+        Получить записи по списку ID одним запросом WHERE id IN
+
+        Записи возвращаются в порядке ids (повторы схлопываются),
+        отсутствующие ID пропускаются.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        query = self._load(select(self.model).where(self.model.id.in_(ids)), load)
+        result = await self._execute(query)
+        found = {instance.id: instance for instance in result.scalars().all()}
+        return [found[id] for id in ids if id in found]
+
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        """Какие из указанных ID существуют (один запрос WHERE id IN)"""
+        ids = set(ids)
+        if not ids:
+            return set()
+        query = select(self.model.id).where(self.model.id.in_(ids))
+        result = await self._execute(query)
+        return set(result.scalars().all())
+
+    async def list(
+        self, skip: int = 0, limit: int = 100, load: Optional[str] = None
+    ) -> List[ModelType]:
+        """Получить список записей (связи — по профилю загрузки load)"""
+        query = self._load(select(self.model), load).offset(skip).limit(limit)
+        result = await self._execute(query)
         return list(result.scalars().all())
 
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        load: Optional[str] = None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        Получить страницу записей по курсору (keyset-пагинация)
+
+        Стоимость запроса не зависит от глубины страницы: вместо OFFSET
+        используется условие по ключу последней записи предыдущей страницы.
+
+        Returns:
+            Кортеж (записи, курсор следующей страницы или None)
+
+        Raises:
+            ValueError: Если курсор, limit или профиль загрузки некорректны
+        """
+        return await self._paginate(self._load(select(self.model), load), cursor, limit)
+
+    async def list_rows(
+        self, fields: Optional[Sequence[str]] = None, skip: int = 0, limit: int = 100
+    ) -> List[Row]:
+        """
+        Получить список записей проекцией колонок
+
+        Выбираются только колонки fields (по умолчанию все колонки таблицы),
+        без ORM-объектов, поэтому связи не загружаются.
+
+        Raises:
+            ValueError: Если поле не является колонкой таблицы
+        """
+        query = self._projection(fields).offset(skip).limit(limit)
+        result = await self._execute(query)
+        return list(result.all())
+
+    async def list_rows_page(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        Получить страницу записей проекцией колонок (keyset-пагинация)
+
+        Колонки ключа пагинации добавляются к fields, если их там нет.
+
+        Raises:
+            ValueError: Если поле, курсор или limit некорректны
+        """
+        query = self._projection(fields, self.keyset_order)
+        return await self._paginate(query, cursor, limit, scalars=False)
+
+    def _load(self, query: Select, profile: Optional[str]) -> Select:
+        """
+        Применить профиль загрузки связей к запросу сущностей
+
+        Raises:
+            ValueError: Если профиль не объявлен в loader_profiles
+        """
+        if profile is None:
+            return query
+        try:
+            options = self.loader_profiles[profile]
+        except KeyError:
+            raise ValueError(f"Неизвестный профиль загрузки: {profile}")
+        return query.options(*options)
+
+    def _projection(
+        self,
+        fields: Optional[Sequence[str]],
+        order: Sequence[Tuple[str, bool]] = (),
+    ) -> Select:
+        """SELECT колонок fields и колонок ключа сортировки order"""
+        columns = self.model.__table__.columns
+        if fields is None:
+            names = list(columns.keys())
+        else:
+            unknown = [name for name in fields if name not in columns]
+            if unknown:
+                raise ValueError(f"Неизвестные поля: {', '.join(unknown)}")
+            names = list(dict.fromkeys(fields))
+        names += [name for name, _ in order if name not in names]
+        return select(*(columns[name] for name in names))
+
+    async def _paginate(
+        self,
+        query: Select,
+        cursor: Optional[str],
+        limit: int,
+        order: Optional[Sequence[Tuple[str, bool]]] = None,
+        scalars: bool = True,
+        sort: Optional[str] = None,
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Применить keyset-пагинацию к запросу
+
+        Args:
+            query: Базовый SELECT (сущности или строки с колонками ключа)
+            cursor: Курсор предыдущей страницы
+            limit: Размер страницы
+            order: Ключ сортировки, по умолчанию keyset_order репозитория
+            scalars: Вернуть сущности (True) или строки (False)
+            sort: Имя сортировки, записываемое в курсор и сверяемое с ним
+        """
+        if limit < 1:
+            raise ValueError("limit должен быть положительным")
+
+        order = order or self.keyset_order
+        keys = [(getattr(self.model, name), desc) for name, desc in order]
+        query = query.order_by(*keyset_order_by(keys)).limit(limit + 1)
+        if cursor:
+            values = decode_cursor(cursor, keys, sort)
+            query = query.where(keyset_condition(keys, values))
+
+        result = await self._execute(query)
+        items = list(result.scalars().all() if scalars else result.all())
+        if len(items) <= limit:
+            return items, None
+
+        items = items[:limit]
+        last = items[-1]
+        return items, encode_cursor([getattr(last, name) for name, _ in order], sort)
+
+    async def get_revision(self, id: int) -> Optional[int]:
+        """Получить версию записи (только для моделей с колонкой revision)"""
+        query = select(self.model.revision).where(self.model.id == id)
+        result = await self._execute(query)
+        return result.scalar_one_or_none()
+
+    async def bump_revision(self, ids: Iterable[int]) -> None:
+        """Увеличить версию записей одним UPDATE"""
+        ids = set(ids)
+        if not ids:
+            return
+        query = (
+            update(self.model)
+            .where(self.model.id.in_(ids))
+            .values(revision=self.model.revision + 1)
+            .execution_options(synchronize_session=False)
+        )
+        await self._execute(query)
+
     async def update(self, id: int, data: Dict[str, Any]) -> Optional[ModelType]:
-        """Обновить запись"""
+        """
+        Обновить запись
+
+        Одним UPDATE ... RETURNING, который заодно обновляет объект в
+        identity map; без RETURNING — выборка, flush и refresh.
+        """
+        if self.use_update_returning:
+            query = (
+                update(self.model)
+                .where(self.model.id == id)
+                .values(**data)
+                .returning(self.model)
+            )
+            result = await self._execute(query)
+            instance = result.scalar_one_or_none()
+            if instance is not None and self.loader is not None:
+                self.loader.prime(instance)
+            return instance
+
         instance = await self.get_by_id(id)
         if not instance:
             return None
@@ -42,8 +325,9 @@ class BaseRepository(Generic[ModelType]):
         for key, value in data.items():
             setattr(instance, key, value)
 
-        await self.session.flush()
-        await self.session.refresh(instance)
+        async with self._exclusive():
+            await self.session.flush()
+            await self.session.refresh(instance)
         return instance
 
     async def delete(self, id: int) -> bool:
@@ -52,6 +336,33 @@ class BaseRepository(Generic[ModelType]):
         if not instance:
             return False
 
-        await self.session.delete(instance)
-        await self.session.flush()
+        async with self._exclusive():
+            await self.session.delete(instance)
+            await self.session.flush()
+        if self.loader is not None:
+            self.loader.forget(self.model, id)
         return True
+
+    def _exclusive(self) -> asyncio.Lock:
+        """Блокировка сессии, общая с загрузчиком и другими репозиториями"""
+        return session_lock(self.session)
+
+    async def _execute(self, statement: Any, params: Any = None) -> Result:
+        """Выполнить запрос под блокировкой сессии"""
+        async with self._exclusive():
+            return await self.session.execute(statement, params)
+
+    def _upsert_insert(self):
+        """
+        INSERT с поддержкой ON CONFLICT для текущего диалекта
+
+        Raises:
+            RuntimeError: Если СУБД не поддерживается
+        """
+        dialect = self.session.bind.dialect.name
+        if dialect not in UPSERT_INSERTS:
+            raise RuntimeError(f"СУБД {dialect} не поддерживается")
+        return UPSERT_INSERTS[dialect](self.model)
+
+
+tag_repository_methods(BaseRepository)
@@ -1,4 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from src.data.models import Horse
 from src.data.repositories.base import BaseRepository
@@ -7,5 +8,7 @@ from src.data.repositories.base import BaseRepository
 class HorseRepository(BaseRepository[Horse]):
     """Репозиторий для работы с лошадьми"""
 
+    loader_profiles = {"owner": (joinedload(Horse.owner),)}
+
     def __init__(self, session: AsyncSession):
         super().__init__(Horse, session)
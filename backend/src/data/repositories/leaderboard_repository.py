@@ -0,0 +1,100 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Row, case, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data.models import Horse, Jockey, LeaderboardEntry, RaceParticipant
+from src.data.repositories.base import BaseRepository
+
+ENTITY_NAMES = {
+    "jockey": Jockey.name,
+    "horse": Horse.nickname,
+}
+
+
+class LeaderboardRepository(BaseRepository[LeaderboardEntry]):
+    """Репозиторий сводной таблицы рейтинга"""
+
+    keyset_order = (("wins", True), ("podiums", True), ("entity_id", False))
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(LeaderboardEntry, session)
+
+    async def record_results(self, results: Iterable[Tuple[int, int, int]]) -> None:
+        """
+        Учесть новые результаты одним UPSERT
+
+        Args:
+            results: Кортежи (jockey_id, horse_id, place)
+        """
+        totals: Dict[Tuple[str, int], List[int]] = defaultdict(lambda: [0, 0, 0])
+        for jockey_id, horse_id, place in results:
+            for key in (("jockey", jockey_id), ("horse", horse_id)):
+                total = totals[key]
+                total[0] += 1
+                total[1] += place == 1
+                total[2] += place <= 3
+        if not totals:
+            return
+
+        rows = [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "starts": starts,
+                "wins": wins,
+                "podiums": podiums,
+            }
+            for (entity_type, entity_id), (starts, wins, podiums) in totals.items()
+        ]
+        query = self._upsert_insert().values(rows)
+        query = query.on_conflict_do_update(
+            index_elements=["entity_type", "entity_id"],
+            set_={
+                "starts": LeaderboardEntry.starts + query.excluded.starts,
+                "wins": LeaderboardEntry.wins + query.excluded.wins,
+                "podiums": LeaderboardEntry.podiums + query.excluded.podiums,
+            },
+        )
+        await self._execute(query)
+
+    async def list_ranking(
+        self, entity_type: str, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[Row], Optional[str]]:
+        """Страница рейтинга (индекс idx_leaderboard_rank)"""
+        name = ENTITY_NAMES[entity_type]
+        entity = name.class_
+        query = (
+            select(
+                LeaderboardEntry.entity_id,
+                name.label("name"),
+                LeaderboardEntry.starts,
+                LeaderboardEntry.wins,
+                LeaderboardEntry.podiums,
+            )
+            .join(entity, entity.id == LeaderboardEntry.entity_id)
+            .where(LeaderboardEntry.entity_type == entity_type)
+        )
+        return await self._paginate(query, cursor, limit, scalars=False)
+
+    async def rebuild(self) -> None:
+        """Пересчитать таблицу целиком из race_participants"""
+        await self._execute(delete(LeaderboardEntry))
+        for entity_type, column in (
+            ("jockey", RaceParticipant.jockey_id),
+            ("horse", RaceParticipant.horse_id),
+        ):
+            aggregate = select(
+                literal(entity_type),
+                column,
+                func.count(RaceParticipant.id),
+                func.sum(case((RaceParticipant.place == 1, 1), else_=0)),
+                func.sum(case((RaceParticipant.place <= 3, 1), else_=0)),
+            ).group_by(column)
+            await self._execute(
+                insert(LeaderboardEntry).from_select(
+                    ["entity_type", "entity_id", "starts", "wins", "podiums"],
+                    aggregate,
+                )
+            )
@@ -1,4 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.data.models import Owner
 from src.data.repositories.base import BaseRepository
@@ -7,5 +8,7 @@ from src.data.repositories.base import BaseRepository
 class OwnerRepository(BaseRepository[Owner]):
     """Репозиторий для работы с владельцами"""
 
+    loader_profiles = {"horses": (selectinload(Owner.horses),)}
+
     def __init__(self, session: AsyncSession):
         super().__init__(Owner, session)
@@ -1,24 +1,43 @@
-from typing import List, Optional
+import datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import and_, select
+from sqlalchemy import Row, RowMapping, and_, case, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from src.data.models import RaceParticipant
+from src.config import settings
+from src.data.models import Horse, Jockey, Race, RaceParticipant
 from src.data.repositories.base import BaseRepository
 
 
 class ParticipantRepository(BaseRepository[RaceParticipant]):
     """Репозиторий для работы с участниками"""
 
+    loader_profiles = {
+        # Жокей и лошадь участника в том же запросе (many-to-one, JOIN)
+        "pair": (
+            joinedload(RaceParticipant.jockey),
+            joinedload(RaceParticipant.horse),
+        ),
+        "race": (joinedload(RaceParticipant.race),),
+    }
+
     def __init__(self, session: AsyncSession):
         super().__init__(RaceParticipant, session)
 
     async def get_by_race_id(
         self, race_id: int, with_relations: bool = False
     ) -> List[RaceParticipant]:
-        """Получить всех участников состязания"""
-        query = select(RaceParticipant).where(RaceParticipant.race_id == race_id)
-        result = await self.session.execute(query)
+        """
+        Получить всех участников состязания
+
+        with_relations=True — вместе с жокеями и лошадьми (профиль "pair")
+        """
+        query = self._load(
+            select(RaceParticipant).where(RaceParticipant.race_id == race_id),
+            "pair" if with_relations else None,
+        )
+        result = await self._execute(query)
         return list(result.scalars().all())
 
     async def get_by_race_and_pair(
@@ -32,5 +51,131 @@ class ParticipantRepository(BaseRepository[RaceParticipant]):
                 RaceParticipant.horse_id == horse_id,
             )
         )
-        result = await self.session.execute(query)
+        result = await self._execute(query)
         return result.scalar_one_or_none()
+
+    async def check_references(
+        self, race_id: int, jockey_id: int, horse_id: int
+    ) -> RowMapping:
+        """
+        Проверить ссылки нового участника одним SELECT из EXISTS-подзапросов
+
+        Returns:
+            Строка с флагами race_exists, jockey_exists, horse_exists
+        """
+        query = select(
+            exists().where(Race.id == race_id).label("race_exists"),
+            exists().where(Jockey.id == jockey_id).label("jockey_exists"),
+            exists().where(Horse.id == horse_id).label("horse_exists"),
+        )
+        result = await self._execute(query)
+        return result.mappings().one()
+
+    async def create_unique(self, data: Dict[str, Any]) -> Optional[Row]:
+        """
+        Добавить участника, если пара еще не зарегистрирована в состязании
+
+        INSERT ... ON CONFLICT DO NOTHING RETURNING по индексу uq_race_pair:
+        проверка дубликата и вставка — один запрос без гонки между ними.
+
+        Returns:
+            Строка таблицы или None, если пара уже зарегистрирована
+        """
+        result = await self._execute(self._insert_unique().values(**data))
+        return result.one_or_none()
+
+    async def create_many_unique(
+        self, rows: Sequence[Dict[str, Any]], chunk_size: Optional[int] = None
+    ) -> List[Row]:
+        """
+        Добавить участников, пропуская пары, уже зарегистрированные в состязании
+
+        Многострочный INSERT ... ON CONFLICT DO NOTHING RETURNING пачками
+        по chunk_size (по умолчанию DB_BULK_CHUNK_SIZE). Пара, которую
+        параллельно успел вставить другой запрос, не попадает в результат.
+
+        Returns:
+            Строки вставленных участников (порядок не гарантируется)
+        """
+        chunk_size = chunk_size or settings.db_bulk_chunk_size
+        created: List[Row] = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = list(rows[start : start + chunk_size])
+            result = await self._execute(self._insert_unique().values(chunk))
+            created.extend(result.all())
+        return created
+
+    def _insert_unique(self):
+        """INSERT участника без ошибки при повторе пары (индекс uq_race_pair)"""
+        query = self._upsert_insert()
+        return query.on_conflict_do_nothing(
+            index_elements=[
+                RaceParticipant.race_id,
+                RaceParticipant.jockey_id,
+                RaceParticipant.horse_id,
+            ]
+        ).returning(*RaceParticipant.__table__.c)
+
+    async def get_pairs_by_race(self, race_id: int) -> Set[Tuple[int, int]]:
+        """Пары (jockey_id, horse_id), уже зарегистрированные в состязании"""
+        query = select(RaceParticipant.jockey_id, RaceParticipant.horse_id).where(
+            RaceParticipant.race_id == race_id
+        )
+        result = await self._execute(query)
+        return {(row.jockey_id, row.horse_id) for row in result}
+
+    async def get_jockey_stats(
+        self,
+        jockey_id: int,
+        date_from: Optional[datetime.date] = None,
+        date_to: Optional[datetime.date] = None,
+    ) -> Optional[RowMapping]:
+        """Статистика выступлений жокея (индекс idx_jockey_races)"""
+        return await self._get_stats(
+            RaceParticipant.jockey_id, jockey_id, date_from, date_to
+        )
+
+    async def get_horse_stats(
+        self,
+        horse_id: int,
+        date_from: Optional[datetime.date] = None,
+        date_to: Optional[datetime.date] = None,
+    ) -> Optional[RowMapping]:
+        """Статистика выступлений лошади (индекс idx_horse_races)"""
+        return await self._get_stats(
+            RaceParticipant.horse_id, horse_id, date_from, date_to
+        )
+
+    async def _get_stats(
+        self,
+        key_column,
+        key: int,
+        date_from: Optional[datetime.date],
+        date_to: Optional[datetime.date],
+    ) -> Optional[RowMapping]:
+        """
+        Агрегация GROUP BY по участиям: старты, победы, призовые места,
+        среднее место и лучшее время. None — если участий нет.
+        """
+        query = (
+            select(
+                func.count(RaceParticipant.id).label("starts"),
+                func.sum(case((RaceParticipant.place == 1, 1), else_=0)).label("wins"),
+                func.sum(case((RaceParticipant.place <= 3, 1), else_=0)).label(
+                    "podiums"
+                ),
+                func.avg(RaceParticipant.place).label("mean_place"),
+                func.min(RaceParticipant.time_result).label("best_time"),
+            )
+            .where(key_column == key)
+            .group_by(key_column)
+        )
+        if date_from is not None or date_to is not None:
+            query = query.join(Race, Race.id == RaceParticipant.race_id)
+            if date_from is not None:
+                query = query.where(Race.date >= date_from)
+            if date_to is not None:
+                query = query.where(Race.date <= date_to)
+
+        result = await self._execute(query)
+        return result.mappings().one_or_none()
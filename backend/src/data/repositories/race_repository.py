@@ -1,19 +1,131 @@
-from typing import List, Optional
+import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import Row, RowMapping, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from src.data.models import Race, RaceParticipant
+from src.data.models import Horse, Jockey, Race, RaceParticipant
+from src.data.pagination import keyset_order_by
 from src.data.repositories.base import BaseRepository
 
 
 class RaceRepository(BaseRepository[Race]):
     """Репозиторий для работы с состязаниями"""
 
+    keyset_order = (("date", False), ("id", False))
+
+    # Варианты сортировки списка: ключи keyset-пагинации
+    sort_orders: Dict[str, Sequence[Tuple[str, bool]]] = {
+        "date": (("date", False), ("id", False)),
+        "-date": (("date", True), ("id", True)),
+        "hippodrome": (("hippodrome", False), ("date", False), ("id", False)),
+    }
+
+    loader_profiles = {
+        # Участники без жокеев и лошадей
+        "participants": (selectinload(Race.participants),),
+        # Участники с жокеями и лошадьми: два запроса на любое число состязаний
+        "standings": (
+            selectinload(Race.participants).options(
+                joinedload(RaceParticipant.jockey),
+                joinedload(RaceParticipant.horse),
+            ),
+        ),
+    }
+
     def __init__(self, session: AsyncSession):
         super().__init__(Race, session)
 
+    async def list_rows(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        skip: int = 0,
+        limit: int = 100,
+        date_from: Optional[datetime.date] = None,
+        date_to: Optional[datetime.date] = None,
+        hippodrome: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> List[Row]:
+        """
+        Получить список состязаний по фильтрам проекцией колонок (OFFSET)
+
+        Без ORM-объектов: только выбранные колонки.
+        """
+        order = self._order(sort) if sort is not None else ()
+        query = self._filter(
+            self._projection(fields, order),
+            date_from,
+            date_to,
+            hippodrome,
+            name_prefix,
+        )
+        if order:
+            keys = [(getattr(Race, name), desc) for name, desc in order]
+            query = query.order_by(*keyset_order_by(keys))
+        result = await self._execute(query.offset(skip).limit(limit))
+        return list(result.all())
+
+    async def list_rows_page(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        date_from: Optional[datetime.date] = None,
+        date_to: Optional[datetime.date] = None,
+        hippodrome: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        sort: str = "date",
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        Страница состязаний по фильтрам проекцией колонок (keyset-пагинация)
+
+        Один узкий запрос без загрузки участников. Фильтр по ипподрому и
+        диапазону дат читается диапазоном индекса idx_race_hippodrome_date,
+        по одним датам — idx_race_date_id. Курсор действителен только с
+        теми же фильтрами; сортировка записана в курсоре и сверяется.
+
+        Raises:
+            ValueError: Если поле, сортировка, курсор или limit некорректны
+        """
+        order = self._order(sort)
+        query = self._filter(
+            self._projection(fields, order),
+            date_from,
+            date_to,
+            hippodrome,
+            name_prefix,
+        )
+        return await self._paginate(
+            query, cursor, limit, order=order, scalars=False, sort=sort
+        )
+
+    def _order(self, sort: str) -> Sequence[Tuple[str, bool]]:
+        try:
+            return self.sort_orders[sort]
+        except KeyError:
+            raise ValueError(f"Неизвестная сортировка: {sort}")
+
+    @staticmethod
+    def _filter(
+        query: Select,
+        date_from: Optional[datetime.date],
+        date_to: Optional[datetime.date],
+        hippodrome: Optional[str],
+        name_prefix: Optional[str],
+    ) -> Select:
+        """Условия фильтров списка; границы дат включаются"""
+        if date_from is not None:
+            query = query.where(Race.date >= date_from)
+        if date_to is not None:
+            query = query.where(Race.date <= date_to)
+        if hippodrome is not None:
+            query = query.where(Race.hippodrome == hippodrome)
+        if name_prefix:
+            query = query.where(Race.name.startswith(name_prefix, autoescape=True))
+        return query
+
     async def get_by_jockey_id(self, jockey_id: int) -> List[Race]:
         """
         Получить все состязания, в которых участвовал жокей
@@ -25,7 +137,7 @@ class RaceRepository(BaseRepository[Race]):
             .where(RaceParticipant.jockey_id == jockey_id)
             .order_by(Race.date.desc())
         )
-        result = await self.session.execute(query)
+        result = await self._execute(query)
         return list(result.scalars().unique().all())
 
     async def get_by_horse_id(self, horse_id: int) -> List[Race]:
@@ -39,7 +151,7 @@ class RaceRepository(BaseRepository[Race]):
             .where(RaceParticipant.horse_id == horse_id)
             .order_by(Race.date.desc())
         )
-        result = await self.session.execute(query)
+        result = await self._execute(query)
         return list(result.scalars().unique().all())
 
     async def get_with_participants(self, race_id: int) -> Optional[Race]:
@@ -47,13 +159,66 @@ class RaceRepository(BaseRepository[Race]):
         Получить состязание со всеми участниками
         Функция 1 из ТЗ
         """
+        return await self.get_by_id(race_id, load="standings")
+
+    async def get_standings(self, race_id: int) -> List[RowMapping]:
+        """
+        Получить состязание и итоговую таблицу одним запросом
+
+        Проекция без ORM-объектов: по строке на участника, отсортированные
+        по месту (индекс idx_race_place). Для состязания без участников —
+        одна строка с пустыми полями участника, для несуществующего —
+        пустой список.
+        """
         query = (
-            select(Race)
+            self._standings_query()
             .where(Race.id == race_id)
-            .options(
-                selectinload(Race.participants).selectinload(RaceParticipant.jockey),
-                selectinload(Race.participants).selectinload(RaceParticipant.horse),
+            .order_by(RaceParticipant.place, RaceParticipant.id)
+        )
+        result = await self._execute(query)
+        return list(result.mappings().all())
+
+    async def stream_standings(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Потоково выдать итоговые таблицы всех состязаний
+
+        Тот же запрос, что и get_standings, но по всем состязаниям в
+        порядке (date, id, place). Строки читаются серверным курсором
+        пачками по batch_size, поэтому память не зависит от размера архива.
+        """
+        query = (
+            self._standings_query()
+            .order_by(
+                Race.date, Race.id, RaceParticipant.place, RaceParticipant.id
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        # Сессия занята, пока поток не дочитан
+        async with self._exclusive():
+            result = await self.session.stream(query)
+            async for row in result.mappings():
+                yield row
+
+    @staticmethod
+    def _standings_query() -> Select:
+        """Состязание и его участники: по строке на участника"""
+        return (
+            select(
+                Race.id,
+                Race.date,
+                Race.time,
+                Race.hippodrome,
+                Race.name,
+                Race.revision,
+                Jockey.name.label("jockey_name"),
+                Horse.nickname.label("horse_name"),
+                RaceParticipant.place,
+                RaceParticipant.time_result,
             )
+            .select_from(Race)
+            .outerjoin(RaceParticipant, RaceParticipant.race_id == Race.id)
+            .outerjoin(Jockey, Jockey.id == RaceParticipant.jockey_id)
+            .outerjoin(Horse, Horse.id == RaceParticipant.horse_id)
         )
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none()
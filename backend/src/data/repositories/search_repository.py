@@ -0,0 +1,114 @@
+import re
+from typing import List, Optional, Sequence
+
+from sqlalchemy import Row, TextClause, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data.instrumentation import tag_repository_methods
+from src.data.loader import session_lock
+from src.data.search import SEARCH_SOURCES, fts_table
+
+# Слова запроса: буквы и цифры, остальное (в т.ч. синтаксис FTS5) отбрасывается
+WORD_RE = re.compile(r"\w+")
+
+
+def fts_query(query: str) -> Optional[str]:
+    """
+    Запрос FTS5: каждое слово как префикс, все слова обязательны
+
+    "орлов ры" -> '"орлов"* AND "ры"*'. None, если слов нет.
+    """
+    words = WORD_RE.findall(query)
+    if not words:
+        return None
+    return " AND ".join(f'"{word}"*' for word in words)
+
+
+def like_escape(query: str) -> str:
+    """Экранировать спецсимволы LIKE"""
+    return re.sub(r"([\\%_])", r"\\\1", query)
+
+
+class SearchRepository:
+    """
+    Поиск лошадей, жокеев и владельцев по имени
+
+    SQLite — FTS5 с префиксным поиском, ранжирование bm25. Postgres —
+    pg_trgm: подстрока или нечеткое совпадение слова, ранжирование по
+    word_similarity с приоритетом совпадений с начала имени.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(self, query: str, kinds: Sequence[str], limit: int) -> List[Row]:
+        """
+        Найти записи, лучшие совпадения первыми
+
+        Returns:
+            Строки (kind, id, title, score), score — больше значит лучше
+
+        Raises:
+            RuntimeError: Если СУБД не поддерживается
+        """
+        dialect = self.session.bind.dialect.name
+        if dialect == "sqlite":
+            match = fts_query(query)
+            if match is None:
+                return []
+            statement = self._sqlite_query(kinds).bindparams(
+                match=match, limit=limit
+            )
+        elif dialect == "postgresql":
+            escaped = like_escape(query)
+            statement = self._postgres_query(kinds).bindparams(
+                query=query,
+                pattern=f"%{escaped}%",
+                prefix=f"{escaped}%",
+                limit=limit,
+            )
+        else:
+            raise RuntimeError(f"СУБД {dialect} не поддерживается")
+
+        async with session_lock(self.session):
+            result = await self.session.execute(statement)
+        return list(result.all())
+
+    @staticmethod
+    def _union(parts: List[str]) -> TextClause:
+        # Каждый источник отдает не больше limit лучших строк, затем общий отбор
+        return text(
+            " UNION ALL ".join(f"SELECT * FROM ({part} LIMIT :limit)" for part in parts)
+            + " ORDER BY score DESC, kind, id LIMIT :limit"
+        )
+
+    @classmethod
+    def _sqlite_query(cls, kinds: Sequence[str]) -> TextClause:
+        parts = []
+        for kind in kinds:
+            source = SEARCH_SOURCES[kind]
+            fts = fts_table(source)
+            parts.append(
+                f"SELECT '{kind}' AS kind, rowid AS id, {source.column} AS title, "
+                f"-rank AS score FROM {fts} WHERE {fts} MATCH :match ORDER BY rank"
+            )
+        return cls._union(parts)
+
+    @classmethod
+    def _postgres_query(cls, kinds: Sequence[str]) -> TextClause:
+        parts = []
+        for kind in kinds:
+            source = SEARCH_SOURCES[kind]
+            column = source.column
+            parts.append(
+                f"SELECT '{kind}' AS kind, id, {column} AS title, "
+                f"word_similarity(:query, {column}) "
+                f"+ CASE WHEN {column} ILIKE :prefix THEN 1 ELSE 0 END AS score "
+                f"FROM {source.table} "
+                f"WHERE {column} ILIKE :pattern OR :query <% {column} "
+                "ORDER BY score DESC"
+            )
+        return cls._union(parts)
+
+
+tag_repository_methods(SearchRepository)
@@ -0,0 +1,110 @@
+"""
+Индексы поиска по лошадям, жокеям и владельцам
+
+SQLite: таблицы FTS5 с внешним содержимым (search_<таблица>), rowid
+совпадает с ID записи, синхронизация — триггерами. Postgres: расширение
+pg_trgm и GIN-индексы по триграммам. Схема создается вместе с
+create_all и миграцией 0005; объекты search_* не описываются моделями
+и исключаются из сравнения схемы (include_schema_name).
+
+Триггеры привязаны к таблицам: миграции, пересоздающие horses, jockeys
+или owners (batch-режим на SQLite), должны создавать их заново.
+"""
+
+from typing import Dict, List, NamedTuple
+
+from sqlalchemy import DDL, MetaData, event
+
+SEARCH_PREFIX = "search_"
+
+# СУБД с индексами поиска; другие отклоняются при старте (database.check_dialect)
+SEARCH_DIALECTS = ("postgresql", "sqlite")
+
+
+class SearchSource(NamedTuple):
+    """Таблица и колонка, по которой ищется сущность"""
+
+    table: str
+    column: str
+
+
+SEARCH_SOURCES: Dict[str, SearchSource] = {
+    "horse": SearchSource("horses", "nickname"),
+    "jockey": SearchSource("jockeys", "name"),
+    "owner": SearchSource("owners", "name"),
+}
+
+
+def fts_table(source: SearchSource) -> str:
+    """Имя таблицы FTS5 для источника"""
+    return f"{SEARCH_PREFIX}{source.table}"
+
+
+def trgm_index(source: SearchSource) -> str:
+    """Имя триграммного индекса Postgres для источника"""
+    return f"{SEARCH_PREFIX}trgm_{source.table}_{source.column}"
+
+
+def sqlite_create_statements() -> List[str]:
+    """DDL таблиц FTS5 и триггеров синхронизации"""
+    statements = []
+    for source in SEARCH_SOURCES.values():
+        fts, table, column = fts_table(source), source.table, source.column
+        delete = (
+            f"INSERT INTO {fts}({fts}, rowid, {column}) "
+            f"VALUES ('delete', old.id, old.{column});"
+        )
+        insert = f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column});"
+        statements += [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{column}, content='{table}', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} "
+            f"BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} "
+            f"BEGIN {delete} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column} "
+            f"ON {table} BEGIN {delete} {insert} END",
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+    return statements
+
+
+def sqlite_drop_statements() -> List[str]:
+    """Удаление таблиц FTS5 (drop_all; триггеры уйдут вместе с исходными таблицами)"""
+    return [
+        f"DROP TABLE IF EXISTS {fts_table(source)}"
+        for source in SEARCH_SOURCES.values()
+    ]
+
+
+def postgres_create_statements() -> List[str]:
+    """Расширение pg_trgm и GIN-индексы по триграммам"""
+    return ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+        f"CREATE INDEX IF NOT EXISTS {trgm_index(source)} ON {source.table} "
+        f"USING gin ({source.column} gin_trgm_ops)"
+        for source in SEARCH_SOURCES.values()
+    ]
+
+
+def attach_search_ddl(metadata: MetaData) -> None:
+    """Создавать индексы поиска вместе с create_all (и удалять в drop_all)"""
+    for statement in sqlite_create_statements():
+        event.listen(
+            metadata, "after_create", DDL(statement).execute_if(dialect="sqlite")
+        )
+    for statement in sqlite_drop_statements():
+        event.listen(
+            metadata, "before_drop", DDL(statement).execute_if(dialect="sqlite")
+        )
+    for statement in postgres_create_statements():
+        event.listen(
+            metadata, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+
+
+def include_schema_name(name, type_, parent_names) -> bool:
+    """Фильтр сравнения схемы Alembic: объекты поиска не описаны моделями"""
+    if type_ in ("table", "index") and name:
+        return not name.startswith(SEARCH_PREFIX)
+    return True
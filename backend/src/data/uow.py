@@ -1,67 +1,126 @@
-from typing import Optional
+from typing import Optional, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
+from src.data.loader import DataLoader, session_lock
 from src.data.repositories import (
     HorseRepository,
     JockeyRepository,
+    LeaderboardRepository,
     OwnerRepository,
     ParticipantRepository,
     RaceRepository,
+    SearchRepository,
 )
+from src.data.repositories.base import BaseRepository
+
+RepositoryT = TypeVar("RepositoryT", bound=BaseRepository)
 
 
 class UnitOfWork:
     """
     Unit of Work паттерн для управления транзакциями
     Обеспечивает атомарность операций и управление репозиториями
+
+    get_by_id всех репозиториев идет через общий DataLoader: вызовы
+    в одном проходе цикла событий объединяются в один запрос IN,
+    результаты кэшируются до commit/rollback.
+
+    read_only=True — для сессий реплик: commit запрещен. После commit
+    в session.info["committed"] ставится отметка для read-your-writes.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        batch_loading: Optional[bool] = None,
+        read_only: bool = False,
+    ):
         self.session = session
+        self.read_only = read_only
+        if batch_loading is None:
+            batch_loading = settings.db_batch_loading
+        self.loader: Optional[DataLoader] = (
+            DataLoader(session) if batch_loading else None
+        )
         self._races: Optional[RaceRepository] = None
         self._jockeys: Optional[JockeyRepository] = None
         self._horses: Optional[HorseRepository] = None
         self._owners: Optional[OwnerRepository] = None
         self._participants: Optional[ParticipantRepository] = None
+        self._leaderboard: Optional[LeaderboardRepository] = None
+        self._search: Optional[SearchRepository] = None
 
     @property
     def races(self) -> RaceRepository:
         if self._races is None:
-            self._races = RaceRepository(self.session)
+            self._races = self._attach(RaceRepository(self.session))
         return self._races
 
     @property
     def jockeys(self) -> JockeyRepository:
         if self._jockeys is None:
-            self._jockeys = JockeyRepository(self.session)
+            self._jockeys = self._attach(JockeyRepository(self.session))
         return self._jockeys
 
     @property
     def horses(self) -> HorseRepository:
         if self._horses is None:
-            self._horses = HorseRepository(self.session)
+            self._horses = self._attach(HorseRepository(self.session))
         return self._horses
 
     @property
     def owners(self) -> OwnerRepository:
         if self._owners is None:
-            self._owners = OwnerRepository(self.session)
+            self._owners = self._attach(OwnerRepository(self.session))
         return self._owners
 
     @property
     def participants(self) -> ParticipantRepository:
         if self._participants is None:
-            self._participants = ParticipantRepository(self.session)
+            self._participants = self._attach(ParticipantRepository(self.session))
         return self._participants
 
+    @property
+    def leaderboard(self) -> LeaderboardRepository:
+        if self._leaderboard is None:
+            self._leaderboard = self._attach(LeaderboardRepository(self.session))
+        return self._leaderboard
+
+    @property
+    def search(self) -> SearchRepository:
+        if self._search is None:
+            self._search = SearchRepository(self.session)
+        return self._search
+
+    def _attach(self, repository: RepositoryT) -> RepositoryT:
+        repository.loader = self.loader
+        return repository
+
+    def _clear_loader(self) -> None:
+        if self.loader is not None:
+            self.loader.clear()
+
     async def commit(self):
-        """Зафиксировать транзакцию"""
-        await self.session.commit()
+        """
+        Зафиксировать транзакцию
+
+        Raises:
+            RuntimeError: Если Unit of Work только для чтения
+        """
+        if self.read_only:
+            raise RuntimeError("Unit of Work только для чтения")
+        async with session_lock(self.session):
+            await self.session.commit()
+        self.session.info["committed"] = True
+        self._clear_loader()
 
     async def rollback(self):
         """Откатить транзакцию"""
-        await self.session.rollback()
+        async with session_lock(self.session):
+            await self.session.rollback()
+        self._clear_loader()
 
     async def __aenter__(self):
         return self
@@ -69,4 +128,6 @@ class UnitOfWork:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             await self.rollback()
-        await self.session.close()
+        async with session_lock(self.session):
+            await self.session.close()
+        self._clear_loader()
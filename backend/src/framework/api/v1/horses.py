@@ -1,35 +1,85 @@
-from typing import List
+import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.business.dto.horse_dto import HorseCreateDTO
+from src.business.exceptions import EntityNotFoundError
 from src.business.operations.horse_operations import (
     create_horse,
+    create_horses_bulk,
     get_horse_by_id,
+    get_horse_revision,
+    get_horses_by_ids,
     list_horses,
+    list_horses_page,
 )
 from src.business.operations.race_operations import get_horse_races
+from src.business.operations.stats_operations import get_horse_stats
 from src.data.uow import UnitOfWork
-from src.framework.dependencies import get_db
-from src.framework.schemas import HorseCreate, HorseResponse, RaceResponse
+from src.framework.dependencies import (
+    get_field_list,
+    get_id_list,
+    get_read_db,
+    get_write_db,
+)
+from src.framework.etag import is_not_modified, make_etag, not_modified
+from src.framework.responses import dto_response, fields_response
+from src.framework.schemas import (
+    BatchResponse,
+    HorseCreate,
+    HorseResponse,
+    HorsesBulkCreate,
+    PageResponse,
+    PerformanceStatsResponse,
+    RaceResponse,
+)
 
 router = APIRouter(prefix="/horses", tags=["horses"])
 
 
-@router.get("/", response_model=List[HorseResponse])
+@router.get(
+    "/",
+    response_model=Union[
+        List[HorseResponse], PageResponse[HorseResponse], BatchResponse[HorseResponse]
+    ],
+)
 async def list_horses_endpoint(
-    skip: int = 0, limit: int = 100, session: AsyncSession = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    ids: Optional[List[int]] = Depends(get_id_list),
+    fields: Optional[List[str]] = Depends(get_field_list),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    """Получить список лошадей"""
-    uow = UnitOfWork(session)
-    horses = await list_horses(uow, skip=skip, limit=limit)
-    return horses
+    """
+    Получить список лошадей
+
+    Без параметра cursor работает устаревший режим skip/limit и
+    возвращается массив. С параметром cursor (пустой — первая страница)
+    возвращается страница {items, next_cursor}. С параметром ids=1,2,3
+    возвращаются {items, missing}: записи в порядке запроса и ненайденные ID.
+    С параметром fields=name,age записи списка содержат только эти поля и id.
+    """
+    uow = UnitOfWork(session, read_only=True)
+    if ids is not None:
+        return dto_response(await get_horses_by_ids(uow, ids))
+    try:
+        if cursor is None:
+            result = await list_horses(uow, skip=skip, limit=limit, fields=fields)
+        else:
+            result = await list_horses_page(
+                uow, cursor=cursor or None, limit=limit, fields=fields
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return fields_response(result, fields)
 
 
 @router.post("/", response_model=HorseResponse, status_code=status.HTTP_201_CREATED)
 async def create_horse_endpoint(
-    horse_data: HorseCreate, session: AsyncSession = Depends(get_db)
+    horse_data: HorseCreate, session: AsyncSession = Depends(get_write_db)
 ):
     """Создать новую лошадь (Функция 4 из ТЗ)"""
     try:
@@ -46,27 +96,86 @@ async def create_horse_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    ":bulk",
+    response_model=List[HorseResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_horses_bulk_endpoint(
+    bulk_data: HorsesBulkCreate, session: AsyncSession = Depends(get_write_db)
+):
+    """
+    Создать записи пакетом (POST /horses:bulk)
+
+    Все строки сохраняются в одной транзакции многострочными INSERT.
+    При ошибках ничего не сохраняется, а в detail возвращается список
+    {index, error}. Созданные записи возвращаются по возрастанию ID.
+    """
+    uow = UnitOfWork(session)
+    rows = [HorseCreateDTO(**item.model_dump()) for item in bulk_data.items]
+    result = await create_horses_bulk(uow, rows)
+    if result.errors:
+        raise HTTPException(
+            status_code=400, detail=[e.model_dump() for e in result.errors]
+        )
+    return dto_response(result.created, status_code=status.HTTP_201_CREATED)
+
+
 @router.get("/{horse_id}/races", response_model=List[RaceResponse])
 async def get_horse_races_endpoint(
-    horse_id: int, session: AsyncSession = Depends(get_db)
+    horse_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_db),
 ):
     """
     Получить список состязаний лошади
     (Функция 7 из ТЗ)
+
+    Поддерживает условный GET по ETag версии лошади.
     """
+    uow = UnitOfWork(session, read_only=True)
+    revision = await get_horse_revision(uow, horse_id)
+    if revision is None:
+        raise HTTPException(status_code=404, detail="Лошадь не найдена")
+
+    etag = make_etag("horse-races", horse_id, revision)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     try:
-        uow = UnitOfWork(session)
         races = await get_horse_races(uow, horse_id)
-        return races
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    response.headers["ETag"] = etag
+    return dto_response(races, headers=response.headers)
+
+
+@router.get("/{horse_id}/stats", response_model=PerformanceStatsResponse)
+async def get_horse_stats_endpoint(
+    horse_id: int,
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+    session: AsyncSession = Depends(get_read_db),
+):
+    """Статистика выступлений лошади: старты, победы, призовые места"""
+    try:
+        uow = UnitOfWork(session, read_only=True)
+        stats = await get_horse_stats(uow, horse_id, date_from, date_to)
+        return dto_response(stats)
+    except EntityNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{horse_id}", response_model=HorseResponse)
-async def get_horse_endpoint(horse_id: int, session: AsyncSession = Depends(get_db)):
+async def get_horse_endpoint(
+    horse_id: int, session: AsyncSession = Depends(get_read_db)
+):
     """Получить лошадь по ID"""
-    uow = UnitOfWork(session)
+    uow = UnitOfWork(session, read_only=True)
     horse = await get_horse_by_id(uow, horse_id)
     if not horse:
         raise HTTPException(status_code=404, detail="Лошадь не найдена")
-    return horse
+    return dto_response(horse)
@@ -1,35 +1,87 @@
-from typing import List
+import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.business.dto.jockey_dto import JockeyCreateDTO
+from src.business.exceptions import EntityNotFoundError
 from src.business.operations.jockey_operations import (
     create_jockey,
+    create_jockeys_bulk,
     get_jockey_by_id,
+    get_jockey_revision,
+    get_jockeys_by_ids,
     list_jockeys,
+    list_jockeys_page,
 )
 from src.business.operations.race_operations import get_jockey_races
+from src.business.operations.stats_operations import get_jockey_stats
 from src.data.uow import UnitOfWork
-from src.framework.dependencies import get_db
-from src.framework.schemas import JockeyCreate, JockeyResponse, RaceResponse
+from src.framework.dependencies import (
+    get_field_list,
+    get_id_list,
+    get_read_db,
+    get_write_db,
+)
+from src.framework.etag import is_not_modified, make_etag, not_modified
+from src.framework.responses import dto_response, fields_response
+from src.framework.schemas import (
+    BatchResponse,
+    JockeyCreate,
+    JockeyResponse,
+    JockeysBulkCreate,
+    PageResponse,
+    PerformanceStatsResponse,
+    RaceResponse,
+)
 
 router = APIRouter(prefix="/jockeys", tags=["jockeys"])
 
 
-@router.get("/", response_model=List[JockeyResponse])
+@router.get(
+    "/",
+    response_model=Union[
+        List[JockeyResponse],
+        PageResponse[JockeyResponse],
+        BatchResponse[JockeyResponse],
+    ],
+)
 async def list_jockeys_endpoint(
-    skip: int = 0, limit: int = 100, session: AsyncSession = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    ids: Optional[List[int]] = Depends(get_id_list),
+    fields: Optional[List[str]] = Depends(get_field_list),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    """Получить список жокеев"""
-    uow = UnitOfWork(session)
-    jockeys = await list_jockeys(uow, skip=skip, limit=limit)
-    return jockeys
+    """
+    Получить список жокеев
+
+    Без параметра cursor работает устаревший режим skip/limit и
+    возвращается массив. С параметром cursor (пустой — первая страница)
+    возвращается страница {items, next_cursor}. С параметром ids=1,2,3
+    возвращаются {items, missing}: записи в порядке запроса и ненайденные ID.
+    С параметром fields=name,age записи списка содержат только эти поля и id.
+    """
+    uow = UnitOfWork(session, read_only=True)
+    if ids is not None:
+        return dto_response(await get_jockeys_by_ids(uow, ids))
+    try:
+        if cursor is None:
+            result = await list_jockeys(uow, skip=skip, limit=limit, fields=fields)
+        else:
+            result = await list_jockeys_page(
+                uow, cursor=cursor or None, limit=limit, fields=fields
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return fields_response(result, fields)
 
 
 @router.post("/", response_model=JockeyResponse, status_code=status.HTTP_201_CREATED)
 async def create_jockey_endpoint(
-    jockey_data: JockeyCreate, session: AsyncSession = Depends(get_db)
+    jockey_data: JockeyCreate, session: AsyncSession = Depends(get_write_db)
 ):
     """Создать нового жокея (Функция 3 из ТЗ)"""
     try:
@@ -46,27 +98,86 @@ async def create_jockey_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    ":bulk",
+    response_model=List[JockeyResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_jockeys_bulk_endpoint(
+    bulk_data: JockeysBulkCreate, session: AsyncSession = Depends(get_write_db)
+):
+    """
+    Создать записи пакетом (POST /jockeys:bulk)
+
+    Все строки сохраняются в одной транзакции многострочными INSERT.
+    При ошибках ничего не сохраняется, а в detail возвращается список
+    {index, error}. Созданные записи возвращаются по возрастанию ID.
+    """
+    uow = UnitOfWork(session)
+    rows = [JockeyCreateDTO(**item.model_dump()) for item in bulk_data.items]
+    result = await create_jockeys_bulk(uow, rows)
+    if result.errors:
+        raise HTTPException(
+            status_code=400, detail=[e.model_dump() for e in result.errors]
+        )
+    return dto_response(result.created, status_code=status.HTTP_201_CREATED)
+
+
 @router.get("/{jockey_id}/races", response_model=List[RaceResponse])
 async def get_jockey_races_endpoint(
-    jockey_id: int, session: AsyncSession = Depends(get_db)
+    jockey_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_db),
 ):
     """
     Получить список состязаний жокея
     (Функция 6 из ТЗ)
+
+    Поддерживает условный GET по ETag версии жокея.
     """
+    uow = UnitOfWork(session, read_only=True)
+    revision = await get_jockey_revision(uow, jockey_id)
+    if revision is None:
+        raise HTTPException(status_code=404, detail="Жокей не найден")
+
+    etag = make_etag("jockey-races", jockey_id, revision)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     try:
-        uow = UnitOfWork(session)
         races = await get_jockey_races(uow, jockey_id)
-        return races
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    response.headers["ETag"] = etag
+    return dto_response(races, headers=response.headers)
+
+
+@router.get("/{jockey_id}/stats", response_model=PerformanceStatsResponse)
+async def get_jockey_stats_endpoint(
+    jockey_id: int,
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+    session: AsyncSession = Depends(get_read_db),
+):
+    """Статистика выступлений жокея: старты, победы, призовые места"""
+    try:
+        uow = UnitOfWork(session, read_only=True)
+        stats = await get_jockey_stats(uow, jockey_id, date_from, date_to)
+        return dto_response(stats)
+    except EntityNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{jockey_id}", response_model=JockeyResponse)
-async def get_jockey_endpoint(jockey_id: int, session: AsyncSession = Depends(get_db)):
+async def get_jockey_endpoint(
+    jockey_id: int, session: AsyncSession = Depends(get_read_db)
+):
     """Получить жокея по ID"""
-    uow = UnitOfWork(session)
+    uow = UnitOfWork(session, read_only=True)
     jockey = await get_jockey_by_id(uow, jockey_id)
     if not jockey:
         raise HTTPException(status_code=404, detail="Жокей не найден")
-    return jockey
+    return dto_response(jockey)
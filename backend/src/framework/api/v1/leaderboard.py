@@ -0,0 +1,30 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.business.operations.leaderboard_operations import get_leaderboard
+from src.data.uow import UnitOfWork
+from src.framework.dependencies import get_read_db
+from src.framework.responses import dto_response
+from src.framework.schemas import LeaderboardEntryResponse, PageResponse
+
+router = APIRouter(prefix="/leaderboard", tags=["leaderboard"])
+
+
+@router.get("/", response_model=PageResponse[LeaderboardEntryResponse])
+async def get_leaderboard_endpoint(
+    kind: Literal["jockey", "horse"] = "jockey",
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    session: AsyncSession = Depends(get_read_db),
+):
+    """Рейтинг жокеев или лошадей по победам и призовым местам"""
+    try:
+        uow = UnitOfWork(session, read_only=True)
+        leaderboard = await get_leaderboard(
+            uow, kind, cursor=cursor or None, limit=limit
+        )
+        return dto_response(leaderboard)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
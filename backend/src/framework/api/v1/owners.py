@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,19 +6,34 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.business.dto.owner_dto import OwnerCreateDTO
 from src.business.operations.owner_operations import (
     create_owner,
+    create_owners_bulk,
     get_owner_by_id,
+    get_owners_by_ids,
     list_owners,
+    list_owners_page,
 )
 from src.data.uow import UnitOfWork
-from src.framework.dependencies import get_db
-from src.framework.schemas import OwnerCreate, OwnerResponse
+from src.framework.dependencies import (
+    get_field_list,
+    get_id_list,
+    get_read_db,
+    get_write_db,
+)
+from src.framework.responses import dto_response, fields_response
+from src.framework.schemas import (
+    BatchResponse,
+    OwnerCreate,
+    OwnerResponse,
+    OwnersBulkCreate,
+    PageResponse,
+)
 
 router = APIRouter(prefix="/owners", tags=["owners"])
 
 
 @router.post("/", response_model=OwnerResponse, status_code=status.HTTP_201_CREATED)
 async def create_owner_endpoint(
-    owner_data: OwnerCreate, session: AsyncSession = Depends(get_db)
+    owner_data: OwnerCreate, session: AsyncSession = Depends(get_write_db)
 ):
     """Создать нового владельца"""
     try:
@@ -34,21 +49,76 @@ async def create_owner_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    ":bulk",
+    response_model=List[OwnerResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_owners_bulk_endpoint(
+    bulk_data: OwnersBulkCreate, session: AsyncSession = Depends(get_write_db)
+):
+    """
+    Создать записи пакетом (POST /owners:bulk)
+
+    Все строки сохраняются в одной транзакции многострочными INSERT.
+    При ошибках ничего не сохраняется, а в detail возвращается список
+    {index, error}. Созданные записи возвращаются по возрастанию ID.
+    """
+    uow = UnitOfWork(session)
+    rows = [OwnerCreateDTO(**item.model_dump()) for item in bulk_data.items]
+    result = await create_owners_bulk(uow, rows)
+    if result.errors:
+        raise HTTPException(
+            status_code=400, detail=[e.model_dump() for e in result.errors]
+        )
+    return dto_response(result.created, status_code=status.HTTP_201_CREATED)
+
+
 @router.get("/{owner_id}", response_model=OwnerResponse)
-async def get_owner_endpoint(owner_id: int, session: AsyncSession = Depends(get_db)):
+async def get_owner_endpoint(
+    owner_id: int, session: AsyncSession = Depends(get_read_db)
+):
     """Получить владельца по ID"""
-    uow = UnitOfWork(session)
+    uow = UnitOfWork(session, read_only=True)
     owner = await get_owner_by_id(uow, owner_id)
     if not owner:
         raise HTTPException(status_code=404, detail="Владелец не найден")
-    return owner
+    return dto_response(owner)
 
 
-@router.get("/", response_model=List[OwnerResponse])
+@router.get(
+    "/",
+    response_model=Union[
+        List[OwnerResponse], PageResponse[OwnerResponse], BatchResponse[OwnerResponse]
+    ],
+)
 async def list_owners_endpoint(
-    skip: int = 0, limit: int = 100, session: AsyncSession = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    ids: Optional[List[int]] = Depends(get_id_list),
+    fields: Optional[List[str]] = Depends(get_field_list),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    """Получить список владельцев"""
-    uow = UnitOfWork(session)
-    owners = await list_owners(uow, skip=skip, limit=limit)
-    return owners
+    """
+    Получить список владельцев
+
+    Без параметра cursor работает устаревший режим skip/limit и
+    возвращается массив. С параметром cursor (пустой — первая страница)
+    возвращается страница {items, next_cursor}. С параметром ids=1,2,3
+    возвращаются {items, missing}: записи в порядке запроса и ненайденные ID.
+    С параметром fields=name,age записи списка содержат только эти поля и id.
+    """
+    uow = UnitOfWork(session, read_only=True)
+    if ids is not None:
+        return dto_response(await get_owners_by_ids(uow, ids))
+    try:
+        if cursor is None:
+            result = await list_owners(uow, skip=skip, limit=limit, fields=fields)
+        else:
+            result = await list_owners_page(
+                uow, cursor=cursor or None, limit=limit, fields=fields
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return fields_response(result, fields)
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.business.dto.participant_dto import ParticipantCreateDTO
 from src.business.operations.participant_operations import add_participant_with_result
 from src.data.uow import UnitOfWork
-from src.framework.dependencies import get_db
+from src.framework.dependencies import get_write_db
 from src.framework.schemas import ParticipantCreate, ParticipantResponse
 
 router = APIRouter(prefix="/participants", tags=["participants"])
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/participants", tags=["participants"])
     "/", response_model=ParticipantResponse, status_code=status.HTTP_201_CREATED
 )
 async def add_participant_endpoint(
-    participant_data: ParticipantCreate, session: AsyncSession = Depends(get_db)
+    participant_data: ParticipantCreate, session: AsyncSession = Depends(get_write_db)
 ):
     """
     Добавить результат участника в состязании
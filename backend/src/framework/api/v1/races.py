@@ -1,34 +1,94 @@
-from typing import List
+import datetime
+from typing import List, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.business.dto.race_dto import RaceCreateDTO
+from src.business.dto.participant_dto import RaceResultRowDTO
+from src.business.dto.race_dto import RaceCreateDTO, RaceFilterDTO
+from src.business.operations.participant_operations import add_race_results_bulk
 from src.business.operations.race_operations import (
     create_race,
+    export_races,
+    get_race_revision,
     get_race_with_participants,
     list_races,
+    list_races_page,
 )
 from src.data.uow import UnitOfWork
-from src.framework.dependencies import get_db
-from src.framework.schemas import RaceCreate, RaceResponse, RaceWithParticipantsResponse
+from src.framework.dependencies import get_field_list, get_read_db, get_write_db
+from src.framework.etag import is_not_modified, make_etag, not_modified
+from src.framework.export import csv_lines, ndjson_lines
+from src.framework.responses import dto_response, fields_response
+from src.framework.schemas import (
+    PageResponse,
+    ParticipantResponse,
+    RaceCreate,
+    RaceResponse,
+    RaceResultsBulkCreate,
+    RaceWithParticipantsResponse,
+)
 
 router = APIRouter(prefix="/races", tags=["races"])
 
 
-@router.get("/", response_model=List[RaceResponse])
+@router.get(
+    "/",
+    response_model=Union[List[RaceResponse], PageResponse[RaceResponse]],
+)
 async def list_races_endpoint(
-    skip: int = 0, limit: int = 100, session: AsyncSession = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    date_from: Optional[datetime.date] = Query(None, description="Не раньше даты"),
+    date_to: Optional[datetime.date] = Query(None, description="Не позже даты"),
+    hippodrome: Optional[str] = None,
+    name_prefix: Optional[str] = Query(None, description="Начало названия"),
+    sort: Optional[Literal["date", "-date", "hippodrome"]] = None,
+    fields: Optional[List[str]] = Depends(get_field_list),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    """Получить список всех состязаний"""
-    uow = UnitOfWork(session)
-    races = await list_races(uow, skip=skip, limit=limit)
-    return races
+    """
+    Получить список всех состязаний
+
+    Без параметра cursor работает устаревший режим skip/limit и
+    возвращается массив. С параметром cursor (пустой — первая страница)
+    возвращается страница {items, next_cursor}, по умолчанию по дате.
+
+    Фильтры: диапазон дат (включительно), ипподром, начало названия.
+    Сортировка: date, -date (сначала поздние) или hippodrome.
+    С параметром fields=date,hippodrome записи содержат только эти поля и id.
+    """
+    uow = UnitOfWork(session, read_only=True)
+    filters = RaceFilterDTO(
+        date_from=date_from,
+        date_to=date_to,
+        hippodrome=hippodrome,
+        name_prefix=name_prefix,
+    )
+    try:
+        if cursor is None:
+            result = await list_races(
+                uow, skip=skip, limit=limit, filters=filters, sort=sort, fields=fields
+            )
+        else:
+            result = await list_races_page(
+                uow,
+                cursor=cursor or None,
+                limit=limit,
+                filters=filters,
+                sort=sort or "date",
+                fields=fields,
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return fields_response(result, fields)
 
 
 @router.post("/", response_model=RaceResponse, status_code=status.HTTP_201_CREATED)
 async def create_race_endpoint(
-    race_data: RaceCreate, session: AsyncSession = Depends(get_db)
+    race_data: RaceCreate, session: AsyncSession = Depends(get_write_db)
 ):
     """Создать новое состязание (Функция 2 из ТЗ)"""
     try:
@@ -45,14 +105,82 @@ async def create_race_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/export")
+async def export_races_endpoint(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    session: AsyncSession = Depends(get_read_db),
+):
+    """
+    Выгрузить все состязания с результатами участников
+
+    Ответ отдается потоком по мере чтения из БД: ndjson — состязание
+    на строку (как GET /races/{id}), csv — строка на участника.
+    """
+    races = export_races(UnitOfWork(session, read_only=True))
+    if format == "csv":
+        return StreamingResponse(
+            csv_lines(races),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": 'attachment; filename="races.csv"'},
+        )
+    return StreamingResponse(ndjson_lines(races), media_type="application/x-ndjson")
+
+
 @router.get("/{race_id}", response_model=RaceWithParticipantsResponse)
-async def get_race_endpoint(race_id: int, session: AsyncSession = Depends(get_db)):
+async def get_race_endpoint(
+    race_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_db),
+):
     """
     Получить состязание с участниками и результатами
     (Функция 1 из ТЗ)
+
+    Поддерживает условный GET: при совпадении If-None-Match
+    возвращает 304 без выполнения основного запроса.
     """
-    uow = UnitOfWork(session)
-    race_data = await get_race_with_participants(uow, race_id)
+    uow = UnitOfWork(session, read_only=True)
+    revision = await get_race_revision(uow, race_id)
+    if revision is None:
+        raise HTTPException(status_code=404, detail="Состязание не найдено")
+
+    etag = make_etag("race", race_id, revision)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    race_data = await get_race_with_participants(uow, race_id, revision)
     if not race_data:
         raise HTTPException(status_code=404, detail="Состязание не найдено")
-    return race_data
+    response.headers["ETag"] = etag
+    return dto_response(race_data, headers=response.headers)
+
+
+@router.post(
+    "/{race_id}/results:bulk",
+    response_model=List[ParticipantResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_race_results_bulk_endpoint(
+    race_id: int,
+    results_data: RaceResultsBulkCreate,
+    session: AsyncSession = Depends(get_write_db),
+):
+    """
+    Загрузить итоговый протокол состязания одним запросом
+
+    Все строки сохраняются в одной транзакции. При ошибках ничего
+    не сохраняется, а в detail возвращается список {index, error}.
+    """
+    uow = UnitOfWork(session)
+    rows = [RaceResultRowDTO(**row.model_dump()) for row in results_data.results]
+    try:
+        result = await add_race_results_bulk(uow, race_id, rows)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if result.errors:
+        raise HTTPException(
+            status_code=400, detail=[e.model_dump() for e in result.errors]
+        )
+    return result.created
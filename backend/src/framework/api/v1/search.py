@@ -0,0 +1,33 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.business.operations.search_operations import search
+from src.data.uow import UnitOfWork
+from src.framework.dependencies import get_read_db
+from src.framework.responses import dto_response
+from src.framework.schemas import SearchResultResponse
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_model=List[SearchResultResponse])
+async def search_endpoint(
+    q: str = Query(..., description="Кличка лошади или имя жокея/владельца"),
+    kind: Optional[List[Literal["horse", "jockey", "owner"]]] = Query(
+        None, description="Типы сущностей (по умолчанию все)"
+    ),
+    limit: int = 20,
+    session: AsyncSession = Depends(get_read_db),
+):
+    """
+    Поиск лошадей, жокеев и владельцев по началу слов имени
+
+    Результаты упорядочены по релевантности.
+    """
+    try:
+        uow = UnitOfWork(session, read_only=True)
+        return dto_response(await search(uow, q, kinds=kind, limit=limit))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
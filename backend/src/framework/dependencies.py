@@ -1,10 +1,16 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List, Optional
 
+from fastapi import Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.data import database
 from src.data.database import async_session_maker
+from src.data.replicas import ReplicaPool
 from src.data.uow import UnitOfWork
 
+# Максимум ID в одном запросе выборки по списку (?ids=1,2,3)
+MAX_BATCH_IDS = 500
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Получить сессию БД"""
@@ -12,6 +18,86 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_replica_pool() -> Optional[ReplicaPool]:
+    """Пул реплик для чтения (None — все запросы идут на основную БД)"""
+    return database.replica_pool
+
+
+def client_key(request: Request) -> str:
+    """Идентификатор клиента для read-your-writes: X-Client-Id или адрес"""
+    client_id = request.headers.get("x-client-id")
+    if client_id:
+        return client_id
+    return request.client.host if request.client else ""
+
+
+async def get_write_db(
+    request: Request,
+    session: AsyncSession = Depends(get_db),
+    replicas: Optional[ReplicaPool] = Depends(get_replica_pool),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Сессия основной БД для записи; после commit клиент читает с нее же"""
+    yield session
+    if replicas is not None and session.info.get("committed"):
+        replicas.mark_write(client_key(request))
+
+
+async def get_read_db(
+    request: Request,
+    session: AsyncSession = Depends(get_db),
+    replicas: Optional[ReplicaPool] = Depends(get_replica_pool),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия для чтения: реплика из пула или основная БД
+
+    Основная БД используется, если реплики не заданы или клиент недавно
+    выполнил запись (read-your-writes). Сессия основной БД не открывает
+    соединение, пока к ней нет запросов.
+    """
+    if replicas is None or replicas.is_sticky(client_key(request)):
+        yield session
+        return
+    async with replicas.session() as replica_session:
+        yield replica_session
+
+
 async def get_uow(session: AsyncSession) -> UnitOfWork:
     """Получить Unit of Work"""
     return UnitOfWork(session)
+
+
+def get_id_list(
+    ids: Optional[str] = Query(
+        None, description="ID через запятую: выборка по списку вместо страницы"
+    ),
+) -> Optional[List[int]]:
+    """Разобрать параметр ids=1,2,3 (None — параметр не передан)"""
+    if ids is None:
+        return None
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail="ids должен быть списком целых чисел через запятую"
+        )
+    if not parsed:
+        raise HTTPException(status_code=400, detail="ids не может быть пустым")
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"Не более {MAX_BATCH_IDS} ID в одном запросе"
+        )
+    return parsed
+
+
+def get_field_list(
+    fields: Optional[str] = Query(
+        None, description="Поля через запятую: вернуть только их (и id)"
+    ),
+) -> Optional[List[str]]:
+    """Разобрать параметр fields=name,date (None — все поля)"""
+    if fields is None:
+        return None
+    parsed = [part.strip() for part in fields.split(",") if part.strip()]
+    if not parsed:
+        raise HTTPException(status_code=400, detail="fields не может быть пустым")
+    return parsed
@@ -0,0 +1,25 @@
+from fastapi import Request, Response, status
+
+
+def make_etag(kind: str, entity_id: int, revision: int) -> str:
+    """Слабый ETag из типа сущности, ID и версии"""
+    return f'W/"{kind}-{entity_id}-{revision}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Совпадает ли If-None-Match с текущим ETag (слабое сравнение)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    current = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == current:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """Ответ 304 Not Modified без тела"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,60 @@
+import csv
+import io
+from typing import AsyncIterator
+
+import pydantic_core
+
+from src.business.dto.race_dto import RaceWithParticipantsDTO
+
+CSV_COLUMNS = (
+    "race_id",
+    "date",
+    "time",
+    "hippodrome",
+    "name",
+    "jockey_name",
+    "horse_name",
+    "place",
+    "time_result",
+)
+
+
+async def ndjson_lines(
+    races: AsyncIterator[RaceWithParticipantsDTO],
+) -> AsyncIterator[bytes]:
+    """Состязание на строку в формате GET /races/{id}"""
+    async for race in races:
+        yield pydantic_core.to_json(race) + b"\n"
+
+
+async def csv_lines(
+    races: AsyncIterator[RaceWithParticipantsDTO],
+) -> AsyncIterator[str]:
+    """
+    Плоская таблица: строка на участника
+
+    Состязание без участников выводится одной строкой с пустыми
+    полями участника.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(CSV_COLUMNS)
+    yield flush()
+
+    async for item in races:
+        race = item.race
+        prefix = [race.id, race.date, race.time, race.hippodrome, race.name or ""]
+        if not item.participants:
+            writer.writerow(prefix + [""] * 4)
+        for p in item.participants:
+            writer.writerow(
+                prefix + [p.jockey_name, p.horse_name, p.place, p.time_result or ""]
+            )
+        yield flush()
@@ -0,0 +1,199 @@
+"""
+Метрики в текстовом формате Prometheus
+
+Счетчики обновляются только из цикла событий (middleware), поэтому
+блокировки не нужны: запись — это поиск в словаре и пара сложений.
+Значения пула, запросов к БД и кэша собираются в момент выдачи /metrics.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from src.business.cache import ResponseCache
+from src.data.instrumentation import QueryStats
+
+# Границы корзин гистограммы задержек, секунды
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Маршрут запросов, не совпавших ни с одним шаблоном (404 и т.п.)
+UNMATCHED_ROUTE = "<unmatched>"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass
+class Histogram:
+    """Гистограмма с фиксированными корзинами (хранятся некумулятивно)"""
+
+    counts: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    total: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+
+
+class RequestMetrics:
+    """Задержки, число ответов и запросы в обработке по шаблонам маршрутов"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.responses: Dict[Tuple[str, str, str], int] = {}
+
+    def observe(self, method: str, route: str, status: int, duration: float) -> None:
+        key = (method, route)
+        histogram = self.latency.get(key)
+        if histogram is None:
+            histogram = self.latency[key] = Histogram()
+        histogram.observe(duration)
+
+        response_key = (method, route, str(status))
+        self.responses[response_key] = self.responses.get(response_key, 0) + 1
+
+    def reset(self) -> None:
+        self.in_flight = 0
+        self.latency.clear()
+        self.responses.clear()
+
+
+request_metrics = RequestMetrics()
+
+
+def render_metrics(
+    requests: RequestMetrics,
+    pool_status: Mapping[str, object],
+    query_totals: Mapping[Tuple[str, str], QueryStats],
+    caches: Mapping[str, ResponseCache],
+    replica_status: Sequence[Mapping[str, object]] = (),
+) -> str:
+    """Собрать все метрики в текстовый формат Prometheus"""
+    lines: List[str] = []
+
+    _header(lines, "http_requests_in_flight", "gauge", "Запросы в обработке")
+    lines.append(f"http_requests_in_flight {requests.in_flight}")
+
+    _header(
+        lines,
+        "http_request_duration_seconds",
+        "histogram",
+        "Время обработки запроса по шаблону маршрута",
+    )
+    for (method, route), histogram in sorted(requests.latency.items()):
+        labels = {"method": method, "route": route}
+        cumulative = 0
+        bounds = [_number(b) for b in LATENCY_BUCKETS] + ["+Inf"]
+        for bound, count in zip(bounds, histogram.counts):
+            cumulative += count
+            lines.append(
+                "http_request_duration_seconds_bucket"
+                f"{_labels({**labels, 'le': bound})} {cumulative}"
+            )
+        lines.append(
+            f"http_request_duration_seconds_sum{_labels(labels)} "
+            f"{_number(histogram.total)}"
+        )
+        lines.append(
+            f"http_request_duration_seconds_count{_labels(labels)} {cumulative}"
+        )
+
+    _header(lines, "http_responses_total", "counter", "Ответы по кодам статуса")
+    for (method, route, status), count in sorted(requests.responses.items()):
+        labels = {"method": method, "route": route, "status": status}
+        lines.append(f"http_responses_total{_labels(labels)} {count}")
+
+    _header(lines, "db_pool_info", "gauge", "Класс пула соединений")
+    lines.append(f"db_pool_info{_labels({'pool_class': pool_status['pool_class']})} 1")
+    for key in ("size", "checked_in", "checked_out", "overflow"):
+        if key in pool_status:
+            name = f"db_pool_{key}"
+            _header(lines, name, "gauge", f"Пул соединений: {key}")
+            lines.append(f"{name} {pool_status[key]}")
+
+    if replica_status:
+        _header(lines, "db_replica_pool_info", "gauge", "Класс пула реплики")
+        for status in replica_status:
+            labels = {"replica": status["replica"], "pool_class": status["pool_class"]}
+            lines.append(f"db_replica_pool_info{_labels(labels)} 1")
+    for key in ("size", "checked_in", "checked_out", "overflow", "sessions_in_use"):
+        present = [status for status in replica_status if key in status]
+        if not present:
+            continue
+        name = f"db_replica_pool_{key}"
+        _header(lines, name, "gauge", f"Пул соединений реплики: {key}")
+        for status in present:
+            lines.append(
+                f"{name}{_labels({'replica': status['replica']})} {status[key]}"
+            )
+
+    _header(
+        lines,
+        "db_queries_total",
+        "counter",
+        "Запросы к БД по маршруту и методу репозитория",
+    )
+    for (route, method), stats in sorted(query_totals.items()):
+        labels = {"route": route, "method": method}
+        lines.append(f"db_queries_total{_labels(labels)} {stats.count}")
+    _header(
+        lines,
+        "db_query_duration_seconds_total",
+        "counter",
+        "Суммарное время запросов к БД по маршруту и методу репозитория",
+    )
+    for (route, method), stats in sorted(query_totals.items()):
+        labels = {"route": route, "method": method}
+        lines.append(
+            f"db_query_duration_seconds_total{_labels(labels)} "
+            f"{_number(stats.duration)}"
+        )
+
+    cache_stats = {name: cache.stats() for name, cache in sorted(caches.items())}
+    for metric, key, kind, help_text in (
+        ("cache_hits_total", "hits", "counter", "Попадания в кэш"),
+        ("cache_misses_total", "misses", "counter", "Промахи кэша"),
+        ("cache_hit_ratio", "hit_ratio", "gauge", "Доля попаданий в кэш"),
+        ("cache_entries", "size", "gauge", "Записей в кэше"),
+    ):
+        _header(lines, metric, kind, help_text)
+        for name, stats in cache_stats.items():
+            # Размер известен не у всех бэкендов (у Redis — None)
+            if stats[key] is None:
+                continue
+            lines.append(f"{metric}{_labels({'cache': name})} {_number(stats[key])}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _header(lines: List[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _labels(labels: Mapping[str, object]) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _escape(value: object) -> str:
+    return (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
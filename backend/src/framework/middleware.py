@@ -0,0 +1,81 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.data.instrumentation import RequestContext, current_request, route_template
+from src.framework.metrics import UNMATCHED_ROUTE, RequestMetrics, request_metrics
+
+
+class QueryTimingMiddleware:
+    """
+    Учет запросов к БД в рамках HTTP-запроса
+
+    Выставляет current_request для инструментации движка и добавляет
+    заголовок Server-Timing с числом запросов и временем в БД на момент
+    начала ответа (для потоковых ответов — до первой порции данных).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = RequestContext(scope)
+        token = current_request.set(request)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                queries = request.queries
+                value = (
+                    f'db;dur={queries.duration * 1000:.1f};'
+                    f'desc="{queries.count} queries"'
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", value.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+
+
+class MetricsMiddleware:
+    """
+    Замер задержки запросов по шаблону маршрута для /metrics
+
+    Шаблон определяется по scope["route"] после маршрутизации, так что
+    /races/1 и /races/2 попадают в одну гистограмму /races/{race_id}.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.in_flight -= 1
+            route = route_template(scope) or UNMATCHED_ROUTE
+            self.metrics.observe(
+                scope["method"], route, status, time.perf_counter() - start
+            )
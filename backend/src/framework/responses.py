@@ -0,0 +1,46 @@
+from typing import Any, Mapping, Optional, Sequence
+
+import pydantic_core
+from fastapi import Response
+
+from src.config import settings
+
+
+class TrustedJSONResponse(Response):
+    """
+    JSON-ответ из DTO бизнес-слоя без повторной валидации
+
+    DTO уже проверены при создании в операциях, поэтому сериализуются
+    напрямую ядром pydantic (Rust), минуя response_model роутера.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+def dto_response(
+    content: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> Any:
+    """
+    Вернуть DTO как ответ
+
+    При API_TRUSTED_RESPONSES=true — готовый TrustedJSONResponse, иначе сами
+    DTO для стандартной валидации по response_model.
+    """
+    if not settings.api_trusted_responses:
+        return content
+    return TrustedJSONResponse(content, status_code=status_code, headers=headers)
+
+
+def fields_response(content: Any, fields: Optional[Sequence[str]]) -> Any:
+    """
+    Вернуть список с выбранными полями (fields=) или полные DTO
+
+    Записи с частью полей не проходят проверку по response_model, поэтому
+    такой ответ всегда сериализуется напрямую (TrustedJSONResponse).
+    """
+    if fields is None:
+        return dto_response(content)
+    return TrustedJSONResponse(content)
@@ -1,8 +1,32 @@
 import datetime
-from typing import Optional
+from typing import Generic, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+ItemT = TypeVar("ItemT")
+
+
+# Общие схемы
+class PageResponse(BaseModel, Generic[ItemT]):
+    """Страница keyset-пагинации"""
+
+    items: list[ItemT]
+    next_cursor: Optional[str] = Field(
+        None, description="Курсор следующей страницы (null — страниц больше нет)"
+    )
+
+
+class BatchResponse(BaseModel, Generic[ItemT]):
+    """Выборка по списку ID"""
+
+    items: list[ItemT] = Field(..., description="Найденные записи в порядке запроса")
+    missing: list[int] = Field(
+        default_factory=list, description="Запрошенные ID, которых нет в базе"
+    )
+
+
+# Максимум строк в одном запросе пакетного создания
+BULK_CREATE_MAX_ROWS = 10000
 
 # Схемы для Race
 class RaceCreate(BaseModel):
@@ -46,6 +70,20 @@ class RaceWithParticipantsResponse(BaseModel):
     participants: list[ParticipantResultResponse]
 
 
+class PerformanceStatsResponse(BaseModel):
+    """Статистика выступлений жокея или лошади"""
+
+    starts: int = Field(..., description="Количество стартов")
+    wins: int = Field(..., description="Количество побед")
+    podiums: int = Field(..., description="Количество призовых мест (1-3)")
+    win_rate: float
+    podium_rate: float
+    mean_place: Optional[float] = Field(None, description="Среднее место")
+    best_time: Optional[datetime.time] = Field(None, description="Лучшее время")
+    date_from: Optional[datetime.date] = None
+    date_to: Optional[datetime.date] = None
+
+
 # Схемы для Jockey
 class JockeyBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
@@ -60,6 +98,14 @@ class JockeyCreate(JockeyBase):
     pass
 
 
+class JockeysBulkCreate(BaseModel):
+    """Схема пакетного создания жокеев"""
+
+    items: list[JockeyCreate] = Field(
+        ..., min_length=1, max_length=BULK_CREATE_MAX_ROWS
+    )
+
+
 class JockeyResponse(JockeyBase):
     """Схема ответа для жокея"""
 
@@ -82,6 +128,12 @@ class HorseCreate(HorseBase):
     pass
 
 
+class HorsesBulkCreate(BaseModel):
+    """Схема пакетного создания лошадей"""
+
+    items: list[HorseCreate] = Field(..., min_length=1, max_length=BULK_CREATE_MAX_ROWS)
+
+
 class HorseResponse(HorseBase):
     """Схема ответа для лошади"""
 
@@ -103,6 +155,12 @@ class OwnerCreate(OwnerBase):
     pass
 
 
+class OwnersBulkCreate(BaseModel):
+    """Схема пакетного создания владельцев"""
+
+    items: list[OwnerCreate] = Field(..., min_length=1, max_length=BULK_CREATE_MAX_ROWS)
+
+
 class OwnerResponse(OwnerBase):
     """Схема ответа для владельца"""
 
@@ -133,3 +191,38 @@ class ParticipantResponse(BaseModel):
     time_result: Optional[datetime.time]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class RaceResultRow(BaseModel):
+    """Строка итогового протокола состязания"""
+
+    jockey_id: int = Field(..., gt=0)
+    horse_id: int = Field(..., gt=0)
+    place: int = Field(..., gt=0)
+    time_result: Optional[datetime.time] = None
+
+
+class RaceResultsBulkCreate(BaseModel):
+    """Схема пакетной загрузки результатов состязания"""
+
+    results: list[RaceResultRow] = Field(..., min_length=1, max_length=1000)
+
+
+# Схемы для рейтинга
+class SearchResultResponse(BaseModel):
+    """Результат поиска: лошадь, жокей или владелец"""
+
+    kind: Literal["horse", "jockey", "owner"]
+    id: int
+    title: str
+    score: float
+
+
+class LeaderboardEntryResponse(BaseModel):
+    """Строка рейтинга жокеев или лошадей"""
+
+    entity_id: int
+    name: str
+    starts: int
+    wins: int
+    podiums: int
@@ -1,8 +1,27 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
-from src.data.database import init_db
-from src.framework.api.v1 import horses, jockeys, owners, participants, races
+from src.business.operations.race_operations import race_cache
+from src.data import database
+from src.data.database import (
+    dispose_database,
+    get_pool_status,
+    get_replica_pool_status,
+    prepare_database,
+)
+from src.data.instrumentation import query_totals
+from src.framework.api.v1 import (
+    horses,
+    jockeys,
+    leaderboard,
+    owners,
+    participants,
+    races,
+    search,
+)
+from src.framework.metrics import CONTENT_TYPE, render_metrics, request_metrics
+from src.framework.middleware import MetricsMiddleware, QueryTimingMiddleware
 
 app = FastAPI(
     title="RaceTracker API",
@@ -25,12 +44,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Server-Timing: число запросов и время в БД
+app.add_middleware(QueryTimingMiddleware)
+# Задержки по шаблонам маршрутов и запросы в обработке для /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Подключение роутеров
 app.include_router(races.router, prefix="/api/v1")
 app.include_router(jockeys.router, prefix="/api/v1")
 app.include_router(horses.router, prefix="/api/v1")
 app.include_router(owners.router, prefix="/api/v1")
 app.include_router(participants.router, prefix="/api/v1")
+app.include_router(leaderboard.router, prefix="/api/v1")
+app.include_router(search.router, prefix="/api/v1")
 
 
 @app.get("/health")
@@ -38,6 +64,43 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/db-pool")
+async def db_pool_status():
+    """
+    Счетчики пула соединений: checked-in, checked-out, overflow
+
+    replicas — пулы реплик чтения (пустой список, если реплики не заданы).
+    """
+    return {
+        **get_pool_status(),
+        "replicas": get_replica_pool_status(database.replica_pool),
+    }
+
+
+@app.get("/health/cache")
+async def cache_status():
+    """Счетчики кэша ответов: попадания, промахи, размер"""
+    return race_cache.stats()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Метрики в текстовом формате Prometheus"""
+    content = render_metrics(
+        request_metrics,
+        get_pool_status(),
+        query_totals,
+        {"race": race_cache},
+        replica_status=get_replica_pool_status(database.replica_pool),
+    )
+    return PlainTextResponse(content, media_type=CONTENT_TYPE)
+
+
 @app.on_event("startup")
 async def startup():
-    await init_db()
+    await prepare_database()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await dispose_database()
@@ -2,10 +2,20 @@ import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from src.business.operations.race_operations import race_cache
+from src.data.loading import disable_strict_loading, enable_strict_loading
 from src.data.models import Base
 from src.data.uow import UnitOfWork
 
 
+@pytest.fixture(scope="session", autouse=True)
+def strict_loading():
+    """Любая незапланированная ленивая загрузка связи валит тест"""
+    enable_strict_loading()
+    yield
+    disable_strict_loading()
+
+
 @pytest_asyncio.fixture
 async def async_session():
     """Создать тестовую БД в памяти"""
@@ -28,3 +38,11 @@ async def async_session():
 async def uow(async_session):
     """Создать UnitOfWork для тестирования"""
     return UnitOfWork(async_session)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_race_cache():
+    """Изолировать кэш ответов между тестами (ID в БД в памяти повторяются)"""
+    await race_cache.clear()
+    yield
+    await race_cache.clear()
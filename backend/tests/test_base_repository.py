@@ -0,0 +1,213 @@
+from datetime import date, time
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+from src.config import settings
+from src.data.loading import UnplannedLoadError
+from src.data.models import Race
+from src.data.uow import UnitOfWork
+
+RACE = {"date": date(2030, 6, 1), "time": time(12), "hippodrome": "Ипподром"}
+
+
+def _capture(async_session: AsyncSession, statements: list):
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(async_session.bind.sync_engine, "before_cursor_execute", listener)
+    return listener
+
+
+def _release(async_session: AsyncSession, listener) -> None:
+    event.remove(async_session.bind.sync_engine, "before_cursor_execute", listener)
+
+
+@pytest.mark.asyncio
+async def test_create_single_statement(async_session: AsyncSession):
+    """create: один INSERT ... RETURNING без refresh"""
+    uow = UnitOfWork(async_session)
+
+    statements = []
+    listener = _capture(async_session, statements)
+    try:
+        race = await uow.races.create(RACE)
+    finally:
+        _release(async_session, listener)
+
+    assert len(statements) == 1
+    assert statements[0].lstrip().startswith("INSERT")
+    assert "RETURNING" in statements[0]
+    assert race.id is not None
+    assert race.revision == 1
+
+
+@pytest.mark.asyncio
+async def test_update_single_statement(async_session: AsyncSession):
+    """update: один UPDATE ... RETURNING, объект в сессии обновлен"""
+    uow = UnitOfWork(async_session)
+    race = await uow.races.create(RACE)
+
+    statements = []
+    listener = _capture(async_session, statements)
+    try:
+        updated = await uow.races.update(race.id, {"name": "Кубок"})
+        missing = await uow.races.update(999, {"name": "Кубок"})
+    finally:
+        _release(async_session, listener)
+
+    # Ни выборки, ни refresh, ни загрузки связей
+    assert [s.lstrip().split()[0] for s in statements] == ["UPDATE", "UPDATE"]
+    assert updated is race
+    assert race.name == "Кубок"
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_returning_disabled_falls_back_to_refresh(
+    async_session: AsyncSession, monkeypatch
+):
+    """DB_USE_RETURNING=false: прежний путь flush + refresh"""
+    monkeypatch.setattr(settings, "db_use_returning", False)
+    uow = UnitOfWork(async_session, batch_loading=False)
+
+    statements = []
+    listener = _capture(async_session, statements)
+    try:
+        race = await uow.races.create(RACE)
+        updated = await uow.races.update(race.id, {"name": "Кубок"})
+    finally:
+        _release(async_session, listener)
+
+    assert updated.name == "Кубок"
+    assert [s.lstrip().split()[0] for s in statements[:2]] == ["INSERT", "SELECT"]
+    assert any(s.lstrip().startswith("UPDATE") for s in statements)
+
+
+@pytest.mark.asyncio
+async def test_insert_and_update_returning_checked_separately(
+    async_session: AsyncSession, monkeypatch
+):
+    """Диалект без UPDATE ... RETURNING: create без refresh, update через refresh"""
+    monkeypatch.setattr(async_session.bind.dialect, "update_returning", False)
+    uow = UnitOfWork(async_session, batch_loading=False)
+
+    statements = []
+    listener = _capture(async_session, statements)
+    try:
+        race = await uow.races.create(RACE)
+        updated = await uow.races.update(race.id, {"name": "Кубок"})
+    finally:
+        _release(async_session, listener)
+
+    assert updated.name == "Кубок"
+    assert "RETURNING" in statements[0]
+    assert [s.lstrip().split()[0] for s in statements] == [
+        "INSERT",
+        "SELECT",
+        "UPDATE",
+        "SELECT",
+    ]
+    assert "RETURNING" not in statements[2]
+
+
+@pytest.mark.asyncio
+async def test_list_rows_projection(async_session: AsyncSession):
+    """list_rows_page: только запрошенные колонки и колонки ключа, без связей"""
+    uow = UnitOfWork(async_session)
+    for day in (3, 1, 2):
+        await uow.races.create({**RACE, "date": date(2030, 6, day)})
+
+    statements = []
+    listener = _capture(async_session, statements)
+    try:
+        rows, next_cursor = await uow.races.list_rows_page(["hippodrome"], limit=2)
+    finally:
+        _release(async_session, listener)
+
+    assert len(statements) == 1
+    assert "race_participants" not in statements[0]
+    assert list(rows[0]._mapping) == ["hippodrome", "date", "id"]
+    assert [row.date.day for row in rows] == [1, 2]
+    assert next_cursor is not None
+
+    with pytest.raises(ValueError, match="Неизвестные поля"):
+        await uow.races.list_rows(["participants"])
+
+
+async def _create_race_with_participant(uow: UnitOfWork) -> Race:
+    race = await uow.races.create(RACE)
+    jockey = await uow.jockeys.create(
+        {"name": "Иванов", "address": "Москва", "age": 30, "rating": 90}
+    )
+    owner = await uow.owners.create(
+        {"name": "Петров", "address": "Москва", "phone": "+7"}
+    )
+    horse = await uow.horses.create(
+        {"nickname": "Гром", "gender": "STALLION", "age": 4, "owner_id": owner.id}
+    )
+    await uow.participants.create(
+        {"race_id": race.id, "jockey_id": jockey.id, "horse_id": horse.id, "place": 1}
+    )
+    await uow.commit()
+    uow.session.expunge_all()
+    return race
+
+
+@pytest.mark.asyncio
+async def test_relationships_not_loaded_by_default(async_session: AsyncSession):
+    """Без профиля загрузки связи не загружаются, обращение к ним — ошибка"""
+    uow = UnitOfWork(async_session, batch_loading=False)
+    race = await _create_race_with_participant(uow)
+
+    statements = []
+    listener = _capture(async_session, statements)
+    try:
+        loaded = await uow.races.get_by_id(race.id)
+        races = await uow.races.list()
+    finally:
+        _release(async_session, listener)
+
+    assert len(statements) == 2
+    assert not [s for s in statements if "race_participants" in s]
+    assert races == [loaded]
+    with pytest.raises(InvalidRequestError):
+        loaded.participants
+
+
+@pytest.mark.asyncio
+async def test_loader_profile(async_session: AsyncSession):
+    """Профиль standings: участники, жокеи и лошади двумя запросами"""
+    uow = UnitOfWork(async_session)
+    race = await _create_race_with_participant(uow)
+
+    statements = []
+    listener = _capture(async_session, statements)
+    try:
+        loaded = await uow.races.get_with_participants(race.id)
+        participants = await uow.participants.get_by_race_id(
+            race.id, with_relations=True
+        )
+    finally:
+        _release(async_session, listener)
+
+    assert len(statements) == 3
+    participant = loaded.participants[0]
+    assert (participant.jockey.name, participant.horse.nickname) == ("Иванов", "Гром")
+    assert participants[0].horse.owner_id == participant.horse.owner_id
+
+    with pytest.raises(ValueError, match="Неизвестный профиль"):
+        await uow.races.list(load="jockeys")
+
+
+@pytest.mark.asyncio
+async def test_strict_loading_rejects_lazy_load(async_session: AsyncSession):
+    """Строгий режим: ленивая загрузка в обход raiseload тоже падает"""
+    uow = UnitOfWork(async_session)
+    race = await _create_race_with_participant(uow)
+
+    query = select(Race).where(Race.id == race.id).options(lazyload(Race.participants))
+    loaded = (await async_session.execute(query)).scalar_one()
+
+    with pytest.raises(UnplannedLoadError, match="Race"):
+        await async_session.run_sync(lambda _: loaded.participants)
@@ -0,0 +1,28 @@
+import pytest
+from benchmarks import load_test
+from benchmarks.bench_suite import GROUPS, SCENARIOS, run
+
+
+@pytest.mark.asyncio
+async def test_bench_suite_smoke():
+    """Все сценарии бенчмарков выполняются на малом наборе данных"""
+    report = await run("sqlite+aiosqlite:///:memory:", "small", GROUPS, 1, seed=1)
+
+    for group in GROUPS:
+        assert f"[{group}]" in report
+        for label in SCENARIOS[group]():
+            assert label in report
+
+
+@pytest.mark.asyncio
+async def test_load_test_smoke():
+    """Нагрузочный тест в процессе: все действия смеси выполняются без ошибок"""
+    mix = load_test.parse_mix("poll=3,results=1,browse=1")
+    report = await load_test.run(
+        None, mix, concurrency=3, duration=0.5, races=3, runners=2, seed=1
+    )
+
+    assert "ошибок: 0 " in report
+    assert "Пул БД: AsyncAdaptedQueuePool" in report
+    for label in ("GET /races/{id}", "POST /participants/", "browse lists"):
+        assert label in report
@@ -0,0 +1,138 @@
+from datetime import date, time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.business import cache as cache_module
+from src.business.cache import MemoryCacheBackend, ResponseCache
+from src.business.dto.horse_dto import HorseCreateDTO
+from src.business.dto.jockey_dto import JockeyCreateDTO
+from src.business.dto.owner_dto import OwnerCreateDTO
+from src.business.dto.participant_dto import ParticipantCreateDTO
+from src.business.dto.race_dto import RaceCreateDTO
+from src.business.operations.horse_operations import create_horse
+from src.business.operations.jockey_operations import create_jockey
+from src.business.operations.owner_operations import create_owner
+from src.business.operations.participant_operations import add_participant_with_result
+from src.business.operations.race_operations import (
+    create_race,
+    get_race_with_participants,
+    race_cache,
+)
+from src.data.uow import UnitOfWork
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_lru_eviction():
+    """Тест вытеснения давно не используемых записей"""
+    backend = MemoryCacheBackend(max_size=2, ttl=60)
+
+    await backend.set("a", 1)
+    await backend.set("b", 2)
+    await backend.get("a")
+    await backend.set("c", 3)
+
+    assert await backend.get("a") == 1
+    assert await backend.get("b") is None
+    assert await backend.get("c") == 3
+    assert backend.size() == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_ttl(monkeypatch):
+    """Тест истечения TTL"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    backend = MemoryCacheBackend(max_size=10, ttl=5)
+
+    await backend.set("a", 1)
+    now[0] += 4
+    assert await backend.get("a") == 1
+    now[0] += 2
+    assert await backend.get("a") is None
+    assert backend.size() == 0
+
+
+@pytest.mark.asyncio
+async def test_response_cache_counters():
+    """Тест счетчиков попаданий и промахов"""
+    cache = ResponseCache(MemoryCacheBackend())
+
+    assert await cache.get(1) is None
+    await cache.set(1, "value")
+    assert await cache.get(1) == "value"
+    await cache.invalidate(1)
+    assert await cache.get(1) is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_ratio"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_race_cache_invalidated_on_participant(async_session: AsyncSession):
+    """Тест: добавление результата сбрасывает кэш состязания"""
+    uow = UnitOfWork(async_session)
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    jockey = await create_jockey(
+        uow, JockeyCreateDTO(name="Жокей", address="Москва", age=25, rating=5)
+    )
+    horse = await create_horse(
+        uow, HorseCreateDTO(nickname="Гром", gender="мерин", age=4, owner_id=owner.id)
+    )
+    race = await create_race(
+        uow,
+        RaceCreateDTO(date=date(2030, 3, 15), time=time(14, 30), hippodrome="Ипподром"),
+    )
+
+    first = await get_race_with_participants(uow, race.id)
+    second = await get_race_with_participants(uow, race.id)
+    assert second is first
+    assert race_cache.hits == 1
+
+    await add_participant_with_result(
+        uow,
+        ParticipantCreateDTO(
+            race_id=race.id, jockey_id=jockey.id, horse_id=horse.id, place=1
+        ),
+    )
+
+    updated = await get_race_with_participants(uow, race.id)
+    assert len(updated.participants) == 1
+    assert race_cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_race_cache_keyed_by_revision(async_session: AsyncSession):
+    """Тест: ответ кэшируется по версии, устаревшая версия не подменяет новую"""
+    uow = UnitOfWork(async_session)
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    jockey = await create_jockey(
+        uow, JockeyCreateDTO(name="Жокей", address="Москва", age=25, rating=5)
+    )
+    horse = await create_horse(
+        uow, HorseCreateDTO(nickname="Гром", gender="мерин", age=4, owner_id=owner.id)
+    )
+    race = await create_race(
+        uow,
+        RaceCreateDTO(date=date(2030, 3, 15), time=time(14, 30), hippodrome="Ипподром"),
+    )
+    before = await get_race_with_participants(uow, race.id, revision=1)
+
+    await add_participant_with_result(
+        uow,
+        ParticipantCreateDTO(
+            race_id=race.id, jockey_id=jockey.id, horse_id=horse.id, place=1
+        ),
+    )
+
+    # Читатель реплики, еще не получившей запись, видит версию 1 и ее ответ
+    stale = await get_race_with_participants(uow, race.id, revision=1)
+    fresh = await get_race_with_participants(uow, race.id, revision=2)
+    assert stale is before and stale.participants == []
+    assert len(fresh.participants) == 1
+    assert await get_race_with_participants(uow, race.id) is fresh
@@ -0,0 +1,140 @@
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.data.uow import UnitOfWork
+
+
+@contextmanager
+def capture_statements(async_session: AsyncSession):
+    """Собрать SQL, выполненные через сессию"""
+    statements = []
+    sync_engine = async_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+
+async def _create_jockeys(uow: UnitOfWork, count: int) -> list[int]:
+    ids = []
+    for i in range(count):
+        jockey = await uow.jockeys.create(
+            {"name": f"Жокей {i}", "address": "Москва", "age": 25, "rating": 5}
+        )
+        ids.append(jockey.id)
+    await uow.commit()
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_by_id_batched(async_session: AsyncSession):
+    """Вызовы get_by_id в одном проходе цикла — один запрос IN"""
+    uow = UnitOfWork(async_session, batch_loading=True)
+    ids = await _create_jockeys(uow, 3)
+
+    with capture_statements(async_session) as statements:
+        jockeys = await asyncio.gather(
+            *(uow.jockeys.get_by_id(id) for id in [*ids, 999])
+        )
+
+    assert len(statements) == 1
+    assert " IN " in statements[0]
+    assert [j.id for j in jockeys[:3]] == ids
+    assert jockeys[3] is None
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_cached_until_commit(async_session: AsyncSession):
+    """Повторный get_by_id берется из кэша, commit сбрасывает кэш"""
+    uow = UnitOfWork(async_session, batch_loading=True)
+    ids = await _create_jockeys(uow, 1)
+
+    with capture_statements(async_session) as statements:
+        first = await uow.jockeys.get_by_id(ids[0])
+        again = await uow.jockeys.get_by_id(ids[0])
+        missing = await uow.jockeys.get_by_id(999)
+        missing_again = await uow.jockeys.get_by_id(999)
+    assert len(statements) == 2
+    assert first is again
+    assert missing is None and missing_again is None
+
+    await uow.commit()
+    with capture_statements(async_session) as statements:
+        await uow.jockeys.get_by_id(ids[0])
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_different_models_in_one_tick(async_session: AsyncSession):
+    """Разные модели в одном проходе грузятся последовательно в одной сессии"""
+    uow = UnitOfWork(async_session, batch_loading=True)
+    jockey_ids = await _create_jockeys(uow, 2)
+    owner = await uow.owners.create(
+        {"name": "Владелец", "address": "Москва", "phone": "+7"}
+    )
+
+    with capture_statements(async_session) as statements:
+        results = await asyncio.gather(
+            uow.jockeys.get_by_id(jockey_ids[0]),
+            uow.owners.get_by_id(owner.id),
+            uow.jockeys.get_by_id(jockey_ids[1]),
+        )
+
+    assert len(statements) == 1  # владелец уже в кэше после create
+    assert [r.id for r in results] == [jockey_ids[0], owner.id, jockey_ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_batch_loading_disabled(async_session: AsyncSession):
+    """Без загрузчика каждый get_by_id — отдельный запрос"""
+    uow = UnitOfWork(async_session, batch_loading=False)
+    ids = await _create_jockeys(uow, 2)
+
+    with capture_statements(async_session) as statements:
+        for id in ids:
+            await uow.jockeys.get_by_id(id)
+
+    assert len(statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_loader_batch_does_not_overlap_repository_calls(
+    async_session: AsyncSession,
+):
+    """Пакет загрузчика и запросы репозиториев не выполняются одновременно"""
+    uow = UnitOfWork(async_session, batch_loading=True)
+    ids = await _create_jockeys(uow, 2)
+
+    active = peak = 0
+    execute = async_session.execute
+
+    async def tracked_execute(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(0)
+            return await execute(*args, **kwargs)
+        finally:
+            active -= 1
+
+    async_session.execute = tracked_execute
+    with capture_statements(async_session) as statements:
+        first, jockeys = await asyncio.gather(
+            uow.jockeys.get_by_id(ids[0]), uow.jockeys.list()
+        )
+        # Второй get_by_id того же ID, пока первый пакет еще выполняется
+        batch = asyncio.ensure_future(uow.jockeys.get_by_id(ids[1]))
+        await asyncio.sleep(0)
+        again = asyncio.ensure_future(uow.jockeys.get_by_id(ids[1]))
+        second, repeated = await asyncio.gather(batch, again)
+
+    assert peak == 1
+    assert first.id == ids[0] and len(jockeys) == 2
+    assert second is repeated and second.id == ids[1]
+    assert len(statements) == 3
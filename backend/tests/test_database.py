@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.config import Settings
+from src.data import database
+from src.data.database import (
+    build_engine_kwargs,
+    build_engine_url,
+    check_dialect,
+    create_engine_from_settings,
+    get_pool_status,
+)
+
+
+def test_engine_kwargs_postgres():
+    """Тест параметров пула и asyncpg из настроек"""
+    config = Settings(
+        database_url="postgresql+asyncpg://u:p@db:5432/race",
+        db_pool_size=20,
+        db_max_overflow=5,
+        db_pool_recycle=600,
+        db_statement_cache_size=0,
+        db_command_timeout=15,
+    )
+
+    kwargs = build_engine_kwargs(config)
+
+    assert kwargs["echo"] is False
+    assert kwargs["pool_size"] == 20
+    assert kwargs["max_overflow"] == 5
+    assert kwargs["pool_recycle"] == 600
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["connect_args"] == {"statement_cache_size": 0, "command_timeout": 15}
+
+
+@pytest.mark.asyncio
+async def test_engine_url_disables_prepared_statement_cache():
+    """Тест: размер кэша подготовленных запросов передается адаптеру asyncpg"""
+    config = Settings(
+        database_url="postgresql+asyncpg://u:p@db:5432/race",
+        db_statement_cache_size=0,
+    )
+
+    url = build_engine_url(config)
+    engine = create_engine_from_settings(config)
+    _, connect_opts = engine.dialect.create_connect_args(engine.url)
+
+    assert url.query == {"prepared_statement_cache_size": "0"}
+    assert connect_opts["prepared_statement_cache_size"] == 0
+    await engine.dispose()
+
+
+def test_engine_url_sqlite_unchanged():
+    """Тест: для других драйверов URL не меняется"""
+    config = Settings(database_url="sqlite+aiosqlite:///race.db")
+
+    assert build_engine_url(config).query == {}
+
+
+def test_engine_kwargs_sqlite_memory():
+    """Тест: для SQLite в памяти параметры пула не передаются"""
+    config = Settings(database_url="sqlite+aiosqlite:///:memory:", db_echo=True)
+
+    kwargs = build_engine_kwargs(config)
+
+    assert kwargs["echo"] is True
+    assert "pool_size" not in kwargs
+    assert "connect_args" not in kwargs
+
+
+@pytest.mark.asyncio
+async def test_pool_status_counters(tmp_path):
+    """Тест счетчиков пула соединений"""
+    config = Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+    engine = create_async_engine(config.database_url, **build_engine_kwargs(config))
+
+    async with engine.connect():
+        status = get_pool_status(engine)
+        assert status["checked_out"] == 1
+
+    status = get_pool_status(engine)
+    assert status["pool_class"] == "AsyncAdaptedQueuePool"
+    assert status["size"] == config.db_pool_size
+    assert status["checked_out"] == 0
+    assert status["checked_in"] == 1
+    await engine.dispose()
+
+
+def test_check_dialect():
+    """Тест: СУБД без INSERT ... ON CONFLICT отклоняется при старте"""
+    check_dialect(create_async_engine("sqlite+aiosqlite://"))
+
+    with pytest.raises(RuntimeError, match="mssql не поддерживается"):
+        check_dialect(SimpleNamespace(dialect=SimpleNamespace(name="mssql")))
+
+
+def test_check_dialect_requires_search(monkeypatch):
+    """Тест: СУБД без индексов поиска тоже отклоняется"""
+    monkeypatch.setattr(database, "SEARCH_DIALECTS", ("postgresql",))
+
+    with pytest.raises(RuntimeError, match="sqlite не поддерживается"):
+        check_dialect(create_async_engine("sqlite+aiosqlite://"))
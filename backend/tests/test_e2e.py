@@ -3,6 +3,9 @@ E2E тесты для всех API эндпоинтов.
 Используют httpx.AsyncClient + FastAPI TestClient подход.
 """
 
+import csv
+import io
+import json
 from datetime import date, time
 
 import pytest
@@ -10,6 +13,7 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from src.config import settings
 from src.data.models import Base
 from src.framework.dependencies import get_db
 from src.main import app
@@ -134,6 +138,40 @@ async def test_list_races(client: AsyncClient):
     assert len(data) == 2
 
 
+@pytest.mark.asyncio
+async def test_list_races_cursor(client: AsyncClient):
+    """GET /api/v1/races/?cursor= — keyset-пагинация с next_cursor."""
+    for day in (3, 1, 2):
+        await client.post(
+            "/api/v1/races/",
+            json={
+                "date": f"2030-05-0{day}",
+                "time": "12:00:00",
+                "hippodrome": "Ипподром",
+            },
+        )
+
+    first = await client.get("/api/v1/races/", params={"cursor": "", "limit": 2})
+    assert first.status_code == 200
+    page1 = first.json()
+    assert [r["date"] for r in page1["items"]] == ["2030-05-01", "2030-05-02"]
+    assert page1["next_cursor"]
+
+    second = await client.get(
+        "/api/v1/races/", params={"cursor": page1["next_cursor"], "limit": 2}
+    )
+    page2 = second.json()
+    assert [r["date"] for r in page2["items"]] == ["2030-05-03"]
+    assert page2["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_races_invalid_cursor(client: AsyncClient):
+    """GET /api/v1/races/?cursor=... — поврежденный курсор → 400."""
+    response = await client.get("/api/v1/races/", params={"cursor": "мусор"})
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_race_by_id(client: AsyncClient):
     """GET /api/v1/races/{id} — получение состязания с участниками."""
@@ -271,6 +309,26 @@ async def test_list_jockeys(client: AsyncClient):
     assert len(response.json()) >= 1
 
 
+@pytest.mark.asyncio
+async def test_list_jockeys_cursor(client: AsyncClient):
+    """GET /api/v1/jockeys/?cursor= — обход всех страниц по курсору."""
+    for i in range(3):
+        await client.post(
+            "/api/v1/jockeys/",
+            json={"name": f"Жокей {i}", "address": "Адрес", "age": 25, "rating": 5},
+        )
+
+    names, cursor = [], ""
+    while cursor is not None:
+        page = (
+            await client.get("/api/v1/jockeys/", params={"cursor": cursor, "limit": 2})
+        ).json()
+        names += [j["name"] for j in page["items"]]
+        cursor = page["next_cursor"]
+
+    assert names == ["Жокей 0", "Жокей 1", "Жокей 2"]
+
+
 @pytest.mark.asyncio
 async def test_get_jockey_by_id(client: AsyncClient):
     """GET /api/v1/jockeys/{id} — получение жокея по ID."""
@@ -377,6 +435,75 @@ async def test_list_horses(client: AsyncClient):
     assert len(response.json()) >= 1
 
 
+@pytest.mark.asyncio
+async def test_batch_lookup_by_ids(client: AsyncClient):
+    """GET /api/v1/{jockeys,horses,owners}/?ids= — выборка по списку ID."""
+    owner_id, jockey_id, horse_id, _ = await _create_full_setup(client)
+
+    for url, entity_id in [
+        ("/api/v1/jockeys/", jockey_id),
+        ("/api/v1/horses/", horse_id),
+        ("/api/v1/owners/", owner_id),
+    ]:
+        response = await client.get(url, params={"ids": f"999,{entity_id}"})
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [entity_id]
+        assert data["missing"] == [999]
+
+    invalid = await client.get("/api/v1/horses/", params={"ids": "1,abc"})
+    assert invalid.status_code == 400
+    empty = await client.get("/api/v1/horses/", params={"ids": ""})
+    assert empty.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_create(client: AsyncClient):
+    """POST /api/v1/{owners,jockeys,horses}:bulk — пакетное создание."""
+    owners = await client.post(
+        "/api/v1/owners:bulk",
+        json={
+            "items": [
+                {"name": f"Владелец {i}", "address": "Адрес", "phone": "123"}
+                for i in range(3)
+            ]
+        },
+    )
+    assert owners.status_code == 201
+    owner_ids = [o["id"] for o in owners.json()]
+    assert len(owner_ids) == 3
+
+    horses = await client.post(
+        "/api/v1/horses:bulk",
+        json={
+            "items": [
+                {"nickname": "Гром", "gender": "жеребец", "age": 5, "owner_id": id}
+                for id in owner_ids
+            ]
+        },
+    )
+    assert horses.status_code == 201
+    assert [h["owner_id"] for h in horses.json()] == owner_ids
+
+    jockeys = await client.post(
+        "/api/v1/jockeys:bulk",
+        json={
+            "items": [
+                {"name": "Жокей", "address": "Адрес", "age": 25, "rating": 7},
+                {"name": "Юниор", "address": "Адрес", "age": 15, "rating": 7},
+            ]
+        },
+    )
+    assert jockeys.status_code == 400
+    assert jockeys.json()["detail"] == [
+        {"index": 1, "error": "Возраст жокея должен быть не менее 16 лет"}
+    ]
+    assert (await client.get("/api/v1/jockeys/")).json() == []
+
+    empty = await client.post("/api/v1/horses:bulk", json={"items": []})
+    assert empty.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_get_horse_by_id(client: AsyncClient):
     """GET /api/v1/horses/{id} — получение лошади по ID."""
@@ -516,6 +643,52 @@ async def test_add_participant_duplicate(client: AsyncClient):
 # ============================================================
 
 
+@pytest.mark.asyncio
+async def test_add_race_results_bulk(client: AsyncClient):
+    """POST /api/v1/races/{id}/results:bulk — загрузка протокола целиком."""
+    _, jockey_id, horse_id, race_id = await _create_full_setup(client)
+
+    response = await client.post(
+        f"/api/v1/races/{race_id}/results:bulk",
+        json={
+            "results": [
+                {"jockey_id": jockey_id, "horse_id": horse_id, "place": 1},
+            ]
+        },
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["race_id"] == race_id
+
+    race = (await client.get(f"/api/v1/races/{race_id}")).json()
+    assert len(race["participants"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_add_race_results_bulk_errors(client: AsyncClient):
+    """POST /api/v1/races/{id}/results:bulk — ошибки по строкам → 400."""
+    _, jockey_id, horse_id, race_id = await _create_full_setup(client)
+
+    response = await client.post(
+        f"/api/v1/races/{race_id}/results:bulk",
+        json={
+            "results": [
+                {"jockey_id": jockey_id, "horse_id": horse_id, "place": 1},
+                {"jockey_id": 999, "horse_id": horse_id, "place": 2},
+            ]
+        },
+    )
+    assert response.status_code == 400
+    assert [e["index"] for e in response.json()["detail"]] == [1]
+
+    missing = await client.post(
+        "/api/v1/races/999/results:bulk",
+        json={"results": [{"jockey_id": jockey_id, "horse_id": horse_id, "place": 1}]},
+    )
+    assert missing.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_race_with_participants(client: AsyncClient):
     """GET /api/v1/races/{id} — состязание с результатами участников."""
@@ -543,6 +716,50 @@ async def test_race_with_participants(client: AsyncClient):
     assert p["time_result"] == "02:15:00"
 
 
+@pytest.mark.asyncio
+async def test_export_races(client: AsyncClient):
+    """GET /api/v1/races/export — потоковая выгрузка в NDJSON и CSV."""
+    _, jockey_id, horse_id, race_id = await _create_full_setup(client)
+    await client.post(
+        "/api/v1/participants/",
+        json={
+            "race_id": race_id,
+            "jockey_id": jockey_id,
+            "horse_id": horse_id,
+            "place": 1,
+            "time_result": "02:15:00",
+        },
+    )
+
+    response = await client.get("/api/v1/races/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    race = (await client.get(f"/api/v1/races/{race_id}")).json()
+    assert json.loads(lines[0]) == race
+
+    response = await client.get("/api/v1/races/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][:3] == ["race_id", "date", "time"]
+    assert rows[1] == [
+        str(race_id),
+        "2026-08-01",
+        "12:00:00",
+        "Тестовый ипподром",
+        "",
+        "Жокей",
+        "Гром",
+        "1",
+        "02:15:00",
+    ]
+
+    invalid = await client.get("/api/v1/races/export", params={"format": "xml"})
+    assert invalid.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_jockey_races(client: AsyncClient):
     """GET /api/v1/jockeys/{id}/races — состязания жокея."""
@@ -587,6 +804,162 @@ async def test_horse_races(client: AsyncClient):
     assert races[0]["hippodrome"] == "Тестовый ипподром"
 
 
+@pytest.mark.asyncio
+async def test_race_conditional_get(client: AsyncClient):
+    """GET /api/v1/races/{id} с If-None-Match → 304 до изменения результатов."""
+    _, jockey_id, horse_id, race_id = await _create_full_setup(client)
+
+    first = await client.get(f"/api/v1/races/{race_id}")
+    etag = first.headers["etag"]
+
+    cached = await client.get(
+        f"/api/v1/races/{race_id}", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    await client.post(
+        "/api/v1/participants/",
+        json={
+            "race_id": race_id,
+            "jockey_id": jockey_id,
+            "horse_id": horse_id,
+            "place": 1,
+        },
+    )
+
+    changed = await client.get(
+        f"/api/v1/races/{race_id}", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()["participants"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_jockey_and_horse_races_conditional_get(client: AsyncClient):
+    """GET /jockeys/{id}/races и /horses/{id}/races отвечают 304 по ETag."""
+    _, jockey_id, horse_id, race_id = await _create_full_setup(client)
+
+    urls = [f"/api/v1/jockeys/{jockey_id}/races", f"/api/v1/horses/{horse_id}/races"]
+    etags = {}
+    for url in urls:
+        etags[url] = (await client.get(url)).headers["etag"]
+        response = await client.get(url, headers={"If-None-Match": etags[url]})
+        assert response.status_code == 304
+
+    await client.post(
+        "/api/v1/participants/",
+        json={
+            "race_id": race_id,
+            "jockey_id": jockey_id,
+            "horse_id": horse_id,
+            "place": 1,
+        },
+    )
+
+    for url in urls:
+        response = await client.get(url, headers={"If-None-Match": etags[url]})
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_jockey_and_horse_stats(client: AsyncClient):
+    """GET /jockeys/{id}/stats и /horses/{id}/stats — агрегаты выступлений."""
+    _, jockey_id, horse_id, race_id = await _create_full_setup(client)
+    await client.post(
+        "/api/v1/participants/",
+        json={
+            "race_id": race_id,
+            "jockey_id": jockey_id,
+            "horse_id": horse_id,
+            "place": 1,
+            "time_result": "00:02:15",
+        },
+    )
+
+    for url in (
+        f"/api/v1/jockeys/{jockey_id}/stats",
+        f"/api/v1/horses/{horse_id}/stats",
+    ):
+        response = await client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["starts"] == 1
+        assert data["wins"] == 1
+        assert data["best_time"] == "00:02:15"
+
+    assert (await client.get("/api/v1/jockeys/999/stats")).status_code == 404
+    bad_period = await client.get(
+        f"/api/v1/horses/{horse_id}/stats",
+        params={"date_from": "2030-02-01", "date_to": "2030-01-01"},
+    )
+    assert bad_period.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_leaderboard(client: AsyncClient):
+    """GET /api/v1/leaderboard — рейтинг обновляется после результатов."""
+    _, jockey_id, horse_id, race_id = await _create_full_setup(client)
+    await client.post(
+        "/api/v1/participants/",
+        json={
+            "race_id": race_id,
+            "jockey_id": jockey_id,
+            "horse_id": horse_id,
+            "place": 1,
+        },
+    )
+
+    response = await client.get("/api/v1/leaderboard/", params={"kind": "horse"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"] == [
+        {"entity_id": horse_id, "name": "Гром", "starts": 1, "wins": 1, "podiums": 1}
+    ]
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_trusted_responses_match_validated(client: AsyncClient, monkeypatch):
+    """Быстрый путь сериализации отдает тот же JSON, что и response_model."""
+    _, jockey_id, horse_id, race_id = await _create_full_setup(client)
+    await client.post(
+        "/api/v1/participants/",
+        json={
+            "race_id": race_id,
+            "jockey_id": jockey_id,
+            "horse_id": horse_id,
+            "place": 1,
+            "time_result": "02:15:00",
+        },
+    )
+
+    urls = [
+        "/api/v1/races/",
+        "/api/v1/races/?cursor=",
+        f"/api/v1/races/{race_id}",
+        "/api/v1/horses/",
+        "/api/v1/jockeys/",
+        "/api/v1/owners/",
+        f"/api/v1/jockeys/{jockey_id}/races",
+        "/api/v1/leaderboard/?kind=horse",
+    ]
+    bodies = {}
+    for trusted in (True, False):
+        monkeypatch.setattr(settings, "api_trusted_responses", trusted)
+        for url in urls:
+            response = await client.get(url)
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            bodies[trusted, url] = response.json()
+
+    for url in urls:
+        assert bodies[True, url] == bodies[False, url]
+
+
 @pytest.mark.asyncio
 async def test_jockey_races_not_found(client: AsyncClient):
     """GET /api/v1/jockeys/999/races — несуществующий жокей → 404."""
@@ -607,3 +980,152 @@ async def test_health_check(client: AsyncClient):
     response = await client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_db_pool_status(client: AsyncClient):
+    """GET /health/db-pool — пул основной БД и список пулов реплик."""
+    response = await client.get("/health/db-pool")
+    assert response.status_code == 200
+    body = response.json()
+    assert "pool_class" in body
+    assert body["replicas"] == []
+
+
+@pytest.mark.asyncio
+async def test_metrics(client: AsyncClient):
+    """GET /metrics — задержки по шаблону маршрута, пул, запросы, кэш."""
+    await client.get("/api/v1/races/1")
+    await client.get("/api/v1/races/2")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    route = 'method="GET",route="/api/v1/races/{race_id}"'
+    assert f"http_request_duration_seconds_bucket{{{route},le=\"+Inf\"}}" in body
+    assert f'http_responses_total{{{route},status="404"}}' in body
+    assert "/api/v1/races/1" not in body
+    assert "http_requests_in_flight 1" in body
+    assert "db_pool_info{" in body
+    assert 'cache_hit_ratio{cache="race"}' in body
+
+
+@pytest.mark.asyncio
+async def test_search(client: AsyncClient):
+    """GET /api/v1/search?q= — поиск по началу слов, фильтр по типу."""
+    owner = await client.post(
+        "/api/v1/owners/",
+        json={"name": "Орлова Мария", "address": "Москва", "phone": "+7"},
+    )
+    await client.post(
+        "/api/v1/horses/",
+        json={
+            "nickname": "Орлик",
+            "gender": "мерин",
+            "age": 5,
+            "owner_id": owner.json()["id"],
+        },
+    )
+
+    response = await client.get("/api/v1/search", params={"q": "орл"})
+    assert response.status_code == 200
+    assert {(r["kind"], r["title"]) for r in response.json()} == {
+        ("owner", "Орлова Мария"),
+        ("horse", "Орлик"),
+    }
+
+    response = await client.get(
+        "/api/v1/search", params={"q": "орл", "kind": "horse"}
+    )
+    assert [r["title"] for r in response.json()] == ["Орлик"]
+
+    response = await client.get("/api/v1/search", params={"q": " "})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_races_filters_and_sort(client: AsyncClient):
+    """GET /api/v1/races/ — фильтр по ипподрому и датам, сортировка."""
+    for hippodrome, day in [("Казанский", 2), ("Московский", 3), ("Московский", 9)]:
+        await client.post(
+            "/api/v1/races/",
+            json={
+                "date": f"2030-05-0{day}",
+                "time": "14:00:00",
+                "hippodrome": hippodrome,
+            },
+        )
+
+    response = await client.get(
+        "/api/v1/races/",
+        params={
+            "cursor": "",
+            "hippodrome": "Московский",
+            "date_from": "2030-05-01",
+            "date_to": "2030-05-31",
+            "sort": "-date",
+        },
+    )
+    assert response.status_code == 200
+    assert [r["date"] for r in response.json()["items"]] == [
+        "2030-05-09",
+        "2030-05-03",
+    ]
+
+    response = await client.get(
+        "/api/v1/races/", params={"date_from": "2030-05-09", "date_to": "2030-05-01"}
+    )
+    assert response.status_code == 400
+
+    response = await client.get("/api/v1/races/", params={"sort": "name"})
+    assert response.status_code == 422
+
+    # Курсор привязан к сортировке, с которой получен
+    response = await client.get(
+        "/api/v1/races/", params={"cursor": "", "limit": 1, "sort": "date"}
+    )
+    next_cursor = response.json()["next_cursor"]
+    response = await client.get(
+        "/api/v1/races/", params={"cursor": next_cursor, "limit": 1, "sort": "date"}
+    )
+    assert response.status_code == 200
+    assert response.json()["items"][0]["date"] == "2030-05-03"
+    response = await client.get(
+        "/api/v1/races/", params={"cursor": next_cursor, "limit": 1, "sort": "-date"}
+    )
+    assert response.status_code == 400
+    assert "сортировкой" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_list_sparse_fields(client: AsyncClient):
+    """GET /api/v1/horses/?fields= — только выбранные поля и id."""
+    owner = await client.post(
+        "/api/v1/owners/",
+        json={"name": "Владелец", "address": "Москва", "phone": "+7"},
+    )
+    await client.post(
+        "/api/v1/horses/",
+        json={
+            "nickname": "Гром",
+            "gender": "жеребец",
+            "age": 4,
+            "owner_id": owner.json()["id"],
+        },
+    )
+
+    response = await client.get("/api/v1/horses/", params={"fields": "nickname,gender"})
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1, "nickname": "Гром", "gender": "жеребец"}]
+
+    response = await client.get(
+        "/api/v1/horses/", params={"fields": "nickname", "cursor": ""}
+    )
+    assert response.json() == {
+        "items": [{"id": 1, "nickname": "Гром"}],
+        "next_cursor": None,
+    }
+
+    response = await client.get("/api/v1/races/", params={"fields": "revision"})
+    assert response.status_code == 400
@@ -1,13 +1,16 @@
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.business.dto.horse_dto import HorseCreateDTO
 from src.business.dto.owner_dto import OwnerCreateDTO
 from src.business.operations.horse_operations import (
     create_horse,
+    create_horses_bulk,
     get_horse_by_id,
     list_horses,
 )
 from src.business.operations.owner_operations import create_owner
+from src.config import settings
 from src.data.uow import UnitOfWork
 
 
@@ -190,3 +193,78 @@ async def test_create_horse_gelding_success(async_session: AsyncSession):
     )
 
     assert result.gender == "мерин"
+
+
+@pytest.mark.asyncio
+async def test_create_horses_bulk_success(async_session: AsyncSession):
+    """Тест пакетного создания: владельцы одним запросом, вставка пачками"""
+    uow = UnitOfWork(async_session)
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    rows = [
+        HorseCreateDTO(nickname=f"Конь {i}", gender="кобыла", age=4, owner_id=owner.id)
+        for i in range(5)
+    ]
+
+    statements = []
+    sync_engine = async_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        result = await create_horses_bulk(uow, rows)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert result.errors == []
+    assert [h.nickname for h in result.created] == [r.nickname for r in rows]
+    assert result.created[0].gender == "кобыла"
+    assert len([s for s in statements if s.lstrip().startswith("SELECT")]) == 1
+    assert len([s for s in statements if s.lstrip().startswith("INSERT")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_horses_bulk_chunks(async_session: AsyncSession, monkeypatch):
+    """Тест: строки делятся на пачки по DB_BULK_CHUNK_SIZE"""
+    monkeypatch.setattr(settings, "db_bulk_chunk_size", 2)
+    uow = UnitOfWork(async_session)
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    rows = [
+        HorseCreateDTO(nickname=f"Лошадь {i}", gender="мерин", age=4, owner_id=owner.id)
+        for i in range(5)
+    ]
+
+    statements = []
+    sync_engine = async_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        result = await create_horses_bulk(uow, rows)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(result.created) == 5
+    assert len([s for s in statements if s.lstrip().startswith("INSERT")]) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_horses_bulk_reports_row_errors(async_session: AsyncSession):
+    """Тест: неизвестный владелец — ошибка строки, ничего не сохраняется"""
+    uow = UnitOfWork(async_session)
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    rows = [
+        HorseCreateDTO(nickname="Гром", gender="жеребец", age=5, owner_id=owner.id),
+        HorseCreateDTO(nickname="Буря", gender="кобыла", age=5, owner_id=999),
+    ]
+
+    result = await create_horses_bulk(uow, rows)
+
+    assert result.created == []
+    assert [(e.index, e.error) for e in result.errors] == [
+        (1, "Владелец с ID 999 не найден")
+    ]
+    assert await list_horses(uow) == []
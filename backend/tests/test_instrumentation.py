@@ -0,0 +1,84 @@
+import logging
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.data.instrumentation import UNTAGGED, instrument_engine, query_totals
+from src.data.models import Base, Owner
+from src.data.uow import UnitOfWork
+from src.framework.dependencies import get_db
+from src.main import app
+
+
+@pytest_asyncio.fixture
+async def instrumented_engine():
+    """Движок SQLite в памяти с замером запросов"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    instrument_engine(engine, slow_query_ms=0.0001, explain=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_queries_tagged_with_repository_method(instrumented_engine):
+    """Тест: время запросов учитывается по методу репозитория"""
+    session_maker = async_sessionmaker(instrumented_engine, expire_on_commit=False)
+    key = (UNTAGGED, "OwnerRepository.list")
+    before = query_totals[key].count
+
+    async with UnitOfWork(session_maker()) as uow:
+        await uow.owners.list()
+
+    stats = query_totals[key]
+    assert stats.count == before + 1
+    assert stats.duration > 0
+
+
+@pytest.mark.asyncio
+async def test_slow_query_logged_with_plan(instrumented_engine, caplog):
+    """Тест: медленный запрос пишется в лог с методом и планом"""
+    session_maker = async_sessionmaker(instrumented_engine, expire_on_commit=False)
+
+    with caplog.at_level(logging.WARNING, logger="src.data.instrumentation"):
+        async with UnitOfWork(session_maker()) as uow:
+            await uow.owners.list()
+
+    messages = [r.getMessage() for r in caplog.records]
+    slow = [m for m in messages if "OwnerRepository.list" in m]
+    assert slow
+    assert "FROM owners" in slow[0]
+    assert "SCAN owners" in slow[0] or "SEARCH owners" in slow[0]
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header(instrumented_engine):
+    """Тест: заголовок Server-Timing с числом запросов и временем в БД"""
+    session_maker = async_sessionmaker(
+        instrumented_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_maker() as session:
+        session.add(Owner(name="Иванов", address="Москва", phone="+7"))
+        await session.commit()
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    key = ("/api/v1/owners/{owner_id}", "OwnerRepository.get_by_id")
+    before = query_totals[key].count
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            response = await ac.get("/api/v1/owners/1")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="1 queries"' in timing
+    assert query_totals[key].count == before + 1
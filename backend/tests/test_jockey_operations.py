@@ -1,8 +1,13 @@
 import pytest
 from pydantic import ValidationError
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.business.dto.jockey_dto import JockeyCreateDTO
-from src.business.operations.jockey_operations import create_jockey, get_jockey_by_id
+from src.business.operations.jockey_operations import (
+    create_jockey,
+    get_jockey_by_id,
+    get_jockeys_by_ids,
+)
 from src.data.uow import UnitOfWork
 
 
@@ -72,3 +77,29 @@ async def test_get_jockey_by_id_not_found(async_session: AsyncSession):
     result = await get_jockey_by_id(uow, 999)
 
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_jockeys_by_ids(async_session: AsyncSession):
+    """Тест выборки жокеев по списку ID одним запросом"""
+    uow = UnitOfWork(async_session)
+
+    first = await create_jockey(
+        uow, JockeyCreateDTO(name="Первый", address="Москва", age=25, rating=5)
+    )
+    second = await create_jockey(
+        uow, JockeyCreateDTO(name="Второй", address="Москва", age=30, rating=6)
+    )
+
+    statements = []
+    sync_engine = async_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        result = await get_jockeys_by_ids(uow, [second.id, 999, first.id, second.id])
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert [j.name for j in result.items] == ["Второй", "Первый"]
+    assert result.missing == [999]
@@ -0,0 +1,108 @@
+from datetime import date, time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.business.dto.horse_dto import HorseCreateDTO
+from src.business.dto.jockey_dto import JockeyCreateDTO
+from src.business.dto.owner_dto import OwnerCreateDTO
+from src.business.dto.participant_dto import ParticipantCreateDTO, RaceResultRowDTO
+from src.business.dto.race_dto import RaceCreateDTO
+from src.business.operations.horse_operations import create_horse
+from src.business.operations.jockey_operations import create_jockey
+from src.business.operations.leaderboard_operations import get_leaderboard
+from src.business.operations.owner_operations import create_owner
+from src.business.operations.participant_operations import (
+    add_participant_with_result,
+    add_race_results_bulk,
+)
+from src.business.operations.race_operations import create_race
+from src.data.uow import UnitOfWork
+
+
+async def _create_results(uow: UnitOfWork):
+    """Два состязания с тремя парами; итог побед: 2, 0, 1"""
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    pairs = []
+    for name in ("А", "Б", "В"):
+        jockey = await create_jockey(
+            uow, JockeyCreateDTO(name=name, address="Москва", age=25, rating=5)
+        )
+        horse = await create_horse(
+            uow, HorseCreateDTO(nickname=name, gender="мерин", age=4, owner_id=owner.id)
+        )
+        pairs.append((jockey.id, horse.id))
+
+    races = [
+        await create_race(
+            uow,
+            RaceCreateDTO(date=date(2030, 5, day), time=time(12), hippodrome="Ипподром"),
+        )
+        for day in (1, 2, 3)
+    ]
+
+    # Первое состязание — по одному результату
+    for (jockey_id, horse_id), place in zip(pairs, (1, 3, 2)):
+        await add_participant_with_result(
+            uow,
+            ParticipantCreateDTO(
+                race_id=races[0].id, jockey_id=jockey_id, horse_id=horse_id, place=place
+            ),
+        )
+
+    # Второе и третье — пакетом
+    for race, places in ((races[1], (2, 4, 1)), (races[2], (1, 5, 4))):
+        await add_race_results_bulk(
+            uow,
+            race.id,
+            [
+                RaceResultRowDTO(jockey_id=j, horse_id=h, place=place)
+                for (j, h), place in zip(pairs, places)
+            ],
+        )
+    return pairs
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_updated_with_results(async_session: AsyncSession):
+    """Тест: рейтинг обновляется вместе с результатами"""
+    uow = UnitOfWork(async_session)
+    await _create_results(uow)
+
+    page = await get_leaderboard(uow, "jockey")
+
+    assert [(e.name, e.wins, e.podiums, e.starts) for e in page.items] == [
+        ("А", 2, 3, 3),
+        ("В", 1, 2, 3),
+        ("Б", 0, 1, 3),
+    ]
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_pagination_and_rebuild(async_session: AsyncSession):
+    """Тест keyset-пагинации и совпадения с полным пересчетом"""
+    uow = UnitOfWork(async_session)
+    await _create_results(uow)
+
+    page1 = await get_leaderboard(uow, "horse", limit=2)
+    page2 = await get_leaderboard(uow, "horse", cursor=page1.next_cursor, limit=2)
+    incremental = page1.items + page2.items
+
+    async with uow:
+        await uow.leaderboard.rebuild()
+        await uow.commit()
+
+    rebuilt = await get_leaderboard(uow, "horse")
+    assert [e.name for e in incremental] == ["А", "В", "Б"]
+    assert rebuilt.items == incremental
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_unknown_kind_fails(async_session: AsyncSession):
+    """Тест неизвестного типа рейтинга"""
+    uow = UnitOfWork(async_session)
+
+    with pytest.raises(ValueError, match="рейтинга"):
+        await get_leaderboard(uow, "owner")
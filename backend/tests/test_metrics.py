@@ -0,0 +1,109 @@
+from src.business.cache import CacheBackend, ResponseCache
+from src.data.instrumentation import QueryStats
+from src.framework.metrics import RequestMetrics, render_metrics
+
+
+class FakeCache:
+    def stats(self):
+        return {"enabled": True, "hits": 3, "misses": 1, "hit_ratio": 0.75, "size": 2}
+
+
+class UnsizedBackend(CacheBackend):
+    async def get(self, key):
+        return None
+
+    async def set(self, key, value):
+        pass
+
+    async def delete(self, key):
+        pass
+
+    async def clear(self):
+        pass
+
+
+def test_render_histogram_is_cumulative():
+    """Тест: корзины гистограммы накопительные, _count равен числу замеров"""
+    metrics = RequestMetrics()
+    metrics.observe("GET", "/api/v1/races/{race_id}", 200, 0.003)
+    metrics.observe("GET", "/api/v1/races/{race_id}", 200, 0.04)
+    metrics.observe("GET", "/api/v1/races/{race_id}", 404, 20.0)
+
+    body = render_metrics(metrics, {"pool_class": "StaticPool"}, {}, {})
+
+    labels = 'method="GET",route="/api/v1/races/{race_id}"'
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in body
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.05"}} 2' in body
+    assert f'http_request_duration_seconds_bucket{{{labels},le="10.0"}} 2' in body
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in body
+    assert f"http_request_duration_seconds_count{{{labels}}} 3" in body
+    assert f'http_responses_total{{{labels},status="404"}} 1' in body
+    assert 'db_pool_info{pool_class="StaticPool"} 1' in body
+    assert "db_pool_checked_out" not in body
+
+
+def test_render_pool_queries_and_cache():
+    """Тест: счетчики пула, запросов по маршрутам и методам и кэша"""
+    pool = {
+        "pool_class": "AsyncAdaptedQueuePool",
+        "size": 5,
+        "checked_in": 4,
+        "checked_out": 1,
+        "overflow": -4,
+    }
+    key = ("/api/v1/races/{race_id}", "RaceRepository.get_standings")
+    queries = {key: QueryStats(count=7, duration=0.5)}
+
+    body = render_metrics(RequestMetrics(), pool, queries, {"race": FakeCache()})
+
+    assert "db_pool_checked_out 1" in body
+    labels = 'route="/api/v1/races/{race_id}",method="RaceRepository.get_standings"'
+    assert f"db_queries_total{{{labels}}} 7" in body
+    assert f"db_query_duration_seconds_total{{{labels}}} 0.5" in body
+    assert 'cache_hits_total{cache="race"} 3' in body
+    assert 'cache_hit_ratio{cache="race"} 0.75' in body
+    assert "# TYPE cache_hits_total counter" in body
+
+
+def test_cache_without_size_skips_entries():
+    """Тест: бэкенд без размера (Redis) не дает значение None в метриках"""
+    caches = {"race": ResponseCache(UnsizedBackend())}
+
+    body = render_metrics(RequestMetrics(), {"pool_class": "NullPool"}, {}, caches)
+
+    assert "None" not in body
+    assert 'cache_entries{cache="race"}' not in body
+    assert 'cache_hits_total{cache="race"} 0' in body
+
+
+def test_label_values_escaped():
+    """Тест: кавычки и обратные слэши в значениях меток экранируются"""
+    metrics = RequestMetrics()
+    metrics.observe("GET", 'a"b\\c', 200, 0.1)
+
+    body = render_metrics(metrics, {"pool_class": "NullPool"}, {}, {})
+
+    assert 'route="a\\"b\\\\c"' in body
+
+
+def test_render_replica_pools():
+    """Тест: пулы реплик с меткой replica"""
+    replicas = [
+        {"replica": 0, "pool_class": "StaticPool", "sessions_in_use": 0},
+        {
+            "replica": 1,
+            "pool_class": "AsyncAdaptedQueuePool",
+            "checked_out": 2,
+            "sessions_in_use": 1,
+        },
+    ]
+
+    body = render_metrics(
+        RequestMetrics(), {"pool_class": "NullPool"}, {}, {}, replica_status=replicas
+    )
+
+    info = 'db_replica_pool_info{replica="1",pool_class="AsyncAdaptedQueuePool"} 1'
+    assert info in body
+    assert 'db_replica_pool_checked_out{replica="1"} 2' in body
+    assert 'db_replica_pool_checked_out{replica="0"}' not in body
+    assert 'db_replica_pool_sessions_in_use{replica="0"} 0' in body
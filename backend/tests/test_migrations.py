@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.data.database import ALEMBIC_INI, check_schema_revision, warm_pool
+from src.data.models import Base
+from src.data.search import include_schema_name
+
+
+def _alembic_config(url: str) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+async def _schema_diff(url: str) -> list:
+    engine = create_async_engine(url)
+    async with engine.connect() as conn:
+        diff = await conn.run_sync(
+            lambda c: compare_metadata(
+                MigrationContext.configure(
+                    c, opts={"include_name": include_schema_name}
+                ),
+                Base.metadata,
+            )
+        )
+    await engine.dispose()
+    return diff
+
+
+@pytest.mark.asyncio
+async def test_migrations_match_models(tmp_path):
+    """Тест: миграции создают ту же схему, что и модели"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}"
+    await asyncio.to_thread(command.upgrade, _alembic_config(url), "head")
+
+    assert await _schema_diff(url) == []
+
+
+@pytest.mark.asyncio
+async def test_stamp_existing_database(tmp_path):
+    """Тест: БД, созданная до миграций, переводится через stamp 0001"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}"
+    config = _alembic_config(url)
+    # Схема create_all до миграций: ревизия 0001 без таблицы alembic_version
+    await asyncio.to_thread(command.upgrade, config, "0001")
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE alembic_version"))
+        indexes = await conn.run_sync(
+            lambda c: {index["name"] for index in inspect(c).get_indexes("races")}
+        )
+    await engine.dispose()
+    assert "idx_race_date_id" not in indexes
+
+    await asyncio.to_thread(command.stamp, config, "0001")
+    await asyncio.to_thread(command.upgrade, config, "head")
+
+    assert await _schema_diff(url) == []
+
+
+@pytest.mark.asyncio
+async def test_check_schema_revision(tmp_path):
+    """Тест проверки ревизии схемы при старте воркера"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'revision.db'}"
+    engine = create_async_engine(url)
+
+    with pytest.raises(RuntimeError, match="alembic upgrade head"):
+        await check_schema_revision(engine)
+
+    await asyncio.to_thread(command.upgrade, _alembic_config(url), "head")
+    await check_schema_revision(engine)
+    await warm_pool(engine, connections=2)
+
+    assert engine.pool.checkedin() == 2
+    await engine.dispose()
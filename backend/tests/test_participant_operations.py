@@ -1,16 +1,20 @@
 from datetime import date, time
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.business.dto.horse_dto import HorseCreateDTO
 from src.business.dto.jockey_dto import JockeyCreateDTO
 from src.business.dto.owner_dto import OwnerCreateDTO
-from src.business.dto.participant_dto import ParticipantCreateDTO
+from src.business.dto.participant_dto import ParticipantCreateDTO, RaceResultRowDTO
 from src.business.dto.race_dto import RaceCreateDTO
 from src.business.operations.horse_operations import create_horse
 from src.business.operations.jockey_operations import create_jockey
 from src.business.operations.owner_operations import create_owner
-from src.business.operations.participant_operations import add_participant_with_result
+from src.business.operations.participant_operations import (
+    add_participant_with_result,
+    add_race_results_bulk,
+)
 from src.business.operations.race_operations import create_race
 from src.data.uow import UnitOfWork
 
@@ -132,3 +136,155 @@ async def test_add_participant_nonexistent_race_fails(async_session: AsyncSessio
                 race_id=999, jockey_id=jockey.id, horse_id=horse.id, place=1
             ),
         )
+
+
+async def _create_runners(uow: UnitOfWork, count: int):
+    """Создать состязание и count пар жокей-лошадь"""
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    pairs = []
+    for i in range(count):
+        jockey = await create_jockey(
+            uow, JockeyCreateDTO(name=f"Жокей {i}", address="Москва", age=25, rating=5)
+        )
+        horse = await create_horse(
+            uow,
+            HorseCreateDTO(
+                nickname=f"Лошадь {i}", gender="кобыла", age=4, owner_id=owner.id
+            ),
+        )
+        pairs.append((jockey.id, horse.id))
+    race = await create_race(
+        uow,
+        RaceCreateDTO(date=date(2030, 5, 1), time=time(12, 0), hippodrome="Ипподром"),
+    )
+    return race, pairs
+
+
+@pytest.mark.asyncio
+async def test_add_participant_validates_in_one_query(async_session: AsyncSession):
+    """Тест: проверка ссылок одним SELECT, дубликат отсекает ON CONFLICT"""
+    uow = UnitOfWork(async_session)
+    race, [(jockey_id, horse_id)] = await _create_runners(uow, 1)
+    data = ParticipantCreateDTO(
+        race_id=race.id, jockey_id=jockey_id, horse_id=horse_id, place=1
+    )
+
+    statements = []
+    sync_engine = async_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        await add_participant_with_result(uow, data)
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
+        assert "EXISTS" in selects[0]
+
+        statements.clear()
+        with pytest.raises(ValueError, match="уже зарегистрирована"):
+            await add_participant_with_result(uow, data)
+        assert any("ON CONFLICT" in s for s in statements)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    for missing, message in [
+        ({"jockey_id": 999}, "Жокей с ID 999"),
+        ({"horse_id": 999}, "Лошадь с ID 999"),
+    ]:
+        with pytest.raises(ValueError, match=message):
+            await add_participant_with_result(
+                uow, data.model_copy(update={**missing, "place": 2})
+            )
+
+
+@pytest.mark.asyncio
+async def test_add_race_results_bulk_success(async_session: AsyncSession):
+    """Тест пакетной загрузки протокола состязания"""
+    uow = UnitOfWork(async_session)
+    race, pairs = await _create_runners(uow, 3)
+
+    rows = [
+        RaceResultRowDTO(jockey_id=j, horse_id=h, place=3 - i)
+        for i, (j, h) in enumerate(pairs)
+    ]
+    result = await add_race_results_bulk(uow, race.id, rows)
+
+    assert result.errors == []
+    assert [p.place for p in result.created] == [1, 2, 3]
+    assert all(p.race_id == race.id for p in result.created)
+
+
+@pytest.mark.asyncio
+async def test_add_race_results_bulk_reports_row_errors(async_session: AsyncSession):
+    """Тест: ошибки по строкам, ничего не сохраняется"""
+    uow = UnitOfWork(async_session)
+    race, pairs = await _create_runners(uow, 2)
+    (j1, h1), (j2, h2) = pairs
+
+    await add_participant_with_result(
+        uow, ParticipantCreateDTO(race_id=race.id, jockey_id=j1, horse_id=h1, place=1)
+    )
+
+    rows = [
+        RaceResultRowDTO(jockey_id=j2, horse_id=h2, place=2),
+        RaceResultRowDTO(jockey_id=999, horse_id=h2, place=3),
+        RaceResultRowDTO(jockey_id=j2, horse_id=999, place=4),
+        RaceResultRowDTO(jockey_id=j1, horse_id=h1, place=5),
+        RaceResultRowDTO(jockey_id=j2, horse_id=h2, place=6),
+    ]
+    result = await add_race_results_bulk(uow, race.id, rows)
+
+    assert result.created == []
+    assert [e.index for e in result.errors] == [1, 2, 3, 4]
+    assert "Жокей" in result.errors[0].error
+    assert "Лошадь" in result.errors[1].error
+    assert "уже зарегистрирована" in result.errors[2].error
+    assert "повторяется" in result.errors[3].error
+
+    registered = await uow.participants.get_pairs_by_race(race.id)
+    assert registered == {(j1, h1)}
+
+
+@pytest.mark.asyncio
+async def test_add_race_results_bulk_race_not_found(async_session: AsyncSession):
+    """Тест пакетной загрузки в несуществующее состязание"""
+    uow = UnitOfWork(async_session)
+
+    with pytest.raises(ValueError, match="Состязание"):
+        await add_race_results_bulk(
+            uow, 999, [RaceResultRowDTO(jockey_id=1, horse_id=1, place=1)]
+        )
+
+
+@pytest.mark.asyncio
+async def test_add_race_results_bulk_concurrent_duplicate(
+    async_session: AsyncSession, monkeypatch
+):
+    """Тест: пара, зарегистрированная параллельно после проверки, — ошибка строки"""
+    uow = UnitOfWork(async_session)
+    race, pairs = await _create_runners(uow, 2)
+    (j1, h1), (j2, h2) = pairs
+
+    await add_participant_with_result(
+        uow, ParticipantCreateDTO(race_id=race.id, jockey_id=j1, horse_id=h1, place=1)
+    )
+
+    # Проверка не видит пару: ее вставил параллельный запрос
+    async def no_pairs(race_id):
+        return set()
+
+    monkeypatch.setattr(uow.participants, "get_pairs_by_race", no_pairs)
+    rows = [
+        RaceResultRowDTO(jockey_id=j2, horse_id=h2, place=2),
+        RaceResultRowDTO(jockey_id=j1, horse_id=h1, place=3),
+    ]
+    result = await add_race_results_bulk(uow, race.id, rows)
+
+    assert result.created == []
+    assert [e.index for e in result.errors] == [1]
+    assert "уже зарегистрирована" in result.errors[0].error
+
+    monkeypatch.undo()
+    registered = await uow.participants.get_pairs_by_race(race.id)
+    assert registered == {(j1, h1)}
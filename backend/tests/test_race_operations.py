@@ -1,22 +1,26 @@
 from datetime import date, time
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.business.dto.horse_dto import HorseCreateDTO
 from src.business.dto.jockey_dto import JockeyCreateDTO
 from src.business.dto.owner_dto import OwnerCreateDTO
 from src.business.dto.participant_dto import ParticipantCreateDTO
-from src.business.dto.race_dto import RaceCreateDTO
+from src.business.dto.race_dto import RaceCreateDTO, RaceFilterDTO
 from src.business.operations.horse_operations import create_horse
 from src.business.operations.jockey_operations import create_jockey
 from src.business.operations.owner_operations import create_owner
 from src.business.operations.participant_operations import add_participant_with_result
 from src.business.operations.race_operations import (
     create_race,
+    export_races,
     get_horse_races,
     get_jockey_races,
+    get_race_revision,
     get_race_with_participants,
     list_races,
+    list_races_page,
 )
 from src.data.uow import UnitOfWork
 
@@ -108,6 +112,112 @@ async def test_get_race_with_participants_success(async_session: AsyncSession):
     assert result.participants[0].place == 1
 
 
+@pytest.mark.asyncio
+async def test_get_race_with_participants_single_query(async_session: AsyncSession):
+    """Тест: итоговая таблица одним запросом, отсортирована по месту"""
+    uow = UnitOfWork(async_session)
+
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    race = await create_race(
+        uow,
+        RaceCreateDTO(date=date(2030, 3, 15), time=time(14, 30), hippodrome="Ипподром"),
+    )
+    for place, name in [(3, "Третий"), (1, "Первый"), (2, "Второй")]:
+        jockey = await create_jockey(
+            uow, JockeyCreateDTO(name=name, address="Москва", age=25, rating=5)
+        )
+        horse = await create_horse(
+            uow,
+            HorseCreateDTO(nickname=name, gender="мерин", age=4, owner_id=owner.id),
+        )
+        await add_participant_with_result(
+            uow,
+            ParticipantCreateDTO(
+                race_id=race.id, jockey_id=jockey.id, horse_id=horse.id, place=place
+            ),
+        )
+
+    # Версию эндпоинт уже прочитал для ETag
+    revision = await get_race_revision(uow, race.id)
+
+    statements = []
+    sync_engine = async_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        result = await get_race_with_participants(uow, race.id, revision)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert result.race.hippodrome == "Ипподром"
+    assert [p.place for p in result.participants] == [1, 2, 3]
+    assert [p.jockey_name for p in result.participants] == [
+        "Первый",
+        "Второй",
+        "Третий",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_races_single_query(async_session: AsyncSession):
+    """Тест выгрузки: одно состязание на элемент, участники по месту"""
+    uow = UnitOfWork(async_session)
+
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    later = await create_race(
+        uow, RaceCreateDTO(date=date(2030, 4, 2), time=time(12), hippodrome="Поздний")
+    )
+    empty = await create_race(
+        uow, RaceCreateDTO(date=date(2030, 4, 3), time=time(12), hippodrome="Пустой")
+    )
+    earlier = await create_race(
+        uow, RaceCreateDTO(date=date(2030, 4, 1), time=time(12), hippodrome="Ранний")
+    )
+    for place, name in [(2, "Второй"), (1, "Первый")]:
+        jockey = await create_jockey(
+            uow, JockeyCreateDTO(name=name, address="Москва", age=25, rating=5)
+        )
+        horse = await create_horse(
+            uow,
+            HorseCreateDTO(nickname=name, gender="мерин", age=4, owner_id=owner.id),
+        )
+        for race in (earlier, later):
+            await add_participant_with_result(
+                uow,
+                ParticipantCreateDTO(
+                    race_id=race.id, jockey_id=jockey.id, horse_id=horse.id, place=place
+                ),
+            )
+
+    statements = []
+    sync_engine = async_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        result = [race async for race in export_races(uow, batch_size=2)]
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert [r.race.id for r in result] == [earlier.id, later.id, empty.id]
+    assert [p.jockey_name for p in result[0].participants] == ["Первый", "Второй"]
+    assert [p.place for p in result[1].participants] == [1, 2]
+    assert result[2].participants == []
+
+
+@pytest.mark.asyncio
+async def test_get_race_with_participants_not_found(async_session: AsyncSession):
+    """Тест получения несуществующего состязания"""
+    uow = UnitOfWork(async_session)
+
+    assert await get_race_with_participants(uow, 999) is None
+
+
 @pytest.mark.asyncio
 async def test_create_race_with_empty_hippodrome_fails(async_session: AsyncSession):
     """Тест валидации пустого названия ипподрома"""
@@ -181,6 +291,179 @@ async def test_list_races_with_pagination(async_session: AsyncSession):
     assert result_page1[0].id != result_page2[0].id
 
 
+@pytest.mark.asyncio
+async def test_list_races_page_keyset(async_session: AsyncSession):
+    """Тест keyset-пагинации состязаний по (date, id)"""
+    uow = UnitOfWork(async_session)
+
+    # Создаем состязания не по порядку дат, два — в один день
+    for day in [20, 16, 18, 16, 17]:
+        await create_race(
+            uow,
+            RaceCreateDTO(
+                date=date(2030, 3, day), time=time(14, 30), hippodrome="Ипподром"
+            ),
+        )
+
+    page1 = await list_races_page(uow, limit=2)
+    page2 = await list_races_page(uow, cursor=page1.next_cursor, limit=2)
+    page3 = await list_races_page(uow, cursor=page2.next_cursor, limit=2)
+
+    races = page1.items + page2.items + page3.items
+    assert [(r.date.day, r.id) for r in races] == sorted(
+        (r.date.day, r.id) for r in races
+    )
+    assert len({r.id for r in races}) == 5
+    assert page1.next_cursor is not None
+    assert page3.next_cursor is None
+
+
+async def _create_calendar(uow: UnitOfWork):
+    """Состязания на двух ипподромах в марте 2030"""
+    for hippodrome, day, name in [
+        ("Казанский", 10, "Кубок Казани"),
+        ("Московский", 12, "Весенний кубок"),
+        ("Московский", 5, "Открытие сезона"),
+        ("Московский", 25, "Весенний приз"),
+        ("Казанский", 1, None),
+    ]:
+        await create_race(
+            uow,
+            RaceCreateDTO(
+                date=date(2030, 3, day),
+                time=time(14, 30),
+                hippodrome=hippodrome,
+                name=name,
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_races_page_filters(async_session: AsyncSession):
+    """Тест фильтров: ипподром, диапазон дат включительно, начало названия"""
+    uow = UnitOfWork(async_session)
+    await _create_calendar(uow)
+
+    page = await list_races_page(
+        uow,
+        filters=RaceFilterDTO(
+            hippodrome="Московский",
+            date_from=date(2030, 3, 5),
+            date_to=date(2030, 3, 12),
+        ),
+    )
+    assert [r.date.day for r in page.items] == [5, 12]
+
+    races = await list_races(uow, filters=RaceFilterDTO(name_prefix="Весен"))
+    assert {r.name for r in races} == {"Весенний кубок", "Весенний приз"}
+
+    races = await list_races(uow, filters=RaceFilterDTO(name_prefix="%"))
+    assert races == []
+
+
+@pytest.mark.asyncio
+async def test_list_races_page_sorting(async_session: AsyncSession):
+    """Тест сортировок: поздние первыми и по ипподрому, по страницам"""
+    uow = UnitOfWork(async_session)
+    await _create_calendar(uow)
+
+    page = await list_races_page(uow, sort="-date", limit=10)
+    assert [r.date.day for r in page.items] == [25, 12, 10, 5, 1]
+
+    page1 = await list_races_page(uow, sort="hippodrome", limit=3)
+    page2 = await list_races_page(
+        uow, cursor=page1.next_cursor, sort="hippodrome", limit=3
+    )
+    assert [(r.hippodrome, r.date.day) for r in page1.items + page2.items] == [
+        ("Казанский", 1),
+        ("Казанский", 10),
+        ("Московский", 5),
+        ("Московский", 12),
+        ("Московский", 25),
+    ]
+    assert page2.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_races_one_narrow_query(async_session: AsyncSession):
+    """Тест: страница состязаний — один запрос без участников, поля по выбору"""
+    uow = UnitOfWork(async_session)
+    await _create_calendar(uow)
+
+    statements = []
+    sync_engine = async_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        page = await list_races_page(uow, limit=2)
+        sparse = await list_races(uow, sort="date", fields=["date"])
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 2
+    assert not [s for s in statements if "race_participants" in s]
+    assert page.items[0].hippodrome == "Казанский"
+    assert sparse[0] == {"id": sparse[0]["id"], "date": date(2030, 3, 1)}
+
+    with pytest.raises(ValueError, match="revision"):
+        await list_races(uow, fields=["revision"])
+
+
+@pytest.mark.asyncio
+async def test_list_races_invalid_filters_fail(async_session: AsyncSession):
+    """Тест отказа на перевернутом диапазоне дат и неизвестной сортировке"""
+    uow = UnitOfWork(async_session)
+
+    with pytest.raises(ValueError, match="date_from"):
+        await list_races_page(
+            uow,
+            filters=RaceFilterDTO(date_from=date(2030, 3, 2), date_to=date(2030, 3, 1)),
+        )
+    with pytest.raises(ValueError, match="сортировка"):
+        await list_races(uow, sort="name")
+
+
+@pytest.mark.asyncio
+async def test_calendar_query_uses_hippodrome_date_index(async_session: AsyncSession):
+    """Тест: ипподром + диапазон дат читается по индексу (hippodrome, date)"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await list_races_page(
+            UnitOfWork(async_session),
+            filters=RaceFilterDTO(
+                hippodrome="Московский",
+                date_from=date(2030, 3, 1),
+                date_to=date(2030, 3, 31),
+            ),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = statements[0]
+    connection = await async_session.connection()
+    result = await connection.exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statement, parameters
+    )
+    plan = " ".join(str(row[-1]) for row in result.all())
+    assert "idx_race_hippodrome_date" in plan
+
+
+@pytest.mark.asyncio
+async def test_list_races_page_invalid_cursor_fails(async_session: AsyncSession):
+    """Тест отказа на поврежденном курсоре"""
+    uow = UnitOfWork(async_session)
+
+    with pytest.raises(ValueError, match="курсор"):
+        await list_races_page(uow, cursor="не-курсор", limit=2)
+
+
 @pytest.mark.asyncio
 async def test_get_jockey_races_success(async_session: AsyncSession):
     """Тест получения состязаний жокея"""
@@ -0,0 +1,168 @@
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.data import database
+from src.data.database import get_replica_pool_status
+from src.data.models import Base
+from src.data.replicas import ReplicaPool
+from src.data.uow import UnitOfWork
+from src.framework.dependencies import get_db, get_replica_pool
+from src.main import app
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+async def make_engine(path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_round_robin(tmp_path):
+    """Тест: реплики выбираются по кругу"""
+    engines = [await make_engine(tmp_path / f"r{i}.db") for i in range(2)]
+    pool = ReplicaPool(engines)
+
+    chosen = []
+    for _ in range(4):
+        async with pool.session() as session:
+            chosen.append(session.bind)
+
+    assert chosen == [engines[0], engines[1], engines[0], engines[1]]
+    await pool.dispose()
+
+
+@pytest.mark.asyncio
+async def test_least_connections(tmp_path):
+    """Тест: выбирается реплика с наименьшим числом открытых сессий"""
+    engines = [await make_engine(tmp_path / f"r{i}.db") for i in range(2)]
+    pool = ReplicaPool(engines, strategy="least_connections")
+
+    async with pool.session() as first:
+        async with pool.session() as second:
+            assert pool.in_use() == [1, 1]
+            assert {first.bind, second.bind} == set(engines)
+        async with pool.session() as third:
+            assert third.bind is second.bind
+
+    assert pool.in_use() == [0, 0]
+    await pool.dispose()
+
+
+@pytest.mark.asyncio
+async def test_replica_pool_status_and_dispose(tmp_path, monkeypatch):
+    """Тест: состояние пулов реплик и их закрытие при остановке"""
+    engines = [await make_engine(tmp_path / f"r{i}.db") for i in range(2)]
+    pool = ReplicaPool(engines)
+    disposed = []
+
+    async def fake_dispose():
+        disposed.append(True)
+
+    monkeypatch.setattr(pool, "dispose", fake_dispose)
+    monkeypatch.setattr(database, "replica_pool", pool)
+
+    async with pool.session():
+        status = get_replica_pool_status(pool)
+    assert [s["replica"] for s in status] == [0, 1]
+    assert [s["sessions_in_use"] for s in status] == [1, 0]
+    assert status[0]["pool_class"] == "AsyncAdaptedQueuePool"
+    assert get_replica_pool_status(None) == []
+
+    await database.dispose_database()
+    assert disposed == [True]
+    for engine in engines:
+        await engine.dispose()
+
+
+def test_read_your_writes_window():
+    """Тест: после записи клиент читает с основной БД, пока не истечет окно"""
+    clock = FakeClock()
+    pool = ReplicaPool(
+        [create_async_engine("sqlite+aiosqlite://")], sticky_seconds=5, clock=clock
+    )
+
+    pool.mark_write("a")
+    assert pool.is_sticky("a")
+    assert not pool.is_sticky("b")
+
+    clock.now += 5
+    assert not pool.is_sticky("a")
+
+
+@pytest.mark.asyncio
+async def test_read_only_uow_commit_forbidden(tmp_path):
+    """Тест: Unit of Work только для чтения запрещает commit"""
+    engine = await make_engine(tmp_path / "replica.db")
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with UnitOfWork(session_maker(), read_only=True) as uow:
+        with pytest.raises(RuntimeError):
+            await uow.commit()
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def replicated_client(tmp_path):
+    """Клиент API: основная БД и реплика — два файла SQLite без репликации"""
+    primary = await make_engine(tmp_path / "primary.db")
+    replica = await make_engine(tmp_path / "replica.db")
+    clock = FakeClock()
+    replicas = ReplicaPool([replica], sticky_seconds=5, clock=clock)
+    primary_maker = async_sessionmaker(
+        primary, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def override_get_db():
+        async with primary_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_replica_pool] = lambda: replicas
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac, clock
+
+    app.dependency_overrides.clear()
+    await replicas.dispose()
+    await primary.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_routed_to_replica_with_read_your_writes(replicated_client):
+    """Тест: чтения идут на реплику, кроме клиента, только что выполнившего запись"""
+    client, clock = replicated_client
+    writer = {"X-Client-Id": "writer"}
+
+    response = await client.post(
+        "/api/v1/owners/",
+        json={"name": "Иванов", "address": "Москва", "phone": "+7"},
+        headers=writer,
+    )
+    assert response.status_code == 201
+    owner_id = response.json()["id"]
+
+    # Автор записи видит ее сразу — чтение с основной БД
+    response = await client.get(f"/api/v1/owners/{owner_id}", headers=writer)
+    assert response.status_code == 200
+
+    # Другой клиент читает с реплики, куда запись еще не дошла
+    response = await client.get(
+        f"/api/v1/owners/{owner_id}", headers={"X-Client-Id": "reader"}
+    )
+    assert response.status_code == 404
+
+    # Окно read-your-writes истекло — автор тоже читает с реплики
+    clock.now += 5
+    response = await client.get(f"/api/v1/owners/{owner_id}", headers=writer)
+    assert response.status_code == 404
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.business.dto.horse_dto import HorseCreateDTO
+from src.business.dto.jockey_dto import JockeyCreateDTO
+from src.business.dto.owner_dto import OwnerCreateDTO
+from src.business.operations.horse_operations import create_horse
+from src.business.operations.jockey_operations import create_jockey
+from src.business.operations.owner_operations import create_owner
+from src.business.operations.search_operations import search
+from src.data.uow import UnitOfWork
+
+
+async def seed(uow: UnitOfWork):
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Орлова Мария", address="Москва", phone="+7")
+    )
+    await create_horse(
+        uow,
+        HorseCreateDTO(nickname="Орлик", gender="мерин", age=5, owner_id=owner.id),
+    )
+    await create_horse(
+        uow,
+        HorseCreateDTO(
+            nickname="Быстрый Орёл", gender="жеребец", age=4, owner_id=owner.id
+        ),
+    )
+    await create_jockey(
+        uow, JockeyCreateDTO(name="Петр Орлов", address="Казань", age=30, rating=7)
+    )
+    return owner
+
+
+@pytest.mark.asyncio
+async def test_search_prefix_across_kinds(async_session: AsyncSession):
+    """Тест: префикс слова находит лошадей, жокеев и владельцев"""
+    uow = UnitOfWork(async_session)
+    await seed(uow)
+
+    results = await search(uow, "орл")
+
+    found = {(r.kind, r.title) for r in results}
+    assert found == {
+        ("horse", "Орлик"),
+        ("jockey", "Петр Орлов"),
+        ("owner", "Орлова Мария"),
+    }
+    assert [r.score for r in results] == sorted(
+        (r.score for r in results), reverse=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_all_words_required(async_session: AsyncSession):
+    """Тест: все слова запроса должны совпасть, регистр не важен"""
+    uow = UnitOfWork(async_session)
+    await seed(uow)
+
+    results = await search(uow, "БЫСТ орё")
+
+    assert [(r.kind, r.title) for r in results] == [("horse", "Быстрый Орёл")]
+
+
+@pytest.mark.asyncio
+async def test_search_kinds_and_limit(async_session: AsyncSession):
+    """Тест: фильтр по типу сущности и ограничение числа результатов"""
+    uow = UnitOfWork(async_session)
+    await seed(uow)
+
+    horses = await search(uow, "о", kinds=["horse"])
+    assert {r.kind for r in horses} == {"horse"}
+    assert len(await search(uow, "орл", limit=1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates(async_session: AsyncSession):
+    """Тест: индекс поиска обновляется при переименовании и удалении"""
+    uow = UnitOfWork(async_session)
+    owner = await seed(uow)
+
+    async with uow:
+        await uow.owners.update(owner.id, {"name": "Соколова Мария"})
+        await uow.commit()
+    assert [r.id for r in await search(uow, "соко")] == [owner.id]
+    assert [r.title for r in await search(uow, "орлова")] == []
+
+
+@pytest.mark.asyncio
+async def test_search_invalid_query(async_session: AsyncSession):
+    """Тест: пустой запрос и неизвестный тип отклоняются"""
+    uow = UnitOfWork(async_session)
+
+    with pytest.raises(ValueError):
+        await search(uow, "   ")
+    with pytest.raises(ValueError):
+        await search(uow, "орл", kinds=["race"])
+    assert await search(uow, "%%") == []
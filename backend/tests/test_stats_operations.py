@@ -0,0 +1,103 @@
+from datetime import date, time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.business.dto.horse_dto import HorseCreateDTO
+from src.business.dto.jockey_dto import JockeyCreateDTO
+from src.business.dto.owner_dto import OwnerCreateDTO
+from src.business.dto.participant_dto import ParticipantCreateDTO
+from src.business.dto.race_dto import RaceCreateDTO
+from src.business.exceptions import HorseNotFoundError, JockeyNotFoundError
+from src.business.operations.horse_operations import create_horse
+from src.business.operations.jockey_operations import create_jockey
+from src.business.operations.owner_operations import create_owner
+from src.business.operations.participant_operations import add_participant_with_result
+from src.business.operations.race_operations import create_race
+from src.business.operations.stats_operations import get_horse_stats, get_jockey_stats
+from src.data.uow import UnitOfWork
+
+
+async def _create_season(uow: UnitOfWork):
+    """Жокей и лошадь с тремя стартами: 1-е, 4-е и 2-е места"""
+    owner = await create_owner(
+        uow, OwnerCreateDTO(name="Владелец", address="Москва", phone="+7-900")
+    )
+    jockey = await create_jockey(
+        uow, JockeyCreateDTO(name="Жокей", address="Москва", age=25, rating=5)
+    )
+    horse = await create_horse(
+        uow, HorseCreateDTO(nickname="Гром", gender="мерин", age=4, owner_id=owner.id)
+    )
+    results = [
+        (date(2030, 5, 1), 1, time(0, 2, 10)),
+        (date(2030, 6, 1), 4, None),
+        (date(2030, 7, 1), 2, time(0, 2, 5)),
+    ]
+    for race_date, place, time_result in results:
+        race = await create_race(
+            uow, RaceCreateDTO(date=race_date, time=time(12, 0), hippodrome="Ипподром")
+        )
+        await add_participant_with_result(
+            uow,
+            ParticipantCreateDTO(
+                race_id=race.id,
+                jockey_id=jockey.id,
+                horse_id=horse.id,
+                place=place,
+                time_result=time_result,
+            ),
+        )
+    return jockey, horse
+
+
+@pytest.mark.asyncio
+async def test_jockey_stats(async_session: AsyncSession):
+    """Тест агрегированной статистики жокея"""
+    uow = UnitOfWork(async_session)
+    jockey, _ = await _create_season(uow)
+
+    stats = await get_jockey_stats(uow, jockey.id)
+
+    assert stats.starts == 3
+    assert stats.wins == 1
+    assert stats.podiums == 2
+    assert stats.podium_rate == pytest.approx(2 / 3)
+    assert stats.mean_place == pytest.approx(7 / 3)
+    assert stats.best_time == time(0, 2, 5)
+
+
+@pytest.mark.asyncio
+async def test_horse_stats_date_range(async_session: AsyncSession):
+    """Тест статистики лошади за период"""
+    uow = UnitOfWork(async_session)
+    _, horse = await _create_season(uow)
+
+    stats = await get_horse_stats(
+        uow, horse.id, date_from=date(2030, 5, 15), date_to=date(2030, 6, 30)
+    )
+
+    assert stats.starts == 1
+    assert stats.wins == 0
+    assert stats.mean_place == 4
+    assert stats.best_time is None
+
+    empty = await get_horse_stats(uow, horse.id, date_from=date(2031, 1, 1))
+    assert empty.starts == 0
+    assert empty.mean_place is None
+
+
+@pytest.mark.asyncio
+async def test_stats_errors(async_session: AsyncSession):
+    """Тест ошибок: нет сущности, некорректный период"""
+    uow = UnitOfWork(async_session)
+
+    with pytest.raises(JockeyNotFoundError):
+        await get_jockey_stats(uow, 999)
+
+    with pytest.raises(HorseNotFoundError):
+        await get_horse_stats(uow, 999)
+
+    with pytest.raises(ValueError, match="периода"):
+        await get_jockey_stats(
+            uow, 1, date_from=date(2030, 2, 1), date_to=date(2030, 1, 1)
+        )